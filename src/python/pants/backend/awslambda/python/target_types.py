@@ -82,6 +82,9 @@ class PythonAwsLambdaIncludeSources(BoolField):
         Whether to resolve first party sources and include them in the AWS Lambda artifact. This is
         most useful to allow creating a Lambda Layer with only third-party requirements.
         https://docs.aws.amazon.com/lambda/latest/dg/configuration-layers.html
+
+        Artifacts without sources are built once per unique set of third-party requirements, and
+        shared by all targets with that same set of requirements.
         """
     )
 
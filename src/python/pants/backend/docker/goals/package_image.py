@@ -23,9 +23,11 @@ from pants.backend.docker.target_types import (
     DockerBuildOptionFieldMultiValueMixin,
     DockerBuildOptionFieldValueMixin,
     DockerBuildOptionFlagFieldMixin,
+    DockerImageBuildImageCacheToField,
     DockerImageContextRootField,
     DockerImageRegistriesField,
     DockerImageRepositoryField,
+    DockerImageSkipPushField,
     DockerImageSourceField,
     DockerImageTags,
     DockerImageTagsField,
@@ -316,6 +318,7 @@ def get_build_options(
     global_build_no_cache_option: bool | None,
     use_buildx_option: bool,
     target: Target,
+    upstream_cache_hints: bool = False,
 ) -> Iterator[str]:
     # Build options from target fields inheriting from DockerBuildOptionFieldMixin
     for field_type in target.field_types:
@@ -374,6 +377,52 @@ def get_build_options(
     if global_build_no_cache_option:
         yield "--no-cache"
 
+    if upstream_cache_hints and use_buildx_option:
+        # Embed the build cache in the image, so that images built `FROM` it can import it.
+        if not target.get(DockerImageBuildImageCacheToField).value:
+            yield "--cache-to=type=inline"
+        for cache_source in context.upstream_cache_sources:
+            yield f"--cache-from={cache_source}"
+
+
+def get_cache_sources(
+    context: DockerBuildContext,
+    image_refs: tuple[ImageRefRegistry, ...],
+    target: Target,
+) -> tuple[str, ...]:
+    """The `--cache-from` sources through which images built `FROM` this image may import its
+    build cache.
+
+    A cache exported with the `cache_to` field is only reachable from other builds when it is
+    exported to a registry or a local directory. Otherwise the cache is inlined in the image, which
+    other builds can only import from a registry the image is pushed to.
+    """
+    cache_to = target.get(DockerImageBuildImageCacheToField)
+    if cache_to.value:
+        format = partial(
+            context.interpolation_context.format,
+            source=InterpolationContext.TextSource(
+                address=target.address, target_alias=target.alias, field_alias=cache_to.alias
+            ),
+            error_cls=DockerImageOptionValueError,
+        )
+        cache_type = cache_to.value.get("type")
+        if cache_type == "registry" and "ref" in cache_to.value:
+            return (f"type=registry,ref={format(cache_to.value['ref'])}",)
+        if cache_type == "local" and "dest" in cache_to.value:
+            return (f"type=local,src={format(cache_to.value['dest'])}",)
+        return ()
+
+    if target.get(DockerImageSkipPushField).value:
+        return ()
+    return tuple(
+        f"type=registry,ref={tag.full_name}"
+        for image_ref in image_refs
+        if image_ref.registry and not image_ref.registry.skip_push
+        for tag in image_ref.tags
+        if not tag.uses_local_alias
+    )[:1]
+
 
 @rule
 async def build_docker_image(
@@ -442,6 +491,7 @@ async def build_docker_image(
         env=env,
         tags=tags,
         use_buildx=options.use_buildx,
+        named_contexts=context.named_contexts,
         extra_args=tuple(
             get_build_options(
                 context=context,
@@ -451,6 +501,7 @@ async def build_docker_image(
                 global_build_no_cache_option=options.build_no_cache,
                 use_buildx_option=options.use_buildx,
                 target=wrapped_target.target,
+                upstream_cache_hints=options.upstream_cache_hints,
             )
         ),
     )
@@ -496,7 +547,19 @@ async def build_docker_image(
 
     return BuiltPackage(
         digest,
-        (BuiltDockerImage.create(image_id, tags, metadata_filename),),
+        (
+            BuiltDockerImage.create(
+                image_id,
+                tags,
+                metadata_filename,
+                build_time_ms=result.metadata.total_elapsed_ms,
+                cache_sources=(
+                    get_cache_sources(context, image_refs, wrapped_target.target)
+                    if options.upstream_cache_hints and options.use_buildx
+                    else ()
+                ),
+            ),
+        ),
     )
 
 
@@ -13,6 +13,7 @@ from typing import Callable, ContextManager, cast
 import pytest
 
 from pants.backend.docker.goals.package_image import (
+    BuiltDockerImage,
     DockerBuildTargetStageError,
     DockerImageOptionValueError,
     DockerImageTagValueError,
@@ -108,7 +109,8 @@ def assert_build(
     version_tags: tuple[str, ...] = (),
     plugin_tags: tuple[str, ...] = (),
     expected_registries_metadata: None | list = None,
-) -> None:
+    upstream_cache_sources: tuple[str, ...] = (),
+) -> BuiltDockerImage:
     tgt = rule_runner.get_target(address)
     metadata_file_path: list[str] = []
     metadata_file_contents: list[bytes] = []
@@ -128,6 +130,7 @@ def assert_build(
             build_env=rule_runner.request(
                 DockerBuildEnvironment, [DockerBuildEnvironmentRequest(tgt)]
             ),
+            upstream_cache_sources=upstream_cache_sources,
         )
 
     def run_process_mock(process: Process) -> FallibleProcessResult:
@@ -173,6 +176,7 @@ def assert_build(
         opts.setdefault("build_verbose", False)
         opts.setdefault("build_no_cache", False)
         opts.setdefault("use_buildx", False)
+        opts.setdefault("upstream_cache_hints", False)
         opts.setdefault("env_vars", [])
 
         docker_options = create_subsystem(
@@ -242,6 +246,8 @@ def assert_build(
     for log_line in extra_log_lines:
         assert log_line in result.artifacts[0].extra_log_lines
 
+    return cast(BuiltDockerImage, result.artifacts[0])
+
 
 def test_build_docker_image(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
@@ -1172,6 +1178,92 @@ def test_docker_cache_from_option(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_docker_upstream_cache_hints_option(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "docker/test/BUILD": dedent(
+                """\
+                docker_image(name="local")
+                docker_image(name="pushed", registries=["registry.example"])
+                docker_image(name="skipped", registries=["registry.example"], skip_push=True)
+                docker_image(
+                  name="registry_cache",
+                  cache_to={"type": "registry", "ref": "registry.example/cache:latest"},
+                )
+                docker_image(
+                  name="local_cache",
+                  cache_to={"type": "local", "dest": "/tmp/docker/pants-test-cache"},
+                )
+                docker_image(name="downstream")
+                """
+            ),
+        }
+    )
+    options = dict(use_buildx=True, upstream_cache_hints=True)
+
+    def build(name: str) -> BuiltDockerImage:
+        return assert_build(
+            rule_runner, Address("docker/test", target_name=name), options=dict(options)
+        )
+
+    # The cache of an image which is neither pushed nor exported is only inlined in the local
+    # image, where other builds cannot import it from.
+    assert build("local").cache_sources == ()
+    assert build("skipped").cache_sources == ()
+    pushed = build("pushed")
+    assert pushed.cache_sources == ("type=registry,ref=registry.example/pushed:latest",)
+    assert build("registry_cache").cache_sources == (
+        "type=registry,ref=registry.example/cache:latest",
+    )
+    assert build("local_cache").cache_sources == ("type=local,src=/tmp/docker/pants-test-cache",)
+
+    def check_downstream_proc(process: Process):
+        assert process.argv == (
+            "/dummy/docker",
+            "buildx",
+            "build",
+            "--output=type=docker",
+            "--pull=False",
+            "--cache-to=type=inline",
+            "--cache-from=type=registry,ref=registry.example/pushed:latest",
+            "--tag",
+            "downstream:latest",
+            "--file",
+            "docker/test/Dockerfile",
+            ".",
+        )
+
+    assert_build(
+        rule_runner,
+        Address("docker/test", target_name="downstream"),
+        process_assertions=check_downstream_proc,
+        options=dict(options),
+        upstream_cache_sources=pushed.cache_sources,
+    )
+
+    def check_local_cache_proc(process: Process):
+        assert process.argv == (
+            "/dummy/docker",
+            "buildx",
+            "build",
+            "--cache-to=type=local,dest=/tmp/docker/pants-test-cache",
+            "--output=type=docker",
+            "--pull=False",
+            "--tag",
+            "local_cache:latest",
+            "--file",
+            "docker/test/Dockerfile",
+            ".",
+        )
+
+    assert_build(
+        rule_runner,
+        Address("docker/test", target_name="local_cache"),
+        process_assertions=check_local_cache_proc,
+        options=dict(options),
+    )
+
+
 def test_docker_output_option(rule_runner: RuleRunner) -> None:
     """Testing non-default output type 'image'.
 
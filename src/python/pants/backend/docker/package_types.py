@@ -16,18 +16,28 @@ class BuiltDockerImage(BuiltPackageArtifact):
     # will ensure that this field is properly populated in practice.
     image_id: str = ""
     tags: tuple[str, ...] = ()
+    # The `--cache-from` sources through which images built `FROM` this image may import its
+    # build cache.
+    cache_sources: tuple[str, ...] = ()
 
     @classmethod
     def create(
-        cls, image_id: str, tags: tuple[str, ...], metadata_filename: str
+        cls,
+        image_id: str,
+        tags: tuple[str, ...],
+        metadata_filename: str,
+        build_time_ms: int | None = None,
+        cache_sources: tuple[str, ...] = (),
     ) -> BuiltDockerImage:
         tags_string = tags[0] if len(tags) == 1 else f"\n{bullet_list(tags)}"
         return cls(
             image_id=image_id,
             tags=tags,
+            cache_sources=cache_sources,
             relpath=metadata_filename,
             extra_log_lines=(
                 f"Built docker {pluralize(len(tags), 'image', False)}: {tags_string}",
                 f"Docker image ID: {image_id}",
+                *((f"Docker build time: {build_time_ms / 1000:.1f}s",) if build_time_ms else ()),
             ),
         )
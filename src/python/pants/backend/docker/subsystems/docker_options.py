@@ -151,6 +151,46 @@ class DockerOptions(Subsystem):
             """
         ),
     )
+    upstream_cache_hints = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            Share the BuildKit build cache between `docker_image` targets and the images they are
+            built `FROM`.
+
+            Every image is built with an inline cache (`--cache-to=type=inline`), unless its
+            `cache_to` field is set. Images built `FROM` another `docker_image` target import the
+            cache of that upstream image (`--cache-from`) where another build can reach it: from
+            the `registry` or `local` cache set in the upstream's `cache_to` field, or else from
+            the first registry the upstream image is pushed to, which holds the cache of the
+            most recently published upstream image. The cache of an upstream image which is
+            neither pushed nor exported only exists in the local image store, so it is not
+            imported.
+
+            This option requires `use_buildx`.
+            """
+        ),
+    )
+    named_build_contexts = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            Pass the packaged dependencies of `docker_image` targets to the build as BuildKit
+            named contexts (`--build-context`) rather than copying them into the build context.
+
+            Each package is materialized once per version, and is referenced by every image
+            build which depends on it, so large shared artifacts are not copied into the build
+            context of each image. The named context for a package is its address, with
+            every run of characters other than lowercase letters, digits, `.`, `_` and `-`
+            replaced by `-`. For example, a `pex_binary` at `src/python/app:bin` is copied
+            with `COPY --from=src-python-app-bin src.python.app/bin.pex /bin/app`.
+
+            Docker image dependencies are not affected. This option requires `use_buildx`.
+            """
+        ),
+    )
 
     _build_args = ShellStrListOption(
         help=softwrap(
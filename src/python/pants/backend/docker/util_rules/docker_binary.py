@@ -71,6 +71,7 @@ class DockerBinary(BinaryPath):
         env: Mapping[str, str],
         use_buildx: bool,
         extra_args: tuple[str, ...] = (),
+        named_contexts: Mapping[str, Digest] | None = None,
     ) -> Process:
         if use_buildx:
             build_commands = ["buildx", "build"]
@@ -85,6 +86,14 @@ class DockerBinary(BinaryPath):
         for build_arg in build_args:
             args.extend(["--build-arg", build_arg])
 
+        # Named contexts are passed as immutable inputs, so that they are materialized once per
+        # digest rather than into every build's sandbox.
+        named_context_digests = {}
+        for name, named_context_digest in (named_contexts or {}).items():
+            path = f"__named_contexts/{name}"
+            named_context_digests[path] = named_context_digest
+            args.extend(["--build-context", f"{name}={path}"])
+
         args.extend(["--file", dockerfile])
 
         # Docker context root.
@@ -98,7 +107,11 @@ class DockerBinary(BinaryPath):
             ),
             env=self._get_process_environment(env),
             input_digest=digest,
-            immutable_input_digests=self.extra_input_digests,
+            immutable_input_digests=(
+                {**(self.extra_input_digests or {}), **named_context_digests}
+                if named_context_digests
+                else self.extra_input_digests
+            ),
             # We must run the docker build commands every time, even if nothing has changed,
             # in case the user ran `docker image rm` outside of Pants.
             cache_scope=ProcessCacheScope.PER_SESSION,
@@ -86,6 +86,43 @@ def test_docker_binary_build_image(docker_path: str, docker: DockerBinary) -> No
     assert build_request.description == "Building docker image test:0.1.0 +1 additional tag."
 
 
+def test_docker_binary_build_image_with_named_contexts(
+    docker_path: str, docker: DockerBinary
+) -> None:
+    dockerfile = "src/test/repo/Dockerfile"
+    digest = Digest(sha256().hexdigest(), 123)
+    pkg_digest = Digest(sha256(b"pkg").hexdigest(), 456)
+    build_request = docker.build_image(
+        tags=("test:latest",),
+        digest=digest,
+        dockerfile=dockerfile,
+        build_args=DockerBuildArgs(),
+        context_root="build/context",
+        env={},
+        use_buildx=True,
+        named_contexts={"src-python-app-bin": pkg_digest},
+    )
+
+    assert build_request == Process(
+        argv=(
+            docker_path,
+            "buildx",
+            "build",
+            "--tag",
+            "test:latest",
+            "--build-context",
+            "src-python-app-bin=__named_contexts/src-python-app-bin",
+            "--file",
+            dockerfile,
+            "build/context",
+        ),
+        input_digest=digest,
+        immutable_input_digests={"__named_contexts/src-python-app-bin": pkg_digest},
+        cache_scope=ProcessCacheScope.PER_SESSION,
+        description="",  # The description field is marked `compare=False`
+    )
+
+
 def test_docker_binary_push_image(docker_path: str, docker: DockerBinary) -> None:
     image_ref = "registry/repo/name:tag"
     push_request = docker.push_image(image_ref)
@@ -6,10 +6,11 @@ from __future__ import annotations
 import logging
 import re
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Iterable, Mapping
 
 from pants.backend.docker.package_types import BuiltDockerImage
+from pants.backend.docker.subsystems.docker_options import DockerOptions
 from pants.backend.docker.subsystems.dockerfile_parser import DockerfileInfo, DockerfileInfoRequest
 from pants.backend.docker.target_types import DockerImageSourceField
 from pants.backend.docker.util_rules.docker_build_args import (
@@ -43,6 +44,7 @@ from pants.engine.target import (
     TransitiveTargetsRequest,
 )
 from pants.engine.unions import UnionRule
+from pants.util.frozendict import FrozenDict
 from pants.util.meta import classproperty
 from pants.util.strutil import softwrap, stable_hash
 from pants.util.value_interpolation import InterpolationContext, InterpolationValue
@@ -105,6 +107,11 @@ class DockerBuildContext:
     interpolation_context: InterpolationContext
     copy_source_vs_context_source: tuple[tuple[str, str], ...]
     stages: tuple[str, ...]
+    # Packaged dependencies to pass as BuildKit named contexts, rather than in `digest`.
+    named_contexts: FrozenDict[str, Digest] = field(default_factory=FrozenDict)
+    # The `--cache-from` sources of the build caches of the upstream images which this image is
+    # built `FROM`.
+    upstream_cache_sources: tuple[str, ...] = ()
 
     @classmethod
     def create(
@@ -114,6 +121,8 @@ class DockerBuildContext:
         build_env: DockerBuildEnvironment,
         upstream_image_ids: Iterable[str],
         dockerfile_info: DockerfileInfo,
+        named_contexts: Mapping[str, Digest] | None = None,
+        upstream_cache_sources: Iterable[str] = (),
     ) -> DockerBuildContext:
         interpolation_context: dict[str, dict[str, str] | InterpolationValue] = {}
 
@@ -128,9 +137,12 @@ class DockerBuildContext:
         )
 
         # Data from Pants.
+        hash_inputs: tuple = (build_args, build_env, snapshot.digest)
+        if named_contexts:
+            hash_inputs += (sorted(named_contexts.items()),)
         interpolation_context["pants"] = {
             # Present hash for all inputs that can be used for image tagging.
-            "hash": stable_hash((build_args, build_env, snapshot.digest)),
+            "hash": stable_hash(hash_inputs),
         }
 
         # Base image tags values for all stages (as parsed from the Dockerfile instructions).
@@ -158,6 +170,8 @@ class DockerBuildContext:
                 )
             ),
             stages=tuple(sorted(stage_names)),
+            named_contexts=FrozenDict(named_contexts or {}),
+            upstream_cache_sources=tuple(upstream_cache_sources),
         )
 
     @classproperty
@@ -254,8 +268,18 @@ class DockerBuildContext:
             ) from e
 
 
+_NOT_NAMED_CONTEXT_CHARACTERS = re.compile(r"[^a-z0-9._-]+")
+
+
+def named_build_context_name(address: Address) -> str:
+    """The BuildKit named context to use for the package built from `address`."""
+    return _NOT_NAMED_CONTEXT_CHARACTERS.sub("-", address.spec.lower()).strip("-._")
+
+
 @rule
-async def create_docker_build_context(request: DockerBuildContextRequest) -> DockerBuildContext:
+async def create_docker_build_context(
+    request: DockerBuildContextRequest, options: DockerOptions
+) -> DockerBuildContext:
     # Get all targets to include in context.
     transitive_targets = await Get(TransitiveTargets, TransitiveTargetsRequest([request.address]))
     docker_image = transitive_targets.roots[0]
@@ -289,14 +313,18 @@ async def create_docker_build_context(request: DockerBuildContextRequest) -> Doc
     )
 
     # Package binary dependencies for build context.
-    embedded_pkgs = await MultiGet(
-        Get(BuiltPackage, EnvironmentAwarePackageRequest(field_set))
+    embedded_pkg_field_sets = [
+        field_set
         for field_set in embedded_pkgs_per_target.field_sets
         # Exclude docker images, unless build_upstream_images is true.
         if (
             request.build_upstream_images
             or not isinstance(getattr(field_set, "source", None), DockerImageSourceField)
         )
+    ]
+    embedded_pkgs = await MultiGet(
+        Get(BuiltPackage, EnvironmentAwarePackageRequest(field_set))
+        for field_set in embedded_pkg_field_sets
     )
 
     if request.build_upstream_images:
@@ -314,7 +342,29 @@ async def create_docker_build_context(request: DockerBuildContextRequest) -> Doc
     else:
         logger.debug("Did not build any packages for Docker image")
 
-    embedded_pkgs_digest = [built_package.digest for built_package in embedded_pkgs]
+    # Each package is kept as its own digest, either merged into the context or passed by
+    # reference as a named context.
+    named_contexts: dict[str, Digest] = {}
+    named_context_addresses: dict[str, Address] = {}
+    embedded_pkgs_digest = []
+    for field_set, built_package in zip(embedded_pkg_field_sets, embedded_pkgs):
+        if (
+            options.use_buildx
+            and options.named_build_contexts
+            and not any(isinstance(a, BuiltDockerImage) for a in built_package.artifacts)
+        ):
+            name = named_build_context_name(field_set.address)
+            if name in named_context_addresses:
+                raise DockerBuildContextError(
+                    f"The packages {named_context_addresses[name]} and {field_set.address} would "
+                    f"both be passed to the build of {docker_image.address} as the named build "
+                    f"context {name!r}. Rename one of the targets, or set "
+                    "`[docker].named_build_contexts = false`."
+                )
+            named_context_addresses[name] = field_set.address
+            named_contexts[name] = built_package.digest
+        else:
+            embedded_pkgs_digest.append(built_package.digest)
     all_digests = (dockerfile_info.digest, sources.snapshot.digest, *embedded_pkgs_digest)
 
     # Merge all digests to get the final docker build context digest.
@@ -328,6 +378,7 @@ async def create_docker_build_context(request: DockerBuildContextRequest) -> Doc
     )
 
     upstream_image_ids = []
+    upstream_cache_sources: list[str] = []
     if request.build_upstream_images:
         # Update build arg values for FROM image build args.
 
@@ -352,10 +403,10 @@ async def create_docker_build_context(request: DockerBuildContextRequest) -> Doc
                 skip_invalid_addresses=True,
             ),
         )
-        # Map those addresses to the corresponding built image ref (tag).
-        address_to_built_image_tag = {
-            field_set.address: image.tags[0]
-            for field_set, built in zip(embedded_pkgs_per_target.field_sets, embedded_pkgs)
+        # Map those addresses to the corresponding built image.
+        address_to_built_image = {
+            field_set.address: image
+            for field_set, built in zip(embedded_pkg_field_sets, embedded_pkgs)
             for image in built.artifacts
             if isinstance(image, BuiltDockerImage)
         }
@@ -367,9 +418,14 @@ async def create_docker_build_context(request: DockerBuildContextRequest) -> Doc
         ]
         # Create the FROM image build args.
         from_image_build_args = [
-            f"{arg_name}={address_to_built_image_tag[addr]}"
+            f"{arg_name}={address_to_built_image[addr].tags[0]}"
             for arg_name, addr in zip(dockerfile_build_args.keys(), from_image_addresses)
         ]
+        upstream_cache_sources = [
+            cache_source
+            for addr in from_image_addresses
+            for cache_source in address_to_built_image[addr].cache_sources
+        ]
         # Merge all build args.
         build_args = DockerBuildArgs.from_strings(*build_args, *from_image_build_args)
 
@@ -379,6 +435,8 @@ async def create_docker_build_context(request: DockerBuildContextRequest) -> Doc
         upstream_image_ids=upstream_image_ids,
         dockerfile_info=dockerfile_info,
         build_env=build_env,
+        named_contexts=named_contexts,
+        upstream_cache_sources=upstream_cache_sources,
     )
 
 
@@ -386,6 +386,61 @@ def test_packaged_pex_path(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_packaged_pex_named_build_context(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/docker/BUILD": """docker_image(dependencies=["src/python/proj/cli:bin"])""",
+            "src/docker/Dockerfile": """FROM python:3.8""",
+            "src/python/proj/cli/BUILD": """pex_binary(name="bin", entry_point="main.py")""",
+            "src/python/proj/cli/main.py": """print("cli main")""",
+        }
+    )
+
+    context = assert_build_context(
+        rule_runner,
+        Address("src/docker", target_name="docker"),
+        pants_args=["--docker-use-buildx", "--docker-named-build-contexts"],
+        expected_files=["src/docker/Dockerfile"],
+    )
+    assert list(context.named_contexts) == ["src-python-proj-cli-bin"]
+    snapshot = rule_runner.request(Snapshot, [context.named_contexts["src-python-proj-cli-bin"]])
+    assert snapshot.files == ("src.python.proj.cli/bin.pex",)
+
+
+def test_packaged_pex_named_build_context_collision(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/docker/BUILD": dedent(
+                """\
+                docker_image(
+                    dependencies=["src/python/proj/cli:bin", "src/python/proj/cli/bin"],
+                )
+                """
+            ),
+            "src/docker/Dockerfile": """FROM python:3.8""",
+            "src/python/proj/cli/BUILD": """pex_binary(name="bin", entry_point="main.py")""",
+            "src/python/proj/cli/main.py": """print("cli main")""",
+            "src/python/proj/cli/bin/BUILD": """pex_binary(entry_point="main.py")""",
+            "src/python/proj/cli/bin/main.py": """print("bin main")""",
+        }
+    )
+
+    with pytest.raises(
+        ExecutionError,
+        match=(
+            r"The packages src/python/proj/cli:bin and src/python/proj/cli/bin would both be "
+            r"passed to the build of src/docker:docker as the named build context "
+            r"'src-python-proj-cli-bin'\."
+        ),
+    ):
+        assert_build_context(
+            rule_runner,
+            Address("src/docker", target_name="docker"),
+            pants_args=["--docker-use-buildx", "--docker-named-build-contexts"],
+            expected_files=["src/docker/Dockerfile"],
+        )
+
+
 def test_packaged_pex_environment(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
@@ -1,16 +1,26 @@
 # Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+from __future__ import annotations
+
+from collections import defaultdict
 from dataclasses import dataclass
+from typing import Hashable, Mapping
 
+from pants.backend.go.subsystems.golang import GolangSubsystem
 from pants.backend.go.target_types import GoPackageSourcesField
 from pants.backend.go.util_rules.build_opts import GoBuildOptions, GoBuildOptionsFromTargetRequest
 from pants.backend.go.util_rules.build_pkg import (
+    BuildGoPackageBatchRequest,
     BuildGoPackageRequest,
     FallibleBuildGoPackageRequest,
     FallibleBuiltGoPackage,
+    FallibleBuiltGoPackageBatch,
+    can_compile_in_batch,
 )
 from pants.backend.go.util_rules.build_pkg_target import BuildGoPackageTargetRequest
+from pants.backend.go.util_rules.go_mod import OwningGoMod, OwningGoModRequest
+from pants.build_graph.address import Address
 from pants.core.goals.check import CheckRequest, CheckResult, CheckResults
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import FieldSet
@@ -28,8 +38,52 @@ class GoCheckRequest(CheckRequest):
     tool_name = "go-compile"
 
 
+def _partition_into_batches(
+    requests: Mapping[BuildGoPackageRequest, Hashable],
+) -> dict[Hashable, list[BuildGoPackageRequest]]:
+    """Partition the packages which can be compiled in batches by the given batch keys.
+
+    A package is excluded if a package outside of its batch depends on it, since that package would
+    otherwise compile it a second time.
+    """
+    batchable = {request for request in requests if can_compile_in_batch(request)}
+
+    dependents: dict[BuildGoPackageRequest, set[BuildGoPackageRequest]] = defaultdict(set)
+    visited: set[BuildGoPackageRequest] = set()
+    queue = list(requests)
+    while queue:
+        pkg = queue.pop()
+        if pkg in visited:
+            continue
+        visited.add(pkg)
+        for dep in pkg.direct_dependencies:
+            dependents[dep].add(pkg)
+            queue.append(dep)
+
+    def in_same_batch(pkg: BuildGoPackageRequest, dependent: BuildGoPackageRequest) -> bool:
+        return dependent in batchable and requests[dependent] == requests[pkg]
+
+    excluded = [
+        pkg
+        for pkg in batchable
+        if not all(in_same_batch(pkg, dependent) for dependent in dependents[pkg])
+    ]
+    while excluded:
+        pkg = excluded.pop()
+        if pkg not in batchable:
+            continue
+        batchable.remove(pkg)
+        excluded.extend(dep for dep in pkg.direct_dependencies if dep in batchable)
+
+    batches: dict[Hashable, list[BuildGoPackageRequest]] = defaultdict(list)
+    for request, key in requests.items():
+        if request in batchable:
+            batches[key].append(request)
+    return batches
+
+
 @rule(desc="Check Go compilation", level=LogLevel.DEBUG)
-async def check_go(request: GoCheckRequest) -> CheckResults:
+async def check_go(request: GoCheckRequest, golang: GolangSubsystem) -> CheckResults:
     build_opts_for_field_sets = await MultiGet(
         Get(GoBuildOptions, GoBuildOptionsFromTargetRequest(field_set.address))
         for field_set in request.field_sets
@@ -43,26 +97,59 @@ async def check_go(request: GoCheckRequest) -> CheckResults:
     )
     invalid_requests = []
     valid_requests = []
-    for fallible_request in build_requests:
+    valid_addresses: list[Address] = []
+    for field_set, fallible_request in zip(request.field_sets, build_requests):
         if fallible_request.request is None:
             invalid_requests.append(fallible_request)
         else:
             valid_requests.append(fallible_request.request)
+            valid_addresses.append(field_set.address)
 
-    build_results = await MultiGet(
-        Get(FallibleBuiltGoPackage, BuildGoPackageRequest, request) for request in valid_requests
+    # If enabled, compile the packages which allow it in batches per `go_mod`, and the rest on their own.
+    batches: dict[Hashable, list[BuildGoPackageRequest]] = {}
+    if golang.compile_batch_size > 0:
+        owning_go_mods = await MultiGet(
+            Get(OwningGoMod, OwningGoModRequest(address)) for address in valid_addresses
+        )
+        batches = _partition_into_batches(
+            {
+                build_request: (owning_go_mod.address, build_request.build_opts)
+                for build_request, owning_go_mod in zip(valid_requests, owning_go_mods)
+            }
+        )
+    batched_requests = {build_request for batch in batches.values() for build_request in batch}
+
+    build_results, batch_results = await MultiGet(
+        MultiGet(
+            Get(FallibleBuiltGoPackage, BuildGoPackageRequest, build_request)
+            for build_request in valid_requests
+            if build_request not in batched_requests
+        ),
+        MultiGet(
+            Get(FallibleBuiltGoPackageBatch, BuildGoPackageBatchRequest(tuple(batch)))
+            for batch in batches.values()
+        ),
     )
+    batched_results = [result for batch in batch_results for result in batch.results]
 
-    # NB: We don't pass stdout/stderr as it will have already been rendered as streaming.
+    # NB: We don't pass stdout/stderr for packages compiled on their own as it will have already
+    # been rendered as streaming. Batched packages are not streamed, so render their failures here.
     exit_code = next(
         (
             result.exit_code  # type: ignore[attr-defined]
-            for result in (*build_results, *invalid_requests)
+            for result in (*build_results, *batched_results, *invalid_requests)
             if result.exit_code != 0  # type: ignore[attr-defined]
         ),
         0,
     )
-    return CheckResults([CheckResult(exit_code, "", "")], checker_name=request.tool_name)
+    batched_failures = "\n".join(
+        result.message()
+        for result in batched_results
+        if result.exit_code != 0 and not result.dependency_failed
+    )
+    return CheckResults(
+        [CheckResult(exit_code, batched_failures, "")], checker_name=request.tool_name
+    )
 
 
 def rules():
@@ -9,7 +9,7 @@ import pytest
 
 from pants.backend.go import target_type_rules
 from pants.backend.go.goals import check
-from pants.backend.go.goals.check import GoCheckFieldSet, GoCheckRequest
+from pants.backend.go.goals.check import GoCheckFieldSet, GoCheckRequest, _partition_into_batches
 from pants.backend.go.target_types import GoModTarget, GoPackageTarget
 from pants.backend.go.util_rules import (
     assembly,
@@ -22,8 +22,11 @@ from pants.backend.go.util_rules import (
     sdk,
     third_party_pkg,
 )
+from pants.backend.go.util_rules.build_opts import GoBuildOptions
+from pants.backend.go.util_rules.build_pkg import BuildGoPackageRequest
 from pants.core.goals.check import CheckResult, CheckResults
 from pants.engine.addresses import Address
+from pants.engine.fs import EMPTY_DIGEST
 from pants.testutil.rule_runner import QueryRule, RuleRunner
 
 
@@ -81,3 +84,114 @@ def test_check(rule_runner: RuleRunner) -> None:
         CheckResults, [GoCheckRequest(GoCheckFieldSet.create(tgt) for tgt in targets)]
     ).results
     assert set(results) == {CheckResult(1, "", "")}
+
+
+def test_check_in_batches(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(["--golang-compile-batch-size=2"], env_inherit={"PATH"})
+    rule_runner.write_files(
+        {
+            "go.mod": dedent(
+                """\
+                module example.com/greeter
+                go 1.17
+                """
+            ),
+            "BUILD": "go_mod(name='mod')",
+            "base/f.go": dedent(
+                """\
+                package base
+
+                func Greeting() string {
+                    return "Hello world!"
+                }
+                """
+            ),
+            "base/BUILD": "go_package()",
+            "good/f.go": dedent(
+                """\
+                package good
+
+                import (
+                    "fmt"
+
+                    "example.com/greeter/base"
+                )
+
+                func Hello() {
+                    fmt.Println(base.Greeting())
+                }
+                """
+            ),
+            "good/BUILD": "go_package()",
+            "broken/f.go": dedent(
+                """\
+                package broken
+
+                import "example.com/greeter/base"
+
+                func Hello() int {
+                    return base.Greeting()
+                }
+                """
+            ),
+            "broken/BUILD": "go_package()",
+            "uses_broken/f.go": dedent(
+                """\
+                package uses_broken
+
+                import "example.com/greeter/broken"
+
+                func Hello() int {
+                    return broken.Hello()
+                }
+                """
+            ),
+            "uses_broken/BUILD": "go_package()",
+        }
+    )
+
+    def check(*dirs: str) -> CheckResult:
+        targets = [rule_runner.get_target(Address(d)) for d in dirs]
+        results = rule_runner.request(
+            CheckResults, [GoCheckRequest(GoCheckFieldSet.create(tgt) for tgt in targets)]
+        ).results
+        assert len(results) == 1
+        return results[0]
+
+    assert check("base", "good") == CheckResult(0, "", "")
+
+    result = check("base", "good", "broken", "uses_broken")
+    assert result.exit_code != 0
+    assert "example.com/greeter/broken failed" in result.stdout
+    assert "uses_broken" not in result.stdout
+
+
+def test_partition_into_batches() -> None:
+    def pkg(
+        import_path: str, *deps: BuildGoPackageRequest, cgo: bool = False
+    ) -> BuildGoPackageRequest:
+        return BuildGoPackageRequest(
+            import_path=import_path,
+            pkg_name=import_path,
+            digest=EMPTY_DIGEST,
+            dir_path=import_path,
+            build_opts=GoBuildOptions(),
+            go_files=("f.go",),
+            s_files=(),
+            direct_dependencies=deps,
+            minimum_go_version=None,
+            cgo_files=("cgo.go",) if cgo else (),
+        )
+
+    # `a` is depended on by the cgo package `c`, and `b` by the package `d` of another batch, so
+    # both are compiled on their own.
+    a = pkg("a")
+    b = pkg("b", a)
+    c = pkg("c", a, cgo=True)
+    d = pkg("d", b)
+    e = pkg("e", b)
+    assert _partition_into_batches({a: 1, b: 1, c: 1, d: 2, e: 1}) == {1: [e], 2: [d]}
+
+    f = pkg("f")
+    g = pkg("g", f)
+    assert _partition_into_batches({f: 1, g: 1}) == {1: [f, g]}
@@ -130,6 +130,8 @@ class PrepareGoTestBinaryCoverageConfig:
 class PrepareGoTestBinaryRequest:
     field_set: GoTestFieldSet
     coverage: PrepareGoTestBinaryCoverageConfig | None
+    # Omit debug information from the test binary, which speeds up linking it.
+    omit_debug_info: bool = False
 
 
 @dataclass(frozen=True)
@@ -345,7 +347,7 @@ async def prepare_go_test_binary(
                     FallibleBuildGoPackageRequest,
                     BuildGoPackageRequestForStdlibRequest(
                         import_path=dep_import_path,
-                        build_opts=build_opts,
+                        build_opts=build_opts.for_dependencies(),
                     ),
                 )
             )
@@ -379,7 +381,7 @@ async def prepare_go_test_binary(
             FallibleBuildGoPackageRequest,
             BuildGoPackageTargetRequest(
                 address=address,
-                build_opts=build_opts,
+                build_opts=build_opts.for_dependencies(),
             ),
         )
         for address in sorted(inferred_dependencies)
@@ -506,6 +508,7 @@ async def prepare_go_test_binary(
             import_paths_to_pkg_a_files=built_main_pkg.import_paths_to_pkg_a_files,
             output_filename="./test_runner",  # TODO: Name test binary the way that `go` does?
             description=f"Link Go test binary for {request.field_set.address}",
+            omit_debug_info=request.omit_debug_info,
         ),
     )
 
@@ -570,9 +573,21 @@ async def run_go_tests(
             coverage_packages=go_test_subsystem.coverage_packages,
         )
 
+    # As `go test` does, omit debug information from the test binary unless it will be kept, since
+    # it is needed by profiling tools.
+    output_test_binary = (
+        go_test_subsystem.output_test_binary
+        or go_test_subsystem.block_profile
+        or go_test_subsystem.cpu_profile
+        or go_test_subsystem.mem_profile
+        or go_test_subsystem.mutex_profile
+    )
+
     fallible_test_binary = await Get(
         FalliblePrepareGoTestBinaryResult,
-        PrepareGoTestBinaryRequest(field_set=field_set, coverage=coverage),
+        PrepareGoTestBinaryRequest(
+            field_set=field_set, coverage=coverage, omit_debug_info=not output_test_binary
+        ),
     )
 
     if fallible_test_binary.exit_code != 0:
@@ -640,7 +655,6 @@ async def run_go_tests(
 
     output_files = []
     maybe_profile_args = []
-    output_test_binary = go_test_subsystem.output_test_binary
 
     if test_subsystem.use_coverage:
         maybe_profile_args.append("-test.coverprofile=cover.out")
@@ -649,22 +663,18 @@ async def run_go_tests(
     if go_test_subsystem.block_profile:
         maybe_profile_args.append("-test.blockprofile=block.out")
         output_files.append("block.out")
-        output_test_binary = True
 
     if go_test_subsystem.cpu_profile:
         maybe_profile_args.append("-test.cpuprofile=cpu.out")
         output_files.append("cpu.out")
-        output_test_binary = True
 
     if go_test_subsystem.mem_profile:
         maybe_profile_args.append("-test.memprofile=mem.out")
         output_files.append("mem.out")
-        output_test_binary = True
 
     if go_test_subsystem.mutex_profile:
         maybe_profile_args.append("-test.mutexprofile=mutex.out")
         output_files.append("mutex.out")
-        output_test_binary = True
 
     if go_test_subsystem.trace:
         maybe_profile_args.append("-test.trace=trace.out")
@@ -7,7 +7,7 @@ import logging
 import os
 
 from pants.core.util_rules.asdf import AsdfPathString
-from pants.option.option_types import BoolOption, StrListOption, StrOption
+from pants.option.option_types import BoolOption, IntOption, StrListOption, StrOption
 from pants.option.subsystem import Subsystem
 from pants.util.memo import memoized_property
 from pants.util.ordered_set import OrderedSet
@@ -243,6 +243,42 @@ class GolangSubsystem(Subsystem):
         ),
     )
 
+    build_cache = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, compiled Go packages are additionally stored in a persistent, append-only
+            build cache (in the `go_build_cache` named cache), and reused from it by any later
+            compile of the same package with the same inputs, compiler and flags.
+
+            The cache uses the on-disk layout of the `go` tool's `GOCACHE`, keyed by an action
+            ID which extends the one Pants computes for each compile with a hash of the
+            compile's inputs. Entries written by Pants will not match the action IDs computed
+            by `go build` itself, so they are not shared with builds run outside of Pants.
+            """
+        ),
+        advanced=True,
+    )
+
+    compile_batch_size = IntOption(
+        default=0,
+        help=softwrap(
+            """
+            If greater than zero, the `check` goal compiles the first-party packages of each
+            `go_mod` target in batches of up to this many packages per process, rather than with
+            one process per package.
+
+            Only packages consisting solely of Go sources (without Cgo, assembly or prebuilt
+            object files) are batched. Each package's archive is still emitted as its own output,
+            but since a batch runs as a single process, a change to any package in a batch
+            recompiles every package in that batch. The packages within a batch are compiled
+            serially, one after another, while batches that do not depend on one another are
+            compiled concurrently.
+            """
+        ),
+        advanced=True,
+    )
+
     asdf_tool_name = StrOption(
         default="go-sdk",
         help=softwrap(
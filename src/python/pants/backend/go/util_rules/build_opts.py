@@ -2,6 +2,7 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 from __future__ import annotations
 
+import dataclasses
 import logging
 from dataclasses import dataclass
 from typing import Iterable
@@ -73,6 +74,17 @@ class GoBuildOptions:
         assert not (self.with_race_detector and self.with_asan)
         assert not (self.with_msan and self.with_asan)
 
+    def for_dependencies(self) -> GoBuildOptions:
+        """The options with which to build the dependencies of a package built with these options.
+
+        If no import path patterns select packages for code coverage, then only the packages which
+        force it (i.e., the packages under test) are instrumented. Their dependencies are built
+        without the coverage configuration, so that they are shared with builds not using coverage.
+        """
+        if self.coverage_config and not self.coverage_config.import_path_include_patterns:
+            return dataclasses.replace(self, coverage_config=None)
+        return self
+
 
 @dataclass(frozen=True)
 class GoBuildOptionsFromTargetRequest(EngineAwareParameter):
@@ -37,6 +37,7 @@ from pants.backend.go.util_rules.build_opts import (
 )
 from pants.backend.go.util_rules.build_pkg import BuildGoPackageRequest
 from pants.backend.go.util_rules.build_pkg_target import BuildGoPackageTargetRequest
+from pants.backend.go.util_rules.coverage import GoCoverageConfig, GoCoverMode
 from pants.backend.go.util_rules.goroot import GoRoot
 from pants.build_graph.address import Address
 from pants.core.goals.package import BuiltPackage
@@ -522,3 +523,19 @@ def test_assembler_flags_fields(rule_runner: RuleRunner) -> None:
         ],
     )
     assert build_request.pkg_specific_assembler_flags == ("-xyzzy",)
+
+
+def test_for_dependencies_drops_coverage_only_without_patterns() -> None:
+    opts = GoBuildOptions(
+        coverage_config=GoCoverageConfig(cover_mode=GoCoverMode.SET),
+        with_race_detector=True,
+    )
+    assert opts.for_dependencies() == GoBuildOptions(with_race_detector=True)
+
+    opts_with_patterns = GoBuildOptions(
+        coverage_config=GoCoverageConfig(
+            cover_mode=GoCoverMode.SET, import_path_include_patterns=("example.com/...",)
+        ),
+    )
+    assert opts_with_patterns.for_dependencies() == opts_with_patterns
+    assert GoBuildOptions().for_dependencies() == GoBuildOptions()
@@ -5,11 +5,13 @@ from __future__ import annotations
 import dataclasses
 import hashlib
 import os.path
+import shlex
 from collections import deque
 from dataclasses import dataclass
 from pathlib import PurePath
 from typing import Iterable, Mapping
 
+from pants.backend.go.subsystems.golang import GolangSubsystem
 from pants.backend.go.util_rules import cgo, coverage
 from pants.backend.go.util_rules.assembly import (
     AssembleGoAssemblyFilesRequest,
@@ -28,14 +30,21 @@ from pants.backend.go.util_rules.coverage import (
 from pants.backend.go.util_rules.embedcfg import EmbedConfig
 from pants.backend.go.util_rules.goroot import GoRoot
 from pants.backend.go.util_rules.import_config import ImportConfig, ImportConfigRequest
-from pants.backend.go.util_rules.sdk import GoSdkProcess, GoSdkToolIDRequest, GoSdkToolIDResult
+from pants.backend.go.util_rules.sdk import (
+    GoSdkProcess,
+    GoSdkRunSetup,
+    GoSdkToolIDRequest,
+    GoSdkToolIDResult,
+)
 from pants.base.glob_match_error_behavior import GlobMatchErrorBehavior
+from pants.core.util_rules.system_binaries import BashBinary
 from pants.engine.engine_aware import EngineAwareParameter, EngineAwareReturnType
 from pants.engine.fs import (
     EMPTY_DIGEST,
     AddPrefix,
     CreateDigest,
     Digest,
+    DigestContents,
     DigestEntries,
     DigestSubset,
     FileContent,
@@ -48,7 +57,7 @@ from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.resources import read_resource
-from pants.util.strutil import path_safe
+from pants.util.strutil import path_safe, pluralize
 
 
 class BuildGoPackageRequest(EngineAwareParameter):
@@ -496,6 +505,131 @@ async def _gather_transitive_prebuilt_object_files(
     return object_digest, frozenset(object_files)
 
 
+def _build_cache_action_id(action_id: str, input_digest: Digest, compile_args: list[str]) -> str:
+    """Extends a compile action ID with everything else which determines the compile's outputs.
+
+    The action ID computed by `compute_compile_action_id` omits the inputs of the compile (since
+    they are already part of the process cache key), but an entry in `[golang].build_cache` is
+    looked up only by its action ID.
+    """
+    h = hashlib.sha256()
+    h.update(f"{action_id}\n".encode())
+    h.update(f"inputs {input_digest.fingerprint} {input_digest.serialized_bytes_length}\n".encode())
+    for arg in compile_args:
+        h.update(f"arg {arg}\n".encode())
+    return h.hexdigest()
+
+
+def _go_compile_args(
+    request: BuildGoPackageRequest,
+    go_root: GoRoot,
+    *,
+    action_id: str,
+    output_path: str,
+    import_config_path: str,
+    embed_config_path: str | None,
+    symabis_path: str | None,
+    asm_header_path: str | None,
+    complete: bool,
+) -> list[str]:
+    """The arguments to `go tool compile` the given package, excluding its source files."""
+    compile_args = [
+        "tool",
+        "compile",
+        "-buildid",
+        action_id,
+        "-o",
+        output_path,
+        "-pack",
+        "-p",
+        request.import_path,
+        "-importcfg",
+        import_config_path,
+    ]
+
+    # See https://github.com/golang/go/blob/f229e7031a6efb2f23241b5da000c3b3203081d6/src/cmd/go/internal/work/gc.go#L79-L100
+    # for where this logic comes from.
+    go_version = request.minimum_go_version or "1.16"
+    if go_root.is_compatible_version(go_version):
+        compile_args.extend(["-lang", f"go{go_version}"])
+
+    if request.is_stdlib:
+        compile_args.append("-std")
+
+    compiling_runtime = request.is_stdlib and request.import_path in (
+        "internal/abi",
+        "internal/bytealg",
+        "internal/coverage/rtcov",
+        "internal/cpu",
+        "internal/goarch",
+        "internal/goos",
+        "runtime",
+        "runtime/internal/atomic",
+        "runtime/internal/math",
+        "runtime/internal/sys",
+        "runtime/internal/syscall",
+    )
+
+    # From Go sources:
+    # runtime compiles with a special gc flag to check for
+    # memory allocations that are invalid in the runtime package,
+    # and to implement some special compiler pragmas.
+    #
+    # See https://github.com/golang/go/blob/245e95dfabd77f337373bf2d6bb47cd353ad8d74/src/cmd/go/internal/work/gc.go#L107-L112
+    if compiling_runtime:
+        compile_args.append("-+")
+
+    if symabis_path:
+        compile_args.extend(["-symabis", symabis_path])
+
+    if asm_header_path:
+        compile_args.extend(["-asmhdr", asm_header_path])
+
+    if embed_config_path:
+        compile_args.extend(["-embedcfg", embed_config_path])
+
+    if request.build_opts.with_race_detector:
+        compile_args.append("-race")
+
+    if request.build_opts.with_msan:
+        compile_args.append("-msan")
+
+    if request.build_opts.with_asan:
+        compile_args.append("-asan")
+
+    # Pass the -complete flag if the provided Go files constitute the entire package.
+    if complete:
+        # Exceptions: a few standard packages have forward declarations for
+        # pieces supplied behind-the-scenes by package runtime.
+        if request.import_path not in (
+            "bytes",
+            "internal/poll",
+            "net",
+            "os",
+            "runtime/metrics",
+            "runtime/pprof",
+            "runtime/trace",
+            "sync",
+            "syscall",
+            "time",
+        ):
+            compile_args.append("-complete")
+
+    # Add any extra compiler flags after the ones added automatically by this rule.
+    if request.build_opts.compiler_flags:
+        compile_args.extend(request.build_opts.compiler_flags)
+    if request.pkg_specific_compiler_flags:
+        compile_args.extend(request.pkg_specific_compiler_flags)
+
+    # Remove -N if compiling runtime:
+    #  It is not possible to build the runtime with no optimizations,
+    #  because the compiler cannot eliminate enough write barriers.
+    if compiling_runtime:
+        compile_args = [arg for arg in compile_args if arg != "-N"]
+
+    return compile_args
+
+
 # NB: We must have a description for the streaming of this rule to work properly
 # (triggered by `FallibleBuiltGoPackage` subclassing `EngineAwareReturnType`).
 @rule(desc="Compile with Go", level=LogLevel.DEBUG)
@@ -698,56 +832,6 @@ async def build_go_package(
         )
         symabis_path = symabis_result.symabis_path
 
-    # Build the arguments for compiling the Go code in this package.
-    compile_args = [
-        "tool",
-        "compile",
-        "-buildid",
-        action_id_result.action_id,
-        "-o",
-        "__pkg__.a",
-        "-pack",
-        "-p",
-        request.import_path,
-        "-importcfg",
-        import_config.CONFIG_PATH,
-    ]
-
-    # See https://github.com/golang/go/blob/f229e7031a6efb2f23241b5da000c3b3203081d6/src/cmd/go/internal/work/gc.go#L79-L100
-    # for where this logic comes from.
-    go_version = request.minimum_go_version or "1.16"
-    if go_root.is_compatible_version(go_version):
-        compile_args.extend(["-lang", f"go{go_version}"])
-
-    if request.is_stdlib:
-        compile_args.append("-std")
-
-    compiling_runtime = request.is_stdlib and request.import_path in (
-        "internal/abi",
-        "internal/bytealg",
-        "internal/coverage/rtcov",
-        "internal/cpu",
-        "internal/goarch",
-        "internal/goos",
-        "runtime",
-        "runtime/internal/atomic",
-        "runtime/internal/math",
-        "runtime/internal/sys",
-        "runtime/internal/syscall",
-    )
-
-    # From Go sources:
-    # runtime compiles with a special gc flag to check for
-    # memory allocations that are invalid in the runtime package,
-    # and to implement some special compiler pragmas.
-    #
-    # See https://github.com/golang/go/blob/245e95dfabd77f337373bf2d6bb47cd353ad8d74/src/cmd/go/internal/work/gc.go#L107-L112
-    if compiling_runtime:
-        compile_args.append("-+")
-
-    if symabis_path:
-        compile_args.extend(["-symabis", symabis_path])
-
     # If any assembly files are present, request the compiler write an "assembly header" with API metadata
     # about the Go code that can be used by assembly files.
     asm_header_path: str | None = None
@@ -756,50 +840,22 @@ async def build_go_package(
             asm_header_path = "go_asm.h"
         else:
             asm_header_path = os.path.join(request.dir_path, "go_asm.h")
-        compile_args.extend(["-asmhdr", asm_header_path])
-
-    if embedcfg.digest != EMPTY_DIGEST:
-        compile_args.extend(["-embedcfg", RenderedEmbedConfig.PATH])
-
-    if request.build_opts.with_race_detector:
-        compile_args.append("-race")
-
-    if request.build_opts.with_msan:
-        compile_args.append("-msan")
-
-    if request.build_opts.with_asan:
-        compile_args.append("-asan")
 
-    # If there are no loose object files to add to the package archive later or assembly files to assemble,
-    # then pass -complete flag which tells the compiler that the provided Go files constitute the entire package.
-    if not objects and not s_files:
-        # Exceptions: a few standard packages have forward declarations for
-        # pieces supplied behind-the-scenes by package runtime.
-        if request.import_path not in (
-            "bytes",
-            "internal/poll",
-            "net",
-            "os",
-            "runtime/metrics",
-            "runtime/pprof",
-            "runtime/trace",
-            "sync",
-            "syscall",
-            "time",
-        ):
-            compile_args.append("-complete")
-
-    # Add any extra compiler flags after the ones added automatically by this rule.
-    if request.build_opts.compiler_flags:
-        compile_args.extend(request.build_opts.compiler_flags)
-    if request.pkg_specific_compiler_flags:
-        compile_args.extend(request.pkg_specific_compiler_flags)
-
-    # Remove -N if compiling runtime:
-    #  It is not possible to build the runtime with no optimizations,
-    #  because the compiler cannot eliminate enough write barriers.
-    if compiling_runtime:
-        compile_args = [arg for arg in compile_args if arg != "-N"]
+    # Build the arguments for compiling the Go code in this package.
+    #
+    # If there are no loose object files to add to the package archive later or assembly files to
+    # assemble, then the provided Go files constitute the entire package.
+    compile_args = _go_compile_args(
+        request,
+        go_root,
+        action_id=action_id_result.action_id,
+        output_path="__pkg__.a",
+        import_config_path=import_config.CONFIG_PATH,
+        embed_config_path=RenderedEmbedConfig.PATH if embedcfg.digest != EMPTY_DIGEST else None,
+        symabis_path=symabis_path,
+        asm_header_path=asm_header_path,
+        complete=not objects and not s_files,
+    )
 
     go_file_paths = (
         str(PurePath(request.dir_path, go_file)) if request.dir_path else f"./{go_file}"
@@ -826,6 +882,9 @@ async def build_go_package(
             description=f"Compile Go package: {request.import_path}",
             output_files=("__pkg__.a", *([asm_header_path] if asm_header_path else [])),
             env={"__PANTS_GO_COMPILE_ACTION_ID": action_id_result.action_id},
+            build_cache_action_id=_build_cache_action_id(
+                action_id_result.action_id, input_digest, compile_args
+            ),
         ),
     )
     if compile_result.exit_code != 0:
@@ -939,6 +998,369 @@ def required_built_go_package(fallible_result: FallibleBuiltGoPackage) -> BuiltG
     )
 
 
+def can_compile_in_batch(request: BuildGoPackageRequest) -> bool:
+    """Whether the package consists solely of Go sources, and so may be compiled as part of a
+    `BuildGoPackageBatchRequest`."""
+    return not (
+        request.is_stdlib
+        or request.with_coverage
+        or request.s_files
+        or request.cgo_files
+        or request.c_files
+        or request.cxx_files
+        or request.objc_files
+        or request.fortran_files
+        or request.prebuilt_object_files
+    )
+
+
+@dataclass(frozen=True)
+class BuildGoPackageBatchRequest:
+    """Build the given packages with as few `go tool compile` processes as possible.
+
+    Each process compiles up to `[golang].compile_batch_size` of the packages, in dependency order.
+    The packages must satisfy `can_compile_in_batch`. Their dependencies which are not part of the
+    batch are built as usual, via `BuildGoPackageRequest`.
+    """
+
+    requests: tuple[BuildGoPackageRequest, ...]
+
+
+@dataclass(frozen=True)
+class FallibleBuiltGoPackageBatch:
+    """The result of building each package of a `BuildGoPackageBatchRequest`, in the same order."""
+
+    results: tuple[FallibleBuiltGoPackage, ...]
+
+
+def _topologically_sorted(
+    requests: Iterable[BuildGoPackageRequest],
+) -> list[BuildGoPackageRequest]:
+    """Sort the given packages so that each comes after those of its dependencies which are also
+    given."""
+    members = set(requests)
+    result: list[BuildGoPackageRequest] = []
+    visited: set[BuildGoPackageRequest] = set()
+
+    def visit(pkg: BuildGoPackageRequest) -> None:
+        if pkg in visited:
+            return
+        visited.add(pkg)
+        for dep in pkg.direct_dependencies:
+            if dep in members:
+                visit(dep)
+        result.append(pkg)
+
+    for pkg in sorted(members, key=lambda pkg: pkg.import_path):
+        visit(pkg)
+    return result
+
+
+async def _build_go_package_batch_chunk(
+    chunk: list[BuildGoPackageRequest],
+    dep_results: Mapping[BuildGoPackageRequest, FallibleBuiltGoPackage],
+    go_root: GoRoot,
+    go_sdk_run: GoSdkRunSetup,
+    bash: BashBinary,
+) -> dict[BuildGoPackageRequest, FallibleBuiltGoPackage]:
+    """Compile the given topologically sorted packages in a single process.
+
+    The results of every dependency of the packages which is not itself in the chunk must be
+    present in `dep_results`.
+    """
+    chunk_members = set(chunk)
+
+    # Compute the `importcfg` of each package that can be compiled. The archives of packages
+    # compiled in this chunk are written directly to their usual location under `__pkgs__`.
+    results: dict[BuildGoPackageRequest, FallibleBuiltGoPackage] = {}
+    import_maps: dict[BuildGoPackageRequest, dict[str, str]] = {}
+    dep_digests: dict[BuildGoPackageRequest, list[Digest]] = {}
+    chunk_deps: dict[BuildGoPackageRequest, set[BuildGoPackageRequest]] = {}
+    for pkg in chunk:
+        import_map: dict[str, str] = {}
+        digests: list[Digest] = []
+        transitive_chunk_deps: set[BuildGoPackageRequest] = set()
+        for dep in pkg.direct_dependencies:
+            if dep in chunk_members:
+                if dep in results:
+                    results[pkg] = dataclasses.replace(
+                        results[dep], import_path=pkg.import_path, dependency_failed=True
+                    )
+                    break
+                import_map.update(import_maps[dep])
+                digests.extend(dep_digests[dep])
+                transitive_chunk_deps.update({dep, *chunk_deps[dep]})
+                continue
+            dep_result = dep_results[dep]
+            if dep_result.output is None:
+                results[pkg] = dataclasses.replace(
+                    dep_result, import_path=pkg.import_path, dependency_failed=True
+                )
+                break
+            import_map.update(dep_result.output.import_paths_to_pkg_a_files)
+            digests.append(dep_result.output.digest)
+        else:
+            import_map[pkg.import_path] = os.path.join(
+                "__pkgs__", path_safe(pkg.import_path), "__pkg__.a"
+            )
+            import_maps[pkg] = import_map
+            dep_digests[pkg] = digests
+            chunk_deps[pkg] = transitive_chunk_deps
+    to_compile = [pkg for pkg in chunk if pkg in import_maps]
+    if not to_compile:
+        return results
+    indices = {pkg: i for i, pkg in enumerate(to_compile)}
+
+    import_configs, embedcfgs, action_ids = await MultiGet(
+        MultiGet(
+            Get(
+                ImportConfig,
+                ImportConfigRequest(
+                    FrozenDict(import_maps[pkg]),
+                    build_opts=pkg.build_opts,
+                    import_map=pkg.import_map,
+                ),
+            )
+            for pkg in to_compile
+        ),
+        MultiGet(
+            Get(RenderedEmbedConfig, RenderEmbedConfigRequest(pkg.embed_config))
+            for pkg in to_compile
+        ),
+        MultiGet(Get(GoCompileActionIdResult, GoCompileActionIdRequest(pkg)) for pkg in to_compile),
+    )
+
+    # Render a script which compiles each package in turn, skipping those with a dependency which
+    # failed to compile. The inputs of each package are placed under `__batch_inputs__/<index>`, and
+    # the outcome of compiling it under `__batch__/<index>`.
+    script_lines = ["set -u"]
+    files: list[FileContent] = []
+    input_digests: list[Digest] = []
+    for i, (pkg, import_config, embedcfg, action_id) in enumerate(
+        zip(to_compile, import_configs, embedcfgs, action_ids)
+    ):
+        inputs_dir = f"__batch_inputs__/{i}"
+        outcome_dir = f"__batch__/{i}"
+        pkg_a_path = import_maps[pkg][pkg.import_path]
+        compile_args = _go_compile_args(
+            pkg,
+            go_root,
+            action_id=action_id.action_id,
+            output_path=pkg_a_path,
+            import_config_path=os.path.join(inputs_dir, "importcfg"),
+            embed_config_path=(
+                os.path.join(inputs_dir, "embedcfg") if embedcfg.digest != EMPTY_DIGEST else None
+            ),
+            symabis_path=None,
+            asm_header_path=None,
+            complete=True,
+        )
+        go_file_paths = (
+            str(PurePath(pkg.dir_path, go_file)) if pkg.dir_path else f"./{go_file}"
+            for go_file in pkg.go_files
+        )
+        files.append(
+            FileContent(f"{inputs_dir}/__sources__.txt", "\n".join(go_file_paths).encode())
+        )
+        compile_args.append(f"@{inputs_dir}/__sources__.txt")
+        input_digests.extend([*dep_digests[pkg], pkg.digest])
+
+        batch_deps = [dep for dep in pkg.direct_dependencies if dep in chunk_members]
+        condition = " && ".join(f'[ "$ok_{indices[dep]}" = 1 ]' for dep in batch_deps)
+        command = shlex.join([bash.path, go_sdk_run.script.path, *compile_args])
+        script_lines.extend(
+            [
+                f"# {pkg.import_path}",
+                f"ok_{i}=0",
+                f"/bin/mkdir -p {outcome_dir} {os.path.dirname(pkg_a_path)}",
+                f"if {condition or 'true'}; then",
+                f"  {command} > {outcome_dir}/stdout 2> {outcome_dir}/stderr",
+                "  exit_code=$?",
+                f"  echo $exit_code > {outcome_dir}/exit_code",
+                f'  [ "$exit_code" = 0 ] && ok_{i}=1',
+                "fi",
+            ]
+        )
+    script = FileContent("__compile_batch.sh", "\n".join([*script_lines, "exit 0", ""]).encode())
+    files.append(script)
+    input_digests.append(await Get(Digest, CreateDigest(files)))
+    prefixed_digests = await MultiGet(
+        Get(Digest, AddPrefix(digest, f"__batch_inputs__/{i}"))
+        for i, (import_config, embedcfg) in enumerate(zip(import_configs, embedcfgs))
+        for digest in (import_config.digest, embedcfg.digest)
+    )
+    input_digest = await Get(Digest, MergeDigests([*input_digests, *prefixed_digests]))
+
+    process = await Get(
+        Process,
+        GoSdkProcess(
+            command=(),
+            input_digest=input_digest,
+            description=f"Compile {pluralize(len(to_compile), 'Go package')} in a batch",
+            output_directories=("__batch__", "__pkgs__"),
+        ),
+    )
+    process = dataclasses.replace(process, argv=(bash.path, script.path))
+    batch_result = await Get(FallibleProcessResult, Process, process)
+    if batch_result.exit_code != 0:
+        for pkg in to_compile:
+            results[pkg] = FallibleBuiltGoPackage(
+                None,
+                pkg.import_path,
+                batch_result.exit_code,
+                stdout=batch_result.stdout.decode("utf-8"),
+                stderr=batch_result.stderr.decode("utf-8"),
+            )
+        return results
+
+    outcome_contents, output_digests = await MultiGet(
+        Get(
+            DigestContents,
+            DigestSubset(batch_result.output_digest, PathGlobs(["__batch__/**"])),
+        ),
+        MultiGet(
+            Get(
+                Digest,
+                DigestSubset(
+                    batch_result.output_digest, PathGlobs([import_maps[pkg][pkg.import_path]])
+                ),
+            )
+            for pkg in to_compile
+        ),
+    )
+    outcomes = {file_content.path: file_content.content for file_content in outcome_contents}
+
+    # Assemble the result of each package as `build_go_package` would, in dependency order so that
+    # the failure of a package propagates to the packages which depend on it.
+    output_digest_by_pkg = dict(zip(to_compile, output_digests))
+    merged_digests = await MultiGet(
+        Get(
+            Digest,
+            MergeDigests(
+                [
+                    *dep_digests[pkg],
+                    *(output_digest_by_pkg[dep] for dep in chunk_deps[pkg]),
+                    output_digest_by_pkg[pkg],
+                ]
+            ),
+        )
+        for pkg in to_compile
+    )
+    for i, (pkg, merged_digest) in enumerate(zip(to_compile, merged_digests)):
+        failed_dep = next(
+            (
+                results[dep]
+                for dep in pkg.direct_dependencies
+                if dep in results and results[dep].output is None
+            ),
+            None,
+        )
+        if failed_dep is not None:
+            results[pkg] = dataclasses.replace(
+                failed_dep, import_path=pkg.import_path, dependency_failed=True
+            )
+            continue
+
+        exit_code = int(outcomes[f"__batch__/{i}/exit_code"].decode().strip())
+        if exit_code != 0:
+            results[pkg] = FallibleBuiltGoPackage(
+                None,
+                pkg.import_path,
+                exit_code,
+                stdout=outcomes[f"__batch__/{i}/stdout"].decode("utf-8"),
+                stderr=outcomes[f"__batch__/{i}/stderr"].decode("utf-8"),
+            )
+            continue
+
+        results[pkg] = FallibleBuiltGoPackage(
+            BuiltGoPackage(
+                digest=merged_digest,
+                import_paths_to_pkg_a_files=FrozenDict(import_maps[pkg]),
+            ),
+            pkg.import_path,
+        )
+    return results
+
+
+@dataclass(frozen=True)
+class _BuildGoPackageBatchChunkRequest:
+    """Compile the chunk at `index` of a batch which has been split into topologically ordered
+    `chunks`."""
+
+    chunks: tuple[tuple[BuildGoPackageRequest, ...], ...]
+    index: int
+
+
+@dataclass(frozen=True)
+class _BuiltGoPackageBatchChunk:
+    results: FrozenDict[BuildGoPackageRequest, FallibleBuiltGoPackage]
+
+
+@rule
+async def build_go_package_batch_chunk(
+    request: _BuildGoPackageBatchChunkRequest,
+    go_root: GoRoot,
+    go_sdk_run: GoSdkRunSetup,
+    bash: BashBinary,
+) -> _BuiltGoPackageBatchChunk:
+    chunk = request.chunks[request.index]
+    chunk_index_by_pkg = {
+        pkg: index for index, pkg_chunk in enumerate(request.chunks) for pkg in pkg_chunk
+    }
+
+    # Wait only on the chunks which contain dependencies of this one, so that independent chunks
+    # are compiled concurrently.
+    external_deps: dict[BuildGoPackageRequest, None] = {}
+    dep_chunk_indices: set[int] = set()
+    for pkg in chunk:
+        for dep in pkg.direct_dependencies:
+            dep_chunk_index = chunk_index_by_pkg.get(dep)
+            if dep_chunk_index is None:
+                external_deps[dep] = None
+            elif dep_chunk_index != request.index:
+                dep_chunk_indices.add(dep_chunk_index)
+    external_results, dep_chunks = await MultiGet(
+        MultiGet(Get(FallibleBuiltGoPackage, BuildGoPackageRequest, dep) for dep in external_deps),
+        MultiGet(
+            Get(_BuiltGoPackageBatchChunk, _BuildGoPackageBatchChunkRequest(request.chunks, index))
+            for index in sorted(dep_chunk_indices)
+        ),
+    )
+    dep_results = dict(zip(external_deps, external_results))
+    for dep_chunk in dep_chunks:
+        dep_results.update(dep_chunk.results)
+
+    results = await _build_go_package_batch_chunk(
+        list(chunk), dep_results, go_root, go_sdk_run, bash
+    )
+    return _BuiltGoPackageBatchChunk(FrozenDict(results))
+
+
+@rule(desc="Compile Go packages in batches", level=LogLevel.DEBUG)
+async def build_go_package_batch(
+    request: BuildGoPackageBatchRequest, golang: GolangSubsystem
+) -> FallibleBuiltGoPackageBatch:
+    for pkg in request.requests:
+        if not can_compile_in_batch(pkg):
+            raise ValueError(f"The Go package `{pkg.import_path}` cannot be compiled in a batch.")
+
+    # Each chunk only contains packages whose in-batch dependencies are in the same or an earlier
+    # chunk, so the chunks form a DAG.
+    members = _topologically_sorted(request.requests)
+    batch_size = max(golang.compile_batch_size, 1)
+    chunks = tuple(tuple(members[i : i + batch_size]) for i in range(0, len(members), batch_size))
+    chunk_results = await MultiGet(
+        Get(_BuiltGoPackageBatchChunk, _BuildGoPackageBatchChunkRequest(chunks, index))
+        for index in range(len(chunks))
+    )
+    results = {
+        pkg: result
+        for chunk_result in chunk_results
+        for pkg, result in chunk_result.results.items()
+    }
+    return FallibleBuiltGoPackageBatch(tuple(results[pkg] for pkg in request.requests))
+
+
 @rule
 async def render_embed_config(request: RenderEmbedConfigRequest) -> RenderedEmbedConfig:
     digest = EMPTY_DIGEST
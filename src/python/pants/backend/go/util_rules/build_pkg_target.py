@@ -423,7 +423,7 @@ async def setup_build_go_package_target_request(
                 FallibleBuildGoPackageRequest,
                 BuildGoPackageRequestForStdlibRequest(
                     import_path=remaining_import,
-                    build_opts=request.build_opts,
+                    build_opts=request.build_opts.for_dependencies(),
                 ),
             )
         )
@@ -432,7 +432,7 @@ async def setup_build_go_package_target_request(
     maybe_pkg_direct_dependencies = await MultiGet(
         Get(
             FallibleBuildGoPackageRequest,
-            BuildGoPackageTargetRequest(address, build_opts=request.build_opts),
+            BuildGoPackageTargetRequest(address, build_opts=request.build_opts.for_dependencies()),
         )
         for address in pkg_dependency_addresses
     )
@@ -458,7 +458,10 @@ async def setup_build_go_package_target_request(
         maybe_base_pkg_dep = await Get(
             FallibleBuildGoPackageRequest,
             BuildGoPackageTargetRequest(
-                request.address, for_tests=True, build_opts=request.build_opts
+                request.address,
+                for_tests=True,
+                with_coverage=request.with_coverage,
+                build_opts=request.build_opts,
             ),
         )
         if maybe_base_pkg_dep.request is None:
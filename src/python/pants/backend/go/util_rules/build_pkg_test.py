@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import os.path
+from pathlib import Path
 from textwrap import dedent
 
 import pytest
@@ -26,14 +27,15 @@ from pants.backend.go.util_rules.build_pkg import (
     BuiltGoPackage,
     FallibleBuiltGoPackage,
 )
-from pants.engine.fs import Snapshot
+from pants.engine.fs import Digest, DigestContents, Snapshot
 from pants.engine.rules import QueryRule
 from pants.testutil.rule_runner import RuleRunner
 from pants.util.strutil import path_safe
 
 
-@pytest.fixture
-def rule_runner() -> RuleRunner:
+def _rule_runner(
+    *, bootstrap_args: list[str] | None = None, isolated_local_store: bool = False
+) -> RuleRunner:
     rule_runner = RuleRunner(
         rules=[
             *sdk.rules(),
@@ -47,13 +49,21 @@ def rule_runner() -> RuleRunner:
             *target_type_rules.rules(),
             QueryRule(BuiltGoPackage, [BuildGoPackageRequest]),
             QueryRule(FallibleBuiltGoPackage, [BuildGoPackageRequest]),
+            QueryRule(DigestContents, [Digest]),
         ],
         target_types=[GoModTarget],
+        bootstrap_args=bootstrap_args or [],
+        isolated_local_store=isolated_local_store,
     )
     rule_runner.set_options([], env_inherit={"PATH"})
     return rule_runner
 
 
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    return _rule_runner()
+
+
 def assert_built(
     rule_runner: RuleRunner, request: BuildGoPackageRequest, *, expected_import_paths: list[str]
 ) -> None:
@@ -161,6 +171,56 @@ def test_build_pkg(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_build_pkg_with_build_cache(tmp_path: Path) -> None:
+    def build() -> bytes:
+        # Each build uses a fresh local store, so that it misses the process cache, but they all
+        # share the `go_build_cache` named cache.
+        rule_runner = _rule_runner(
+            bootstrap_args=[f"--named-caches-dir={tmp_path}"], isolated_local_store=True
+        )
+        rule_runner.set_options(["--golang-build-cache"], env_inherit={"PATH"})
+        request = BuildGoPackageRequest(
+            import_path="example.com/foo",
+            pkg_name="foo",
+            dir_path="",
+            build_opts=GoBuildOptions(),
+            go_files=("f.go",),
+            digest=rule_runner.make_snapshot(
+                {
+                    "f.go": dedent(
+                        """\
+                        package foo
+
+                        func Quote(s string) string {
+                            return ">>" + s + "<<"
+                        }
+                        """
+                    )
+                }
+            ).digest,
+            s_files=(),
+            direct_dependencies=(),
+            minimum_go_version=None,
+        )
+        assert_built(rule_runner, request, expected_import_paths=["example.com/foo"])
+        built_package = rule_runner.request(BuiltGoPackage, [request])
+        (pkg_a,) = rule_runner.request(DigestContents, [built_package.digest])
+        return pkg_a.content
+
+    # The first build compiles the package, and stores it in the build cache: an output entry
+    # holding the `__pkg__.a`, and an action entry naming it.
+    pkg_a = build()
+    cache_dir = tmp_path / "go_build_cache"
+    (output_entry,) = (path for path in cache_dir.glob("*/*-d") if path.read_bytes() == pkg_a)
+    output_id = output_entry.name[: -len("-d")]
+    assert len([path for path in cache_dir.glob("*/*-a") if output_id in path.read_text()]) == 1
+
+    # The second build restores the `__pkg__.a` from the build cache rather than compiling it, which
+    # we check by replacing the cached output.
+    output_entry.write_bytes(b"restored from the build cache")
+    assert build() == b"restored from the build cache"
+
+
 def test_build_invalid_pkg(rule_runner: RuleRunner) -> None:
     invalid_dep = BuildGoPackageRequest(
         import_path="example.com/foo/dep",
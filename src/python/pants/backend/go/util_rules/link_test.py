@@ -0,0 +1,207 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import ast
+import logging
+import os
+import time
+
+import pytest
+
+from pants.backend.go import target_type_rules
+from pants.backend.go.target_types import GoModTarget
+from pants.backend.go.util_rules import (
+    assembly,
+    build_pkg,
+    first_party_pkg,
+    go_mod,
+    import_analysis,
+    link,
+    sdk,
+    third_party_pkg,
+)
+from pants.backend.go.util_rules.build_opts import GoBuildOptions
+from pants.backend.go.util_rules.build_pkg import BuildGoPackageRequest, BuiltGoPackage
+from pants.backend.go.util_rules.link import LinkedGoBinary, LinkGoBinaryRequest
+from pants.engine.fs import Digest, DigestContents
+from pants.engine.process import Process, ProcessResult
+from pants.engine.rules import QueryRule
+from pants.testutil.rule_runner import RuleRunner
+from pants.util.frozendict import FrozenDict
+
+logger = logging.getLogger(__name__)
+
+# Benchmarks build and link large binaries, which takes minutes, so they only run when asked for,
+# e.g. with `--test-extra-env-vars=PANTS_RUN_BENCHMARKS=True`.
+run_benchmarks = bool(ast.literal_eval(os.environ.get("PANTS_RUN_BENCHMARKS", "False")))
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    rule_runner = RuleRunner(
+        rules=[
+            *sdk.rules(),
+            *assembly.rules(),
+            *build_pkg.rules(),
+            *import_analysis.rules(),
+            *go_mod.rules(),
+            *first_party_pkg.rules(),
+            *link.rules(),
+            *third_party_pkg.rules(),
+            *target_type_rules.rules(),
+            QueryRule(BuiltGoPackage, [BuildGoPackageRequest]),
+            QueryRule(LinkedGoBinary, [LinkGoBinaryRequest]),
+            QueryRule(ProcessResult, [Process]),
+            QueryRule(DigestContents, [Digest]),
+        ],
+        target_types=[GoModTarget],
+    )
+    rule_runner.set_options([], env_inherit={"PATH"})
+    return rule_runner
+
+
+def _build_main_package(rule_runner: RuleRunner, package_count: int) -> BuiltGoPackage:
+    """Build a `main` package which (transitively) imports `package_count` tiny packages.
+
+    The packages form a binary tree rooted at `p0`, so that each package has at most two direct
+    dependencies.
+    """
+    files = {
+        f"p{i}/f.go": "\n".join(
+            [
+                f"package p{i}",
+                *(
+                    f'import "example.com/p{child}"'
+                    for child in (2 * i + 1, 2 * i + 2)
+                    if child < package_count
+                ),
+                f"func F{i}() int {{",
+                "    return "
+                + " + ".join(
+                    [
+                        "1",
+                        *(
+                            f"p{child}.F{child}()"
+                            for child in (2 * i + 1, 2 * i + 2)
+                            if child < package_count
+                        ),
+                    ]
+                ),
+                "}",
+                "",
+            ]
+        )
+        for i in range(package_count)
+    }
+    files["main.go"] = "\n".join(
+        [
+            "package main",
+            'import "example.com/p0"',
+            'import "fmt"',
+            "func main() {",
+            "    fmt.Println(p0.F0())",
+            "}",
+            "",
+        ]
+    )
+    digest = rule_runner.make_snapshot(files).digest
+
+    build_opts = GoBuildOptions()
+    requests: dict[int, BuildGoPackageRequest] = {}
+    for i in reversed(range(package_count)):
+        requests[i] = BuildGoPackageRequest(
+            import_path=f"example.com/p{i}",
+            pkg_name=f"p{i}",
+            dir_path=f"p{i}",
+            build_opts=build_opts,
+            go_files=("f.go",),
+            digest=digest,
+            s_files=(),
+            direct_dependencies=tuple(
+                requests[child] for child in (2 * i + 1, 2 * i + 2) if child < package_count
+            ),
+            minimum_go_version=None,
+        )
+    main = BuildGoPackageRequest(
+        import_path="main",
+        pkg_name="main",
+        dir_path="",
+        build_opts=build_opts,
+        go_files=("main.go",),
+        digest=digest,
+        s_files=(),
+        direct_dependencies=(requests[0],),
+        minimum_go_version=None,
+    )
+    return rule_runner.request(BuiltGoPackage, [main])
+
+
+def _link(
+    rule_runner: RuleRunner, built_package: BuiltGoPackage, *, omit_debug_info: bool
+) -> Digest:
+    binary = rule_runner.request(
+        LinkedGoBinary,
+        [
+            LinkGoBinaryRequest(
+                input_digest=built_package.digest,
+                archives=(built_package.import_paths_to_pkg_a_files["main"],),
+                build_opts=GoBuildOptions(),
+                import_paths_to_pkg_a_files=FrozenDict(built_package.import_paths_to_pkg_a_files),
+                output_filename="./bin",
+                description="Link benchmark binary",
+                omit_debug_info=omit_debug_info,
+            )
+        ],
+    )
+    return binary.digest
+
+
+def _run(rule_runner: RuleRunner, binary_digest: Digest) -> str:
+    result = rule_runner.request(
+        ProcessResult,
+        [Process(argv=("./bin",), input_digest=binary_digest, description="Run linked binary")],
+    )
+    return result.stdout.decode().strip()
+
+
+def test_link_omit_debug_info(rule_runner: RuleRunner) -> None:
+    built_package = _build_main_package(rule_runner, 3)
+    with_debug_info = _link(rule_runner, built_package, omit_debug_info=False)
+    without_debug_info = _link(rule_runner, built_package, omit_debug_info=True)
+    assert _run(rule_runner, with_debug_info) == "3"
+    assert _run(rule_runner, without_debug_info) == "3"
+
+    def binary(digest: Digest) -> bytes:
+        return rule_runner.request(DigestContents, [digest])[0].content
+
+    # `-w` drops the DWARF sections (`.debug_info` in ELF, `__debug_info` in Mach-O), and `-s`
+    # the symbol table.
+    assert b"debug_info" in binary(with_debug_info)
+    assert b"debug_info" not in binary(without_debug_info)
+    assert len(binary(without_debug_info)) < len(binary(with_debug_info))
+
+
+@pytest.mark.skipif(not run_benchmarks, reason="Set PANTS_RUN_BENCHMARKS=True to run benchmarks")
+def test_link_benchmark(rule_runner: RuleRunner) -> None:
+    """Compares the time to link a binary of 1,000 packages with and without debug information.
+
+    The timings are logged rather than asserted, since they depend on the machine running the test.
+    """
+    built_package = _build_main_package(rule_runner, 1000)
+
+    start = time.monotonic()
+    with_debug_info = _link(rule_runner, built_package, omit_debug_info=False)
+    with_debug_info_seconds = time.monotonic() - start
+
+    start = time.monotonic()
+    without_debug_info = _link(rule_runner, built_package, omit_debug_info=True)
+    without_debug_info_seconds = time.monotonic() - start
+
+    assert _run(rule_runner, with_debug_info) == "1000"
+    assert _run(rule_runner, without_debug_info) == "1000"
+    logger.info(
+        f"Link of a 1000 package binary: {with_debug_info_seconds:.2f}s with debug information, "
+        f"{without_debug_info_seconds:.2f}s without."
+    )
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import textwrap
 from dataclasses import dataclass
 from typing import Iterable, Mapping
@@ -30,6 +31,7 @@ class GoSdkProcess:
     output_files: tuple[str, ...]
     output_directories: tuple[str, ...]
     replace_sandbox_root_in_args: bool
+    build_cache_action_id: str | None
 
     def __init__(
         self,
@@ -43,6 +45,7 @@ class GoSdkProcess:
         output_directories: Iterable[str] = (),
         allow_downloads: bool = False,
         replace_sandbox_root_in_args: bool = False,
+        build_cache_action_id: str | None = None,
     ) -> None:
         object.__setattr__(self, "command", tuple(command))
         object.__setattr__(self, "description", description)
@@ -60,6 +63,10 @@ class GoSdkProcess:
         object.__setattr__(self, "output_files", tuple(output_files))
         object.__setattr__(self, "output_directories", tuple(output_directories))
         object.__setattr__(self, "replace_sandbox_root_in_args", replace_sandbox_root_in_args)
+        # If set, the `output_files` of this process are looked up in (and, on success, stored
+        # to) the persistent `[golang].build_cache` under this action ID. It must capture
+        # everything which affects the outputs, including the content of the inputs.
+        object.__setattr__(self, "build_cache_action_id", build_cache_action_id)
 
 
 @dataclass(frozen=True)
@@ -102,11 +109,99 @@ async def go_sdk_invoke_setup(goroot: GoRoot) -> GoSdkRunSetup:
     return GoSdkRunSetup(digest, go_run_script)
 
 
+@dataclass(frozen=True)
+class GoBuildCacheSetup:
+    digest: Digest
+    script: FileContent
+
+    CACHE_NAME = "go_build_cache"
+    CACHE_PATH = ".cache/go_build_cache"
+    OUTPUTS_ENV = "__PANTS_GO_BUILD_CACHE_OUTPUTS"
+
+
+@rule
+async def go_build_cache_setup() -> GoBuildCacheSetup:
+    # Wraps a command which produces output files, and stores/restores those files in a `GOCACHE`
+    # compatible layout: an action entry `<dir>/<hh>/<action id>-a` naming an output entry
+    # `<dir>/<hh>/<output id>-d` which holds the contents of the file. Both are written to a
+    # temporary file and moved into place, since the cache may be used concurrently.
+    #
+    # See https://github.com/golang/go/blob/go1.21.0/src/cmd/go/internal/cache/cache.go
+    script = FileContent(
+        "__go_build_cache.sh",
+        textwrap.dedent(
+            f"""\
+            cache_dir="{GoBuildCacheSetup.CACHE_PATH}"
+
+            entry_path() {{
+              echo "${{cache_dir}}/${{1:0:2}}/${{1}}-$2"
+            }}
+
+            restore() {{
+              for output in ${GoBuildCacheSetup.OUTPUTS_ENV}; do
+                IFS=: read -r path action_id output_id <<< "$output"
+                [ -f "$(entry_path "$action_id" a)" ] && [ -f "$(entry_path "$output_id" d)" ] || return 1
+              done
+              for output in ${GoBuildCacheSetup.OUTPUTS_ENV}; do
+                IFS=: read -r path action_id output_id <<< "$output"
+                /bin/mkdir -p "$(/usr/bin/dirname "$path")"
+                /bin/cp "$(entry_path "$output_id" d)" "$path" || return 1
+              done
+            }}
+
+            store() {{
+              for output in ${GoBuildCacheSetup.OUTPUTS_ENV}; do
+                IFS=: read -r path action_id output_id <<< "$output"
+                [ -f "$path" ] || continue
+                action_entry="$(entry_path "$action_id" a)"
+                output_entry="$(entry_path "$output_id" d)"
+                /bin/mkdir -p "$(/usr/bin/dirname "$action_entry")" "$(/usr/bin/dirname "$output_entry")"
+                /bin/cp "$path" "${{output_entry}}.$$.tmp" && /bin/mv -f "${{output_entry}}.$$.tmp" "$output_entry"
+                size="$(/usr/bin/wc -c < "$path" | /usr/bin/tr -d ' ')"
+                printf "v1 %s %s %20d %20d\\n" "$action_id" "$output_id" "$size" "$(/bin/date +%s)000000000" \\
+                  > "${{action_entry}}.$$.tmp" && /bin/mv -f "${{action_entry}}.$$.tmp" "$action_entry"
+              done
+            }}
+
+            if [ -n "${GoBuildCacheSetup.OUTPUTS_ENV}" ] && restore; then
+              exit 0
+            fi
+            "$@" || exit $?
+            store
+            exit 0
+            """
+        ).encode("utf-8"),
+    )
+
+    digest = await Get(Digest, CreateDigest([script]))
+    return GoBuildCacheSetup(digest, script)
+
+
+def _go_build_cache_outputs(
+    action_id: str, env: Mapping[str, str], output_files: Iterable[str]
+) -> str:
+    """Computes a `GOCACHE` action ID and output ID for each output file of an action."""
+    # The environment of the process (which includes the Go version and platform) is part of the
+    # action ID, since it may affect the behavior of the tool.
+    action_id = hashlib.sha256(
+        "\n".join([action_id, *(f"{k}={v}" for k, v in sorted(env.items()))]).encode()
+    ).hexdigest()
+
+    def hex_id(*parts: str) -> str:
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    return " ".join(
+        f"{path}:{hex_id(action_id, path)}:{hex_id(action_id, path, 'output')}"
+        for path in output_files
+    )
+
+
 @rule
 async def setup_go_sdk_process(
     request: GoSdkProcess,
     go_sdk_run: GoSdkRunSetup,
     bash: BashBinary,
+    golang: GolangSubsystem,
     golang_env_aware: GolangSubsystem.EnvironmentAware,
     goroot: GoRoot,
 ) -> Process:
@@ -137,13 +232,25 @@ async def setup_go_sdk_process(
             exp_fields.append("nocoverageredesign")
         env["GOEXPERIMENT"] = ",".join(exp_fields)
 
+    argv = [bash.path, go_sdk_run.script.path, *request.command]
+    append_only_caches: dict[str, str] = {}
+    if request.build_cache_action_id and golang.build_cache:
+        build_cache_setup = await Get(GoBuildCacheSetup)
+        input_digest = await Get(Digest, MergeDigests([input_digest, build_cache_setup.digest]))
+        argv = [bash.path, build_cache_setup.script.path, *argv]
+        env[GoBuildCacheSetup.OUTPUTS_ENV] = _go_build_cache_outputs(
+            request.build_cache_action_id, env, request.output_files
+        )
+        append_only_caches[GoBuildCacheSetup.CACHE_NAME] = GoBuildCacheSetup.CACHE_PATH
+
     return Process(
-        argv=[bash.path, go_sdk_run.script.path, *request.command],
+        argv=argv,
         env=env,
         input_digest=input_digest,
         description=request.description,
         output_files=request.output_files,
         output_directories=request.output_directories,
+        append_only_caches=append_only_caches,
         level=LogLevel.DEBUG,
     )
 
@@ -148,14 +148,19 @@ class ModuleDescriptor:
 @dataclass(frozen=True)
 class ModuleDescriptors:
     modules: FrozenOrderedSet[ModuleDescriptor]
-    go_mods_digest: Digest
 
 
 @dataclass(frozen=True)
 class AnalyzeThirdPartyModuleRequest:
+    """Download and analyze a single third-party module.
+
+    Only the `go.sum` entries for the module itself are included (rather than the entire `go.mod`
+    and `go.sum`), so that the download and analysis of a module remains cached when unrelated
+    requirements change.
+    """
+
     go_mod_address: Address
-    go_mod_digest: Digest
-    go_mod_path: str
+    go_sum_entries: tuple[str, ...]
     import_path: str
     name: str
     version: str
@@ -211,7 +216,6 @@ async def analyze_module_dependencies(request: ModuleDescriptorsRequest) -> Modu
         GoSdkProcess(
             command=["list", "-mod=readonly", "-e", "-m", "-json", "all"],
             input_digest=request.digest,
-            output_directories=("gopath",),
             working_dir=request.path if request.path else None,
             # Allow downloads of the module metadata (i.e., go.mod files).
             allow_downloads=True,
@@ -220,7 +224,7 @@ async def analyze_module_dependencies(request: ModuleDescriptorsRequest) -> Modu
     )
 
     if len(mod_list_result.stdout) == 0:
-        return ModuleDescriptors(FrozenOrderedSet(), EMPTY_DIGEST)
+        return ModuleDescriptors(FrozenOrderedSet())
 
     descriptors: dict[tuple[str, str], ModuleDescriptor] = {}
 
@@ -249,7 +253,7 @@ async def analyze_module_dependencies(request: ModuleDescriptorsRequest) -> Modu
     # Gazelle does this, mainly to store the sum on the go_repository rule. We could store it (or its
     # absence) to be able to download sums automatically.
 
-    return ModuleDescriptors(FrozenOrderedSet(descriptors.values()), mod_list_result.output_digest)
+    return ModuleDescriptors(FrozenOrderedSet(descriptors.values()))
 
 
 def strip_sandbox_prefix(path: str, marker: str) -> str:
@@ -327,22 +331,44 @@ async def _check_go_sum_has_not_changed(
             )
 
 
+def _go_sum_entries_for_module(go_sum: str, name: str, version: str) -> tuple[str, ...]:
+    """The lines of a `go.sum` file which hold the checksums of the given module version."""
+    versions = (version, f"{version}/go.mod")
+    entries = []
+    for line in go_sum.splitlines():
+        parts = line.split()
+        if len(parts) == 3 and parts[0] == name and parts[1] in versions:
+            entries.append(line)
+    return tuple(entries)
+
+
 @rule
 async def analyze_go_third_party_module(
     request: AnalyzeThirdPartyModuleRequest,
     analyzer: PackageAnalyzerSetup,
 ) -> AnalyzedThirdPartyModule:
-    # Download the module.
+    # Download the module from within a placeholder module, whose `go.sum` holds only the checksums
+    # of this module. `go` verifies the download against them.
+    download_module_digest = await Get(
+        Digest,
+        CreateDigest(
+            [
+                FileContent("go.mod", b"module download\n"),
+                FileContent(
+                    "go.sum", "".join(f"{entry}\n" for entry in request.go_sum_entries).encode()
+                ),
+            ]
+        ),
+    )
     download_result = await Get(
         ProcessResult,
         GoSdkProcess(
             ("mod", "download", "-json", f"{request.name}@{request.version}"),
-            input_digest=request.go_mod_digest,  # for go.sum
-            working_dir=os.path.dirname(request.go_mod_path),
+            input_digest=download_module_digest,
             # Allow downloads of the module sources.
             allow_downloads=True,
             output_directories=("gopath",),
-            output_files=(os.path.join(os.path.dirname(request.go_mod_path), "go.sum"),),
+            output_files=("go.sum",),
             description=f"Download Go module {request.name}@{request.version}.",
         ),
     )
@@ -354,9 +380,9 @@ async def analyze_go_third_party_module(
 
     # Make sure go.sum has not changed.
     await _check_go_sum_has_not_changed(
-        input_digest=request.go_mod_digest,
+        input_digest=download_module_digest,
         output_digest=download_result.output_digest,
-        dir_path=os.path.dirname(request.go_mod_path),
+        dir_path="",
         import_path=request.import_path,
         go_mod_address=request.go_mod_address,
     )
@@ -582,17 +608,21 @@ async def download_and_analyze_third_party_packages(
         ),
     )
 
-    go_mod_digest = await Get(
-        Digest, MergeDigests([request.go_mod_digest, module_analysis.go_mods_digest])
+    go_sum_contents = await Get(
+        DigestContents,
+        DigestSubset(
+            request.go_mod_digest,
+            PathGlobs([os.path.join(os.path.dirname(request.go_mod_path), "go.sum")]),
+        ),
     )
+    go_sum = go_sum_contents[0].content.decode() if go_sum_contents else ""
 
     analyzed_modules = await MultiGet(
         Get(
             AnalyzedThirdPartyModule,
             AnalyzeThirdPartyModuleRequest(
                 go_mod_address=request.go_mod_address,
-                go_mod_digest=go_mod_digest,
-                go_mod_path=request.go_mod_path,
+                go_sum_entries=_go_sum_entries_for_module(go_sum, mod.name, mod.version),
                 import_path=mod.name,
                 name=mod.name,
                 version=mod.version,
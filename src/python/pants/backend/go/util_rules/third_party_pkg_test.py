@@ -28,6 +28,7 @@ from pants.backend.go.util_rules.third_party_pkg import (
     AllThirdPartyPackagesRequest,
     ThirdPartyPkgAnalysis,
     ThirdPartyPkgAnalysisRequest,
+    _go_sum_entries_for_module,
 )
 from pants.build_graph.address import Address
 from pants.engine.fs import Digest, Snapshot
@@ -607,3 +608,20 @@ def test_go_sum_with_missing_entries_triggers_error(rule_runner: RuleRunner) ->
                 )
             ],
         )
+
+
+def test_go_sum_entries_for_module() -> None:
+    go_sum = dedent(
+        """\
+        github.com/google/uuid v1.2.0 h1:qJYtXnJRWmpe7m/3XlyhrsLrEURqHRM2kxzoxXqyUDs=
+        github.com/google/uuid v1.2.0/go.mod h1:TIyPZe4MgqvfeYDBFedMoGGpEw/LqOeaOT+nhxU+yHo=
+        github.com/google/uuid v1.3.0 h1:t6JiXgmwXMjEs8VusXIJk2BXHsn+wx8BZdTaoZ5fu7I=
+        github.com/google/uuid v1.3.0/go.mod h1:TIyPZe4MgqvfeYDBFedMoGGpEw/LqOeaOT+nhxU+yHo=
+        github.com/google/uuid-extra v1.3.0/go.mod h1:TIyPZe4MgqvfeYDBFedMoGGpEw/LqOeaOT+nhxU+yHo=
+        """
+    )
+    assert _go_sum_entries_for_module(go_sum, "github.com/google/uuid", "v1.3.0") == (
+        "github.com/google/uuid v1.3.0 h1:t6JiXgmwXMjEs8VusXIJk2BXHsn+wx8BZdTaoZ5fu7I=",
+        "github.com/google/uuid v1.3.0/go.mod h1:TIyPZe4MgqvfeYDBFedMoGGpEw/LqOeaOT+nhxU+yHo=",
+    )
+    assert _go_sum_entries_for_module(go_sum, "github.com/google/go-cmp", "v0.5.6") == ()
@@ -6,6 +6,7 @@ from __future__ import annotations
 import itertools
 import logging
 from itertools import chain
+from typing import Sequence
 
 from pants.backend.java.dependency_inference.rules import (
     JavaInferredDependencies,
@@ -21,6 +22,8 @@ from pants.engine.process import FallibleProcessResult, Process, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import CoarsenedTarget, SourcesField
 from pants.engine.unions import UnionRule
+from pants.jvm.abi_jar import abi_jar
+from pants.jvm.abi_jar.abi_jar import AbiJarRequest
 from pants.jvm.classpath import Classpath
 from pants.jvm.compile import (
     ClasspathDependenciesRequest,
@@ -49,6 +52,19 @@ def compute_output_jar_filename(ctgt: CoarsenedTarget) -> str:
     return f"{ctgt.representative.address.path_safe_spec}.javac.jar"
 
 
+async def _merge_classpath_entry_digests(
+    entries: Sequence[ClasspathEntry],
+) -> tuple[Digest, Digest | None]:
+    """Merges the digests of the given entries, and their ABI digests if any of them have one."""
+    if not any(entry.abi_digest for entry in entries):
+        return await Get(Digest, MergeDigests(entry.digest for entry in entries)), None
+    digest, abi_digest = await MultiGet(
+        Get(Digest, MergeDigests(entry.digest for entry in entries)),
+        Get(Digest, MergeDigests(entry.compile_digest for entry in entries)),
+    )
+    return digest, abi_digest
+
+
 @rule(desc="Compile with javac")
 async def compile_java_source(
     bash: BashBinary,
@@ -122,10 +138,12 @@ async def compile_java_source(
     ]
     if not component_members_and_java_source_files:
         # Is a generator, and so exports all of its direct deps.
-        exported_digest = await Get(
-            Digest, MergeDigests(cpe.digest for cpe in direct_dependency_classpath_entries)
+        exported_digest, exported_abi_digest = await _merge_classpath_entry_digests(
+            direct_dependency_classpath_entries
+        )
+        classpath_entry = ClasspathEntry.merge(
+            exported_digest, direct_dependency_classpath_entries, abi_digest=exported_abi_digest
         )
-        classpath_entry = ClasspathEntry.merge(exported_digest, direct_dependency_classpath_entries)
         return FallibleClasspathEntry(
             description=str(request.component),
             result=CompileResult.SUCCEEDED,
@@ -155,7 +173,9 @@ async def compile_java_source(
     )
 
     usercp = "__cp"
-    user_classpath = Classpath(direct_dependency_classpath_entries, request.resolve)
+    user_classpath = Classpath(
+        ClasspathEntry.for_compilation(direct_dependency_classpath_entries), request.resolve
+    )
     classpath_arg = ":".join(user_classpath.root_immutable_inputs_args(prefix=usercp))
     immutable_input_digests = dict(user_classpath.root_immutable_inputs(prefix=usercp))
 
@@ -227,17 +247,23 @@ async def compile_java_source(
         jar_output_digest = await Get(
             Digest, StripJarRequest(digest=jar_output_digest, filenames=output_files)
         )
+    abi_output_digest = None
+    if javac.abi_jars and output_files:
+        abi_output_digest = await Get(
+            Digest, AbiJarRequest(digest=jar_output_digest, filenames=output_files)
+        )
     output_classpath = ClasspathEntry(
-        jar_output_digest, output_files, direct_dependency_classpath_entries
+        jar_output_digest, output_files, direct_dependency_classpath_entries, abi_output_digest
     )
 
     if export_classpath_entries:
-        merged_export_digest = await Get(
-            Digest,
-            MergeDigests((output_classpath.digest, *(i.digest for i in export_classpath_entries))),
+        merged_export_digest, merged_export_abi_digest = await _merge_classpath_entry_digests(
+            (output_classpath, *export_classpath_entries)
         )
         merged_classpath = ClasspathEntry.merge(
-            merged_export_digest, (output_classpath, *export_classpath_entries)
+            merged_export_digest,
+            (output_classpath, *export_classpath_entries),
+            abi_digest=merged_export_abi_digest,
         )
         output_classpath = merged_classpath
 
@@ -251,6 +277,7 @@ async def compile_java_source(
 def rules():
     return [
         *collect_rules(),
+        *abi_jar.rules(),
         *java_dep_inference_rules(),
         *jvm_compile_rules(),
         UnionRule(ClasspathEntryRequest, CompileJavaSourceRequest),
@@ -115,16 +115,43 @@ public class PantsJavaParserLauncher {
     return new ArrayList<>();
   }
 
+  /**
+   * Usage: either `<analysis output path> <source>`, or `--batch <analysis output dir> <sources>...`
+   * to analyze many sources in one invocation, writing the analysis of each source to `<analysis
+   * output dir>/<source>.json`.
+   */
   public static void main(String[] args) throws Exception {
-    String analysisOutputPath = args[0];
-    String sourceToAnalyze = args[1];
-
     // NB: We hardcode the most permissive language level in order to capture all potential
     // sources of symbols. If certain syntax ends up deprecated in future versions, we may need to
     // allow this to be configured.
     StaticJavaParser.setConfiguration(
         new ParserConfiguration()
             .setLanguageLevel(ParserConfiguration.LanguageLevel.JAVA_17_PREVIEW));
+    ObjectMapper mapper = new ObjectMapper();
+    mapper.registerModule(new Jdk8Module());
+
+    if (args[0].equals("--batch")) {
+      File analysisOutputDir = new File(args[1]);
+      for (int i = 2; i < args.length; i++) {
+        String sourceToAnalyze = args[i];
+        CompilationUnitAnalysis analysis;
+        try {
+          analysis = analyze(sourceToAnalyze);
+        } catch (Exception e) {
+          throw new Exception("Failed to analyze " + sourceToAnalyze, e);
+        }
+        File analysisOutput = new File(analysisOutputDir, sourceToAnalyze + ".json");
+        analysisOutput.getParentFile().mkdirs();
+        mapper.writeValue(analysisOutput, analysis);
+      }
+    } else {
+      String analysisOutputPath = args[0];
+      String sourceToAnalyze = args[1];
+      mapper.writeValue(new File(analysisOutputPath), analyze(sourceToAnalyze));
+    }
+  }
+
+  private static CompilationUnitAnalysis analyze(String sourceToAnalyze) throws Exception {
     CompilationUnit cu = StaticJavaParser.parse(new File(sourceToAnalyze));
 
     // Get the source's declare package.
@@ -227,11 +254,7 @@ public class PantsJavaParserLauncher {
 
     ArrayList<String> consumedTypes = new ArrayList<>(consumedIdentifiers);
     ArrayList<String> exportTypes = new ArrayList<>(exportIdentifiers);
-    CompilationUnitAnalysis analysis =
-        new CompilationUnitAnalysis(
-            declaredPackage, imports, topLevelTypes, consumedTypes, exportTypes);
-    ObjectMapper mapper = new ObjectMapper();
-    mapper.registerModule(new Jdk8Module());
-    mapper.writeValue(new File(analysisOutputPath), analysis);
+    return new CompilationUnitAnalysis(
+        declaredPackage, imports, topLevelTypes, consumedTypes, exportTypes);
   }
 }
@@ -21,6 +21,7 @@ from pants.engine.unions import UnionRule
 from pants.jvm.jdk_rules import InternalJdk, JvmProcess
 from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool, GenerateJvmToolLockfileSentinel
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
 
@@ -44,6 +45,20 @@ class FallibleJavaSourceDependencyAnalysisResult:
     process_result: FallibleProcessResult
 
 
+@dataclass(frozen=True)
+class JavaSourceDependencyAnalysisBatchRequest:
+    """Analyze any number of source files in a single invocation of the parser."""
+
+    source_files: SourceFiles
+
+
+@dataclass(frozen=True)
+class JavaSourceDependencyAnalysisBatch:
+    """The analysis of each file in a `JavaSourceDependencyAnalysisBatchRequest`, by path."""
+
+    analyses: FrozenDict[str, JavaSourceDependencyAnalysis]
+
+
 @dataclass(frozen=True)
 class JavaParserCompiledClassfiles:
     digest: Digest
@@ -133,6 +148,83 @@ async def analyze_java_source_dependencies(
     return FallibleJavaSourceDependencyAnalysisResult(process_result=process_result)
 
 
+@rule(level=LogLevel.DEBUG)
+async def analyze_java_source_dependencies_batch(
+    processor_classfiles: JavaParserCompiledClassfiles,
+    jdk: InternalJdk,
+    request: JavaSourceDependencyAnalysisBatchRequest,
+) -> JavaSourceDependencyAnalysisBatch:
+    source_files = request.source_files
+    if not source_files.files:
+        return JavaSourceDependencyAnalysisBatch(FrozenDict())
+
+    source_prefix = "__source_to_analyze"
+    processorcp_relpath = "__processorcp"
+    toolcp_relpath = "__toolcp"
+
+    parser_lockfile_request = await Get(
+        GenerateJvmLockfileFromTool, JavaParserToolLockfileSentinel()
+    )
+    tool_classpath, prefixed_source_files_digest = await MultiGet(
+        Get(
+            ToolClasspath,
+            ToolClasspathRequest(lockfile=parser_lockfile_request),
+        ),
+        Get(Digest, AddPrefix(source_files.snapshot.digest, source_prefix)),
+    )
+
+    extra_immutable_input_digests = {
+        toolcp_relpath: tool_classpath.digest,
+        processorcp_relpath: processor_classfiles.digest,
+    }
+
+    analysis_output_dir = "__source_analysis"
+
+    process_result = await Get(
+        ProcessResult,
+        JvmProcess(
+            jdk=jdk,
+            classpath_entries=[
+                *tool_classpath.classpath_entries(toolcp_relpath),
+                processorcp_relpath,
+            ],
+            argv=[
+                "org.pantsbuild.javaparser.PantsJavaParserLauncher",
+                "--batch",
+                analysis_output_dir,
+                *(os.path.join(source_prefix, file) for file in source_files.files),
+            ],
+            input_digest=prefixed_source_files_digest,
+            extra_immutable_input_digests=extra_immutable_input_digests,
+            output_directories=(analysis_output_dir,),
+            extra_nailgun_keys=extra_immutable_input_digests,
+            description=(
+                f"Analyzing {source_files.files[0]}"
+                if len(source_files.files) == 1
+                else f"Analyzing {len(source_files.files)} Java sources"
+            ),
+            level=LogLevel.DEBUG,
+        ),
+    )
+
+    analysis_digest = await Get(
+        Digest,
+        RemovePrefix(
+            process_result.output_digest, os.path.join(analysis_output_dir, source_prefix)
+        ),
+    )
+    analysis_contents = await Get(DigestContents, Digest, analysis_digest)
+    return JavaSourceDependencyAnalysisBatch(
+        FrozenDict(
+            (
+                file_content.path[: -len(".json")],
+                JavaSourceDependencyAnalysis.from_json_dict(json.loads(file_content.content)),
+            )
+            for file_content in analysis_contents
+        )
+    )
+
+
 def _load_javaparser_launcher_source() -> bytes:
     return pkg_resources.resource_string(__name__, _LAUNCHER_BASENAME)
 
@@ -9,6 +9,8 @@ import pytest
 
 from pants.backend.java.dependency_inference.java_parser import (
     FallibleJavaSourceDependencyAnalysisResult,
+    JavaSourceDependencyAnalysisBatch,
+    JavaSourceDependencyAnalysisBatchRequest,
 )
 from pants.backend.java.dependency_inference.java_parser import rules as java_parser_rules
 from pants.backend.java.dependency_inference.types import JavaImport, JavaSourceDependencyAnalysis
@@ -38,6 +40,9 @@ def rule_runner() -> RuleRunner:
             *jdk_rules.rules(),
             QueryRule(FallibleJavaSourceDependencyAnalysisResult, (SourceFiles,)),
             QueryRule(JavaSourceDependencyAnalysis, (SourceFiles,)),
+            QueryRule(
+                JavaSourceDependencyAnalysisBatch, (JavaSourceDependencyAnalysisBatchRequest,)
+            ),
             QueryRule(SourceFiles, (SourceFilesRequest,)),
         ],
         target_types=[JavaSourceTarget],
@@ -309,3 +314,52 @@ def test_java_parser_consumed_types(rule_runner: RuleRunner) -> None:
         "String",
         "provider",  # note: false positive on a variable identifier
     ]
+
+
+@maybe_skip_jdk_test
+def test_java_parser_batch_analysis(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "BUILD": dedent(
+                """\
+                java_source(name='a', source='a/A.java')
+                java_source(name='b', source='b/B.java')
+                """
+            ),
+            "a/A.java": dedent(
+                """
+                package org.pantsbuild.a;
+
+                import org.pantsbuild.b.B;
+
+                public class A extends B {}
+                """
+            ),
+            "b/B.java": dedent(
+                """
+                package org.pantsbuild.b;
+
+                public class B {}
+                """
+            ),
+        }
+    )
+
+    targets = [
+        rule_runner.get_target(address=Address(spec_path="", target_name=name))
+        for name in ("a", "b")
+    ]
+    source_files = rule_runner.request(
+        SourceFiles, [SourceFilesRequest(tgt[JavaSourceField] for tgt in targets)]
+    )
+
+    batch = rule_runner.request(
+        JavaSourceDependencyAnalysisBatch, [JavaSourceDependencyAnalysisBatchRequest(source_files)]
+    )
+    assert set(batch.analyses) == {"a/A.java", "b/B.java"}
+
+    a_analysis = batch.analyses["a/A.java"]
+    assert a_analysis.declared_package == "org.pantsbuild.a"
+    assert a_analysis.imports == (JavaImport(name="org.pantsbuild.b.B"),)
+    assert a_analysis.top_level_types == ("org.pantsbuild.a.A",)
+    assert batch.analyses["b/B.java"].top_level_types == ("org.pantsbuild.b.B",)
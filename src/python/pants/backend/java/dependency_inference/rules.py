@@ -8,13 +8,14 @@ from dataclasses import dataclass
 from pants.backend.java.dependency_inference import symbol_mapper
 from pants.backend.java.dependency_inference.java_parser import JavaSourceDependencyAnalysisRequest
 from pants.backend.java.dependency_inference.java_parser import rules as java_parser_rules
+from pants.backend.java.dependency_inference.symbol_mapper import AllJavaSourceDependencyAnalyses
 from pants.backend.java.dependency_inference.types import JavaImport, JavaSourceDependencyAnalysis
 from pants.backend.java.subsystems.java_infer import JavaInferSubsystem
 from pants.backend.java.target_types import JavaSourceField
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.core.util_rules.source_files import rules as source_files_rules
 from pants.engine.addresses import Address
-from pants.engine.rules import Get, MultiGet, collect_rules, rule
+from pants.engine.rules import Get, collect_rules, rule
 from pants.engine.target import (
     Dependencies,
     DependenciesRequest,
@@ -73,6 +74,7 @@ async def infer_java_dependencies_and_exports_via_source_analysis(
     java_infer_subsystem: JavaInferSubsystem,
     jvm: JvmSubsystem,
     symbol_mapping: SymbolMapping,
+    all_analyses: AllJavaSourceDependencyAnalyses,
 ) -> JavaInferredDependencies:
     if not java_infer_subsystem.imports and not java_infer_subsystem.consumed_types:
         return JavaInferredDependencies(FrozenOrderedSet([]), FrozenOrderedSet([]))
@@ -83,15 +85,18 @@ async def infer_java_dependencies_and_exports_via_source_analysis(
         WrappedTarget, WrappedTargetRequest(address, description_of_origin="<infallible>")
     )
     tgt = wrapped_tgt.target
-    source_files = await Get(SourceFiles, SourceFilesRequest([tgt[JavaSourceField]]))
-
-    explicitly_provided_deps, analysis = await MultiGet(
-        Get(ExplicitlyProvidedDependencies, DependenciesRequest(tgt[Dependencies])),
-        Get(
+    explicitly_provided_deps = await Get(
+        ExplicitlyProvidedDependencies, DependenciesRequest(tgt[Dependencies])
+    )
+    # The sources of all Java targets were already analyzed in batches to build the symbol
+    # mapping, so this should only need to analyze sources which were not visible to that.
+    analysis = all_analyses.analyses.get(tgt[JavaSourceField].file_path)
+    if analysis is None:
+        source_files = await Get(SourceFiles, SourceFilesRequest([tgt[JavaSourceField]]))
+        analysis = await Get(
             JavaSourceDependencyAnalysis,
             JavaSourceDependencyAnalysisRequest(source_files=source_files),
-        ),
-    )
+        )
 
     types: OrderedSet[str] = OrderedSet()
     if java_infer_subsystem.imports:
@@ -5,19 +5,29 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
+from dataclasses import dataclass
 from typing import Mapping
 
+from pants.backend.java.dependency_inference.java_parser import (
+    JavaSourceDependencyAnalysisBatch,
+    JavaSourceDependencyAnalysisBatchRequest,
+)
 from pants.backend.java.dependency_inference.types import JavaSourceDependencyAnalysis
 from pants.backend.java.target_types import JavaSourceField
-from pants.core.util_rules.source_files import SourceFilesRequest
+from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import AllTargets, Targets
 from pants.engine.unions import UnionRule
 from pants.jvm.dependency_inference import symbol_mapper
 from pants.jvm.dependency_inference.artifact_mapper import MutableTrieNode
-from pants.jvm.dependency_inference.symbol_mapper import FirstPartyMappingRequest, SymbolMap
+from pants.jvm.dependency_inference.symbol_mapper import (
+    FirstPartyMappingRequest,
+    SymbolMap,
+    partition_sources_for_analysis,
+)
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmResolveField
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 
 logger = logging.getLogger(__name__)
@@ -32,6 +42,33 @@ def find_all_java_targets(tgts: AllTargets) -> AllJavaTargets:
     return AllJavaTargets(tgt for tgt in tgts if tgt.has_field(JavaSourceField))
 
 
+@dataclass(frozen=True)
+class AllJavaSourceDependencyAnalyses:
+    """The dependency analysis of the source of every Java target, by source path."""
+
+    analyses: FrozenDict[str, JavaSourceDependencyAnalysis]
+
+
+@rule(desc="Analyze all Java sources", level=LogLevel.DEBUG)
+async def analyze_all_java_sources(java_targets: AllJavaTargets) -> AllJavaSourceDependencyAnalyses:
+    batches = partition_sources_for_analysis(java_targets, JavaSourceField)
+    all_source_files = await MultiGet(
+        Get(SourceFiles, SourceFilesRequest(tgt[JavaSourceField] for tgt in batch))
+        for batch in batches
+    )
+    analysis_batches = await MultiGet(
+        Get(JavaSourceDependencyAnalysisBatch, JavaSourceDependencyAnalysisBatchRequest(files))
+        for files in all_source_files
+    )
+    return AllJavaSourceDependencyAnalyses(
+        FrozenDict(
+            (path, analysis)
+            for analysis_batch in analysis_batches
+            for path, analysis in analysis_batch.analyses.items()
+        )
+    )
+
+
 class FirstPartyJavaTargetsMappingRequest(FirstPartyMappingRequest):
     pass
 
@@ -40,21 +77,15 @@ class FirstPartyJavaTargetsMappingRequest(FirstPartyMappingRequest):
 async def map_first_party_java_targets_to_symbols(
     _: FirstPartyJavaTargetsMappingRequest,
     java_targets: AllJavaTargets,
+    all_analyses: AllJavaSourceDependencyAnalyses,
     jvm: JvmSubsystem,
 ) -> SymbolMap:
-    source_analysis = await MultiGet(
-        Get(JavaSourceDependencyAnalysis, SourceFilesRequest([target[JavaSourceField]]))
-        for target in java_targets
-    )
-    address_and_analysis = zip(
-        [(tgt.address, tgt[JvmResolveField].normalized_value(jvm)) for tgt in java_targets],
-        source_analysis,
-    )
-
     mapping: Mapping[str, MutableTrieNode] = defaultdict(MutableTrieNode)
-    for (address, resolve), analysis in address_and_analysis:
+    for tgt in java_targets:
+        analysis = all_analyses.analyses[tgt[JavaSourceField].file_path]
+        resolve = tgt[JvmResolveField].normalized_value(jvm)
         for top_level_type in analysis.top_level_types:
-            mapping[resolve].insert(top_level_type, [address], first_party=True)
+            mapping[resolve].insert(top_level_type, [tgt.address], first_party=True)
 
     return SymbolMap((resolve, node.frozen()) for resolve, node in mapping.items())
 
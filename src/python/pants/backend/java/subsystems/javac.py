@@ -7,6 +7,7 @@ import logging
 
 from pants.option.option_types import ArgsListOption, BoolOption
 from pants.option.subsystem import Subsystem
+from pants.util.strutil import softwrap
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,21 @@ class JavacSubsystem(Subsystem):
 
     args = ArgsListOption(example="-g -deprecation")
 
+    abi_jars = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, create an ABI jar (containing only the non-private signatures, constants and
+            annotations of its classes) for each `javac` output, and compile dependents against it
+            rather than against the full jar.
+
+            Changes which do not affect the API of a target (such as changes to method bodies) will
+            then not cause its dependents to be recompiled.
+            """
+        ),
+        advanced=True,
+    )
+
     tailor_source_targets = BoolOption(
         default=True,
         help="If true, add `java_sources` and `java_tests` targets with the `tailor` goal.",
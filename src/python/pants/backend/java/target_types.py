@@ -17,6 +17,7 @@ from pants.engine.target import (
 )
 from pants.jvm import target_types as jvm_target_types
 from pants.jvm.target_types import (
+    JunitTestBatchCompatibilityTagField,
     JunitTestExtraEnvVarsField,
     JunitTestSourceField,
     JunitTestTimeoutField,
@@ -67,6 +68,7 @@ class JunitTestTarget(Target):
         JavaJunitTestSourceField,
         JunitTestTimeoutField,
         JunitTestExtraEnvVarsField,
+        JunitTestBatchCompatibilityTagField,
         JvmDependenciesField,
         JvmResolveField,
         JvmProvidesTypesField,
@@ -93,6 +95,7 @@ class JunitTestsGeneratorTarget(TargetFilesGenerator):
     moved_fields = (
         JunitTestTimeoutField,
         JunitTestExtraEnvVarsField,
+        JunitTestBatchCompatibilityTagField,
         JvmDependenciesField,
         JvmJdkField,
         JvmProvidesTypesField,
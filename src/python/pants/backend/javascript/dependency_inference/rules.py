@@ -25,7 +25,7 @@ from pants.engine.addresses import Addresses
 from pants.engine.internals.graph import Owners, OwnersRequest
 from pants.engine.internals.native_dep_inference import NativeParsedJavascriptDependencies
 from pants.engine.internals.native_engine import InferenceMetadata, NativeDependenciesRequest
-from pants.engine.internals.selectors import Get
+from pants.engine.internals.selectors import Get, MultiGet
 from pants.engine.rules import Rule, collect_rules, rule
 from pants.engine.target import (
     FieldSet,
@@ -87,6 +87,16 @@ class NodePackageCandidateMap(FrozenDict[str, Address]):
 class RequestNodePackagesCandidateMap:
     address: Address
 
+    @classmethod
+    def for_owner(
+        cls, owning_pkg: OwningNodePackage, address: Address
+    ) -> RequestNodePackagesCandidateMap:
+        """Request the candidate map by the package owning `address`, so that the map is computed
+        once per package rather than once per file."""
+        if owning_pkg.target:
+            return cls(owning_pkg.target.address)
+        return cls(Address(address.spec_path))
+
 
 @rule
 async def map_candidate_node_packages(
@@ -109,8 +119,9 @@ async def prepare_inference_metadata(imports: PackageJsonImports) -> InferenceMe
     )
 
 
-async def _prepare_inference_metadata(address: Address) -> InferenceMetadata:
-    owning_pkg = await Get(OwningNodePackage, OwningNodePackageRequest(address))
+async def _prepare_inference_metadata(
+    owning_pkg: OwningNodePackage, address: Address
+) -> InferenceMetadata:
     if not owning_pkg.target:
         return InferenceMetadata.javascript(address.spec_path, {})
     return await Get(
@@ -127,10 +138,11 @@ async def infer_js_source_dependencies(
     if not nodejs_infer.imports:
         return InferredDependencies(())
 
-    sources = await Get(
-        HydratedSources, HydrateSourcesRequest(source, for_sources_types=[JSSourceField])
+    sources, owning_pkg = await MultiGet(
+        Get(HydratedSources, HydrateSourcesRequest(source, for_sources_types=[JSSourceField])),
+        Get(OwningNodePackage, OwningNodePackageRequest(request.field_set.address)),
     )
-    metadata = await _prepare_inference_metadata(request.field_set.address)
+    metadata = await _prepare_inference_metadata(owning_pkg, request.field_set.address)
 
     import_strings = await Get(
         NativeParsedJavascriptDependencies,
@@ -146,7 +158,8 @@ async def infer_js_source_dependencies(
     )
 
     candidate_pkgs = await Get(
-        NodePackageCandidateMap, RequestNodePackagesCandidateMap(request.field_set.address)
+        NodePackageCandidateMap,
+        RequestNodePackagesCandidateMap.for_owner(owning_pkg, request.field_set.address),
     )
 
     pkg_addresses = (
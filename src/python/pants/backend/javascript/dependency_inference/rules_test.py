@@ -436,3 +436,39 @@ def test_infers_first_party_package_json_field_js_source_dependency_with_starred
     ).include
 
     assert set(addresses) == {Address("src/js/b", generated_name="spam")}
+
+
+def test_infers_first_party_package_json_field_js_source_dependency_without_owning_package(
+    rule_runner: RuleRunner,
+) -> None:
+    rule_runner.write_files(
+        {
+            "src/js/a/BUILD": "javascript_sources()",
+            "src/js/a/index.js": dedent(
+                """\
+                import { x } from "spam";
+                """
+            ),
+            "src/js/a/other.js": dedent(
+                """\
+                import { y } from "eggs";
+                """
+            ),
+            "src/js/b/BUILD": "package_json()",
+            "src/js/b/package.json": given_package("spam", "0.0.1"),
+            "src/js/b/lib/BUILD": "javascript_sources()",
+            "src/js/b/lib/index.js": "const x = 2;",
+        }
+    )
+
+    def infer(file: str) -> set[Address]:
+        tgt = rule_runner.get_target(Address("src/js/a", relative_file_path=file))
+        return set(
+            rule_runner.request(
+                InferredDependencies,
+                [InferJSDependenciesRequest(JSSourceInferenceFieldSet.create(tgt))],
+            ).include
+        )
+
+    assert infer("index.js") == {Address("src/js/b", generated_name="spam")}
+    assert infer("other.js") == set()
@@ -223,6 +223,9 @@ async def run_javascript_tests(
                 installation.join_relative_workspace_directory(directory)
                 for directory in output_directories or ()
             ),
+            per_package_caches=installation.project_env.script_caches(
+                test_script.entry_point, test_script.extra_caches
+            ),
         ),
     )
     if test.force:
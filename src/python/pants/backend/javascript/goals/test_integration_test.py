@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import textwrap
 from pathlib import Path
-from typing import cast
+from typing import Iterable, cast
 
 import pytest
 
@@ -35,8 +35,7 @@ def package_manager(request) -> str:
     return cast(str, request.param)
 
 
-@pytest.fixture
-def rule_runner(package_manager: str) -> RuleRunner:
+def create_rule_runner(package_manager: str, bootstrap_args: Iterable[str] = ()) -> RuleRunner:
     rule_runner = RuleRunner(
         rules=[
             *test.rules(),
@@ -50,11 +49,17 @@ def rule_runner(package_manager: str) -> RuleRunner:
             JSTestTarget,
         ],
         objects=dict(package_json.build_file_aliases().objects),
+        bootstrap_args=bootstrap_args,
     )
     rule_runner.set_options([f"--nodejs-package-manager={package_manager}"], env_inherit={"PATH"})
     return rule_runner
 
 
+@pytest.fixture
+def rule_runner(package_manager: str) -> RuleRunner:
+    return create_rule_runner(package_manager)
+
+
 _LOCKFILE_FILE_NAMES = {
     "pnpm": "pnpm-lock.yaml",
     "npm": "package-lock.json",
@@ -160,6 +165,65 @@ def test_jest_tests_are_successful(
     assert result.exit_code == 0
 
 
+def test_jest_test_script_extra_caches_are_append_only_caches(
+    package_manager: str, jest_lockfile: dict[str, str], tmp_path: Path
+) -> None:
+    named_caches_dir = tmp_path / "named_caches"
+    rule_runner = create_rule_runner(
+        package_manager, bootstrap_args=[f"--named-caches-dir={named_caches_dir}"]
+    )
+    rule_runner.write_files(
+        {
+            "foo/BUILD": textwrap.dedent(
+                """\
+                package_json(
+                    scripts=[
+                        node_test_script(entry_point="jest-test", extra_caches=[".jest-cache"]),
+                    ]
+                )
+                """
+            ),
+            "foo/package.json": given_package_json(
+                test_script={
+                    "jest-test": (
+                        "NODE_OPTIONS=--experimental-vm-modules jest --cacheDirectory .jest-cache"
+                    )
+                },
+                runner={"jest": "^29.5"},
+            ),
+            **{f"foo/{key}": value for key, value in jest_lockfile.items()},
+            "foo/src/BUILD": "javascript_sources()",
+            "foo/src/index.mjs": _SOURCE_TO_TEST,
+            "foo/src/tests/BUILD": "javascript_tests(name='tests')",
+            "foo/src/tests/index.test.js": textwrap.dedent(
+                """\
+                /**
+                 * @jest-environment node
+                 */
+
+                import { expect } from "@jest/globals"
+
+                import { add } from "../index.mjs"
+
+                test('adds 1 + 2 to equal 3', () => {
+                    expect(add(1, 2)).toBe(3);
+                });
+                """
+            ),
+        }
+    )
+    tgt = rule_runner.get_target(Address("foo/src/tests", relative_file_path="index.test.js"))
+    package = rule_runner.get_target(Address("foo", generated_name="pkg"))
+    result = rule_runner.request(TestResult, [given_request_for(tgt, package=package)])
+    assert result.exit_code == 0
+
+    # The cache is named after the package, the test script and the cache directory, and outlives
+    # the sandbox of the test run.
+    jest_cache = named_caches_dir / "foo_jest_test__jest_cache"
+    assert jest_cache.is_dir()
+    assert any(jest_cache.iterdir())
+
+
 def test_batched_jest_tests_are_successful(
     rule_runner: RuleRunner, jest_lockfile: dict[str, str]
 ) -> None:
@@ -247,6 +311,43 @@ def test_mocha_tests_are_successful(
     assert result.exit_code == 0
 
 
+def test_mocha_tests_are_successful_with_project_wide_install(
+    mocha_lockfile: dict[str, str], rule_runner: RuleRunner, package_manager: str
+) -> None:
+    rule_runner.set_options(
+        [f"--nodejs-package-manager={package_manager}", "--nodejs-project-wide-install"],
+        env_inherit={"PATH"},
+    )
+    rule_runner.write_files(
+        {
+            "foo/BUILD": "package_json()",
+            "foo/package.json": given_package_json(
+                test_script={"test": "mocha"}, runner={"mocha": "^10.2.0"}
+            ),
+            **{f"foo/{key}": value for key, value in mocha_lockfile.items()},
+            "foo/src/BUILD": "javascript_sources()",
+            "foo/src/index.mjs": _SOURCE_TO_TEST,
+            "foo/src/tests/BUILD": "javascript_tests(name='tests')",
+            "foo/src/tests/index.test.mjs": textwrap.dedent(
+                """\
+                import assert from "assert"
+
+                import { add } from "../index.mjs"
+
+                it('adds 1 + 2 to equal 3', () => {
+                    assert.equal(add(1, 2), 3);
+                });
+                """
+            ),
+        }
+    )
+    tgt = rule_runner.get_target(Address("foo/src/tests", relative_file_path="index.test.mjs"))
+    package = rule_runner.get_target(Address("foo", generated_name="pkg"))
+    result = rule_runner.request(TestResult, [given_request_for(tgt, package=package)])
+    assert b"1 passing" in result.stdout_bytes
+    assert result.exit_code == 0
+
+
 def test_jest_test_with_coverage_reporting(
     package_manager: str, rule_runner: RuleRunner, jest_lockfile: dict[str, str]
 ) -> None:
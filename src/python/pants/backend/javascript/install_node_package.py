@@ -9,6 +9,7 @@ from typing import Iterable
 
 from pants.backend.javascript import nodejs_project_environment
 from pants.backend.javascript.dependency_inference.rules import rules as dependency_inference_rules
+from pants.backend.javascript.nodejs_project import NodeJSProject
 from pants.backend.javascript.nodejs_project_environment import (
     NodeJsProjectEnvironment,
     NodeJsProjectEnvironmentProcess,
@@ -20,6 +21,7 @@ from pants.backend.javascript.package_json import (
     PackageJsonSourceField,
 )
 from pants.backend.javascript.subsystems import nodejs
+from pants.backend.javascript.subsystems.nodejs import NodeJS
 from pants.backend.javascript.target_types import JSSourceField
 from pants.build_graph.address import Address
 from pants.core.target_types import FileSourceField, ResourceSourceField
@@ -36,6 +38,7 @@ from pants.engine.target import (
     targets_with_sources_types,
 )
 from pants.engine.unions import UnionMembership, UnionRule
+from pants.util.dirutil import fast_relpath
 
 
 @dataclass(frozen=True)
@@ -65,6 +68,18 @@ class InstalledNodePackageWithSource(InstalledNodePackage):
     pass
 
 
+@dataclass(frozen=True)
+class InstalledNodeJSProjectRequest:
+    project: NodeJSProject
+
+
+@dataclass(frozen=True)
+class InstalledNodeJSProject:
+    """The `node_modules` directories of all workspaces in a project, installed at once."""
+
+    digest: Digest
+
+
 async def _get_relevant_source_files(
     sources: Iterable[SourcesField], with_js: bool = False
 ) -> SourceFiles:
@@ -79,9 +94,30 @@ async def _get_relevant_source_files(
     )
 
 
+@rule
+async def install_nodejs_project(req: InstalledNodeJSProjectRequest) -> InstalledNodeJSProject:
+    project_env = NodeJsProjectEnvironment.from_root(req.project)
+    node_modules_directories = {
+        os.path.join(fast_relpath(workspace.root_dir, req.project.root_dir), "node_modules")
+        for workspace in req.project.workspaces
+    }
+    install_result = await Get(
+        ProcessResult,
+        NodeJsProjectEnvironmentProcess(
+            project_env,
+            req.project.immutable_install_args,
+            description=f"Installing the Node.js project at {req.project.root_dir or 'the build root'}.",
+            output_directories=tuple(sorted(node_modules_directories)),
+        ),
+    )
+    return InstalledNodeJSProject(
+        await Get(Digest, AddPrefix(install_result.output_digest, req.project.root_dir))
+    )
+
+
 @rule
 async def install_node_packages_for_address(
-    req: InstalledNodePackageRequest, union_membership: UnionMembership
+    req: InstalledNodePackageRequest, union_membership: UnionMembership, nodejs: NodeJS
 ) -> InstalledNodePackage:
     project_env = await Get(NodeJsProjectEnvironment, NodeJSProjectEnvironmentRequest(req.address))
     target = project_env.ensure_target()
@@ -110,17 +146,25 @@ async def install_node_packages_for_address(
         ),
     )
 
-    install_result = await Get(
-        ProcessResult,
-        NodeJsProjectEnvironmentProcess(
-            project_env,
-            project_env.project.immutable_install_args,
-            description=f"Installing {target[NodePackageNameField].value}@{target[NodePackageVersionField].value}.",
-            input_digest=install_input_digest,
-            output_directories=tuple(project_env.node_modules_directories),
-        ),
-    )
-    node_modules = await Get(Digest, AddPrefix(install_result.output_digest, project_env.root_dir))
+    if nodejs.project_wide_install:
+        installed_project = await Get(
+            InstalledNodeJSProject, InstalledNodeJSProjectRequest(project_env.project)
+        )
+        node_modules = installed_project.digest
+    else:
+        install_result = await Get(
+            ProcessResult,
+            NodeJsProjectEnvironmentProcess(
+                project_env,
+                project_env.project.immutable_install_args,
+                description=f"Installing {target[NodePackageNameField].value}@{target[NodePackageVersionField].value}.",
+                input_digest=install_input_digest,
+                output_directories=tuple(project_env.node_modules_directories),
+            ),
+        )
+        node_modules = await Get(
+            Digest, AddPrefix(install_result.output_digest, project_env.root_dir)
+        )
     return InstalledNodePackage(
         project_env,
         digest=await Get(Digest, MergeDigests([install_input_digest, node_modules])),
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os.path
+import re
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 
@@ -28,6 +29,8 @@ from pants.util.dirutil import fast_relpath
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 
+_NOT_ALPHANUMERIC = re.compile("[^0-9a-zA-Z]+")
+
 
 @dataclass(frozen=True)
 class NodeJSProjectEnvironmentRequest:
@@ -70,6 +73,15 @@ class NodeJsProjectEnvironment:
         else:
             return self.root_dir
 
+    def script_caches(self, script: str, cache_paths: Iterable[str]) -> FrozenDict[str, str]:
+        """Name the given cache directories of a script, for use as `per_package_caches`."""
+
+        def cache_name(cache_path: str) -> str:
+            parts = (self.package_dir(), script, cache_path)
+            return "_".join(_NOT_ALPHANUMERIC.sub("_", part) for part in parts if part)
+
+        return FrozenDict({cache_name(cache_path): cache_path for cache_path in cache_paths})
+
     def relative_workspace_directory(self) -> str:
         target = self.ensure_target()
         from_root_to_workspace = fast_relpath(target.residence_dir, self.root_dir)
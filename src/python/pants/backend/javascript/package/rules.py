@@ -2,7 +2,6 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from typing import ClassVar, Iterable
 
@@ -40,7 +39,6 @@ from pants.engine.process import ProcessResult
 from pants.engine.rules import Rule, collect_rules, rule
 from pants.engine.target import GeneratedSources, GenerateSourcesRequest
 from pants.engine.unions import UnionRule
-from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.strutil import softwrap
 
@@ -115,9 +113,6 @@ async def pack_node_package_into_tgz_for_publication(
     )
 
 
-_NOT_ALPHANUMERIC = re.compile("[^0-9a-zA-Z]+")
-
-
 @dataclass(frozen=True)
 class NodeBuildScriptResult:
     process: ProcessResult
@@ -188,10 +183,6 @@ async def run_node_build_script(req: NodeBuildScriptRequest) -> NodeBuildScriptR
     extra_caches = req.extra_caches
     extra_env_vars = req.extra_env_vars
 
-    def cache_name(cache_path: str) -> str:
-        parts = (installation.project_env.package_dir(), script_name, cache_path)
-        return "_".join(_NOT_ALPHANUMERIC.sub("_", part) for part in parts if part)
-
     args = ("run", script_name)
     target_env_vars = await Get(EnvironmentVars, EnvironmentVarsRequest(extra_env_vars))
     result = await Get(
@@ -209,8 +200,8 @@ async def run_node_build_script(req: NodeBuildScriptRequest) -> NodeBuildScriptR
                 for directory in output_dirs or ()
             ),
             level=LogLevel.INFO,
-            per_package_caches=FrozenDict(
-                {cache_name(extra_cache): extra_cache for extra_cache in extra_caches or ()}
+            per_package_caches=installation.project_env.script_caches(
+                script_name, extra_caches or ()
             ),
             extra_env=target_env_vars,
         ),
@@ -142,11 +142,19 @@ class NodeTestScript(NodeScript):
         coverage_output_files: Iterable[str] = (),
         coverage_output_directories: Iterable[str] = (),
         coverage_entry_point: str | None = None,
+        extra_caches: Iterable[str] = (),
     ) -> NodeTestScript:
         """The test script for this package, mapped from the `scripts` section of a package.json
         file. The pointed to script should accept a variadic number of ([ARG]...) path arguments.
 
         This entry point is the "test" script, by default.
+
+        Directories in `extra_caches` (relative to the package) are kept between test runs, e.g.
+        for Jest's `cacheDirectory`, so that transformed sources can be reused.
+
+        When test files are batched (see `batch_compatibility_tag`), the script runs once for the
+        whole batch, and its output, exit code and coverage are reported for the batch as a whole:
+        per-file results are not split back out of the test runner's output.
         """
         return cls(
             entry_point=entry_point,
@@ -157,6 +165,7 @@ class NodeTestScript(NodeScript):
             coverage_output_files=tuple(coverage_output_files),
             coverage_output_directories=tuple(coverage_output_directories),
             coverage_entry_point=coverage_entry_point,
+            extra_caches=tuple(extra_caches),
         )
 
     def supports_coverage(self) -> bool:
@@ -637,6 +646,11 @@ class OwningNodePackageRequest:
     address: Address
 
 
+@dataclass(frozen=True)
+class _OwningNodePackageForDirectoryRequest:
+    directory: str
+
+
 @dataclass(frozen=True)
 class OwningNodePackage:
     target: Target | None = None
@@ -655,10 +669,21 @@ class OwningNodePackage:
 
 @rule
 async def find_owning_package(request: OwningNodePackageRequest) -> OwningNodePackage:
+    # The owner only depends on the directory of the address, so share the lookup between all
+    # addresses (e.g. the files of a `javascript_sources` target) in a directory.
+    return await Get(
+        OwningNodePackage, _OwningNodePackageForDirectoryRequest(request.address.spec_path)
+    )
+
+
+@rule
+async def find_owning_package_for_directory(
+    request: _OwningNodePackageForDirectoryRequest,
+) -> OwningNodePackage:
     candidate_targets = await Get(
         Targets,
         RawSpecs(
-            ancestor_globs=(AncestorGlobSpec(request.address.spec_path),),
+            ancestor_globs=(AncestorGlobSpec(request.directory),),
             description_of_origin=f"the `{OwningNodePackage.__name__}` rule",
         ),
     )
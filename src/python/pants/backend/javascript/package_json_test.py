@@ -199,7 +199,11 @@ def test_can_specify_custom_test_script_field(
                 package_json(
                     scripts=[
                         node_build_script(entry_point="build", output_directories=["www/"]),
-                        node_test_script(entry_point="jest-test", coverage_args=["--coverage"]),
+                        node_test_script(
+                            entry_point="jest-test",
+                            coverage_args=["--coverage"],
+                            extra_caches=[".jest-cache"],
+                        ),
                     ]
                 )
                 """
@@ -215,7 +219,7 @@ def test_can_specify_custom_test_script_field(
     )
     tgt = rule_runner.get_target(Address("src/js", generated_name="ham"))
     assert tgt[NodePackageTestScriptField].value == NodeTestScript(
-        entry_point="jest-test", coverage_args=("--coverage",)
+        entry_point="jest-test", coverage_args=("--coverage",), extra_caches=(".jest-cache",)
     )
 
 
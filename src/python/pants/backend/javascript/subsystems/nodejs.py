@@ -46,7 +46,13 @@ from pants.engine.platform import Platform
 from pants.engine.process import Process, ProcessResult
 from pants.engine.rules import Get, Rule, collect_rules, rule
 from pants.engine.unions import UnionRule
-from pants.option.option_types import DictOption, ShellStrListOption, StrListOption, StrOption
+from pants.option.option_types import (
+    BoolOption,
+    DictOption,
+    ShellStrListOption,
+    StrListOption,
+    StrOption,
+)
 from pants.option.subsystem import Subsystem
 from pants.util.docutil import bin_name
 from pants.util.frozendict import FrozenDict
@@ -152,6 +158,26 @@ class NodeJS(Subsystem, TemplatedExternalToolOptionsMixin):
         ),
     )
 
+    project_wide_install = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, install the dependencies of every workspace in a Node.js project at once, and
+            share the resulting `node_modules` directories between all of the project's packages.
+
+            By default, each `package_json` target is installed separately, which in a project with
+            many workspaces re-runs the package manager (and captures its `node_modules`) once per
+            package. With this option, the install runs once per version of the project's lockfile
+            and `package.json` files.
+
+            Only the `package.json` files and lockfile are available to the install, so projects
+            whose packages need other sources during install (e.g., for lifecycle scripts) should
+            leave this disabled.
+            """
+        ),
+        advanced=True,
+    )
+
     @property
     def default_package_manager(self) -> str | None:
         if self.package_manager in self.package_managers:
@@ -125,7 +125,9 @@ async def compile_kotlin_source(
     local_kotlinc_plugins_relpath = "__localplugincp"
     usercp = "__cp"
 
-    user_classpath = Classpath(direct_dependency_classpath_entries, request.resolve)
+    user_classpath = Classpath(
+        ClasspathEntry.for_compilation(direct_dependency_classpath_entries), request.resolve
+    )
 
     tool_classpath, sources_digest, jdk = await MultiGet(
         Get(
@@ -159,11 +161,15 @@ async def compile_kotlin_source(
         Get(JdkEnvironment, JdkRequest, JdkRequest.from_target(request.component)),
     )
 
+    # The nailgun server (which stays warm across compiles) is keyed only by the JDK and the
+    # compiler's classpath, so that a single server is shared by every target using a particular
+    # version of Kotlin. Plugins are loaded by the compiler for each invocation, and so are
+    # provided alongside the user classpath rather than as part of the server's key.
     extra_immutable_input_digests = {
         toolcp_relpath: tool_classpath.digest,
-        local_kotlinc_plugins_relpath: local_plugins.classpath.digest,
     }
     extra_nailgun_keys = tuple(extra_immutable_input_digests)
+    extra_immutable_input_digests[local_kotlinc_plugins_relpath] = local_plugins.classpath.digest
     extra_immutable_input_digests.update(user_classpath.immutable_inputs(prefix=usercp))
 
     classpath_arg = ":".join(user_classpath.immutable_inputs_args(prefix=usercp))
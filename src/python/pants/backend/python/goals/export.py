@@ -4,13 +4,21 @@
 from __future__ import annotations
 
 import dataclasses
+import itertools
+import json
 import logging
 import os
 import uuid
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, Mapping
 
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+from packaging.utils import canonicalize_name as canonicalize_project_name
+
+from pants.backend.python.subsystems.repos import PythonRepos
 from pants.backend.python.subsystems.setup import PythonSetup
 from pants.backend.python.target_types import PexLayout
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
@@ -18,10 +26,22 @@ from pants.backend.python.util_rules.local_dists_pep660 import (
     EditableLocalDists,
     EditableLocalDistsRequest,
 )
+from pants.backend.python.util_rules.lockfile_diff import (
+    PythonRequirementVersion,
+    parse_lockfile,
+    pex_lockfile_requirements,
+)
 from pants.backend.python.util_rules.pex import Pex, PexProcess, PexRequest, VenvPex, VenvPexProcess
 from pants.backend.python.util_rules.pex_cli import PexPEX
-from pants.backend.python.util_rules.pex_environment import PexEnvironment
-from pants.backend.python.util_rules.pex_requirements import EntireLockfile, Lockfile
+from pants.backend.python.util_rules.pex_environment import PexEnvironment, PythonExecutable
+from pants.backend.python.util_rules.pex_requirements import (
+    EntireLockfile,
+    LoadedLockfile,
+    LoadedLockfileRequest,
+    Lockfile,
+    PexRequirements,
+)
+from pants.base.build_root import BuildRoot
 from pants.core.goals.export import (
     Export,
     ExportError,
@@ -31,13 +51,17 @@ from pants.core.goals.export import (
     ExportSubsystem,
     PostProcessingCommand,
 )
+from pants.core.goals.generate_lockfiles import LockfileDiff, LockfilePackages
+from pants.core.util_rules.distdir import DistDir
 from pants.engine.engine_aware import EngineAwareParameter
+from pants.engine.fs import CreateDigest, FileContent
 from pants.engine.internals.native_engine import AddPrefix, Digest, MergeDigests, Snapshot
 from pants.engine.internals.selectors import Get, MultiGet
+from pants.engine.internals.session import RunId
 from pants.engine.process import ProcessCacheScope, ProcessResult
 from pants.engine.rules import collect_rules, rule
 from pants.engine.unions import UnionRule
-from pants.option.option_types import EnumOption, StrListOption
+from pants.option.option_types import BoolOption, EnumOption, StrListOption
 from pants.util.strutil import path_safe, softwrap
 
 logger = logging.getLogger(__name__)
@@ -100,6 +124,37 @@ class ExportPluginOptions:
         advanced=True,
     )
 
+    py_incremental_export = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            When exporting a mutable virtualenv for a resolve, update a previously exported
+            virtualenv in place rather than rebuilding it from scratch.
+
+            Pants records the lockfile, the interpreter and the locked distributions of each
+            virtualenv it exports. On the next export, those distributions are diffed against the
+            resolve's current lockfile, and only the added, removed, upgraded and downgraded
+            distributions are uninstalled and/or installed, using the virtualenv's `pip` with the
+            hashes from the lockfile and the indexes and find-links from `[python-repos]`.
+
+            A full export is still done if there is no recorded previous export (e.g. the first
+            time, or after a failed update), if the interpreter changed, if the lockfile changed
+            without changing any locked version, if a changed distribution is only required in some
+            environments (e.g. under an environment marker or on some platforms), if the resolve
+            does not use a Pex lockfile, or if `[export].py_editable_in_resolve` includes the
+            resolve.
+
+            This only applies when exporting a 'mutable_virtualenv'.
+            """
+        ),
+        advanced=True,
+    )
+
+
+# The file, relative to the root of an exported mutable virtualenv, recording the locked
+# distributions installed into it. Used by `[export].py_incremental_export`.
+_EXPORTED_VENV_MANIFEST = ".pants-export-manifest.json"
+
 
 async def _get_full_python_version(pex_or_venv_pex: Pex | VenvPex) -> str:
     # Get the full python version (including patch #).
@@ -130,12 +185,340 @@ class VenvExportRequest:
     editable_local_dists_digest: Digest | None = None
 
 
+@dataclass(frozen=True)
+class _ExportedVenvManifestRequest:
+    # The path, relative to the build root, to the manifest of a previously exported virtualenv.
+    path: str
+
+
+@dataclass(frozen=True)
+class _ExportedVenvManifest:
+    # The fingerprint of the loaded lockfile which the virtualenv was exported from.
+    lockfile_digest: str
+    # The path to the virtualenv's interpreter, and its full version.
+    interpreter: str
+    python_version: str
+    packages: LockfilePackages
+
+    @classmethod
+    def parse(cls, content: bytes) -> _ExportedVenvManifest:
+        manifest = json.loads(content)
+        return cls(
+            lockfile_digest=manifest["lockfile_digest"],
+            interpreter=manifest["interpreter"],
+            python_version=manifest["python_version"],
+            packages=LockfilePackages(
+                {
+                    name: PythonRequirementVersion.parse(version)
+                    for name, version in manifest["packages"].items()
+                }
+            ),
+        )
+
+    def serialize(self) -> bytes:
+        return json.dumps(
+            {
+                "lockfile_digest": self.lockfile_digest,
+                "interpreter": self.interpreter,
+                "python_version": self.python_version,
+                "packages": {name: str(version) for name, version in self.packages.items()},
+            },
+            indent=2,
+            sort_keys=True,
+        ).encode()
+
+
+@dataclass(frozen=True)
+class _MaybeExportedVenvManifest:
+    # None if there is no readable manifest, in which case the virtualenv must be fully exported.
+    manifest: _ExportedVenvManifest | None
+
+
+@rule
+async def read_exported_venv_manifest(
+    request: _ExportedVenvManifestRequest, build_root: BuildRoot, run_id: RunId
+) -> _MaybeExportedVenvManifest:
+    # NB: The manifest lives under the distdir, which the engine ignores, so it can't be read via
+    #  `PathGlobs`. Like the `export` goal which writes it, we access the workspace directly, and
+    #  depend on the `RunId` so that it is re-read on every run rather than memoized.
+    path = os.path.join(build_root.path, request.path)
+    try:
+        with open(path, "rb") as fp:
+            content = fp.read()
+    except OSError:
+        return _MaybeExportedVenvManifest(None)
+    try:
+        manifest = _ExportedVenvManifest.parse(content)
+    except (ValueError, KeyError, AttributeError, TypeError) as e:
+        logger.debug(f"{request.path}: Failed to parse exported virtualenv manifest: {e}")
+        return _MaybeExportedVenvManifest(None)
+    return _MaybeExportedVenvManifest(manifest)
+
+
+def _exported_venv_diff(
+    old: _ExportedVenvManifest | None,
+    new: _ExportedVenvManifest,
+    path: str,
+    resolve_name: str,
+) -> LockfileDiff | None:
+    """Diff the distributions of a previously exported virtualenv against the current lockfile.
+
+    Returns None if the virtualenv must be exported from scratch instead: if it was not exported
+    by Pants, if its interpreter changed, or if the lockfile changed in a way which the locked
+    versions do not show (e.g. re-locked artifacts), which updating in place would miss.
+    """
+    if old is None:
+        return None
+    if (old.interpreter, old.python_version) != (new.interpreter, new.python_version):
+        return None
+    diff = LockfileDiff.create(
+        path=path, resolve_name=resolve_name, old=old.packages, new=new.packages
+    )
+    unchanged_versions = not any((diff.added, diff.removed, diff.upgraded, diff.downgraded))
+    if unchanged_versions and old.lockfile_digest != new.lockfile_digest:
+        return None
+    return diff
+
+
+async def _lockfile_digest(lockfile: Lockfile) -> str:
+    loaded = await Get(LoadedLockfile, LoadedLockfileRequest(lockfile))
+    return loaded.lockfile_digest.fingerprint
+
+
+def _locked_requirements_txt(lockfile_data: Mapping[str, Any], names: set[str]) -> bytes | None:
+    """Render the named locked requirements as a hash-checked requirements file.
+
+    A requirement locked by several resolves (e.g. for several platforms) is rendered once, with
+    the hashes of all of its artifacts.
+
+    Returns None if any of them cannot be pinned by hash (e.g. VCS requirements), or is locked at
+    different versions by different resolves.
+    """
+    locked_hashes: dict[str, tuple[str, set[str]]] = {}
+    for locked_resolve in lockfile_data["locked_resolves"]:
+        for locked in locked_resolve["locked_requirements"]:
+            if locked["project_name"] not in names:
+                continue
+            hashes = [
+                f"--hash={artifact['algorithm']}:{artifact['hash']}"
+                for artifact in locked["artifacts"]
+                if artifact.get("algorithm") and artifact.get("hash")
+            ]
+            if not hashes or len(hashes) != len(locked["artifacts"]):
+                return None
+            version, all_hashes = locked_hashes.setdefault(
+                locked["project_name"], (locked["version"], set())
+            )
+            if version != locked["version"]:
+                return None
+            all_hashes.update(hashes)
+    return "".join(
+        " ".join([f"{name}=={version}", *sorted(hashes)]) + "\n"
+        for name, (version, hashes) in sorted(locked_hashes.items())
+    ).encode()
+
+
+def _conditionally_locked(lockfile_data: Mapping[str, Any], python_version: str) -> set[str] | None:
+    """The locked requirements which a full export may not install with the given interpreter.
+
+    Those are the requirements which are only locked for some platforms, which are only reachable
+    from the lockfile's requirements through environment markers (including extras), or whose
+    `requires_python` the interpreter does not satisfy. We don't evaluate the markers, so this
+    errs on the side of including requirements which a full export would install after all.
+
+    Returns None if the lockfile cannot be analyzed.
+    """
+    try:
+        locked_resolves = [
+            {locked["project_name"]: locked for locked in locked_resolve["locked_requirements"]}
+            for locked_resolve in lockfile_data["locked_resolves"]
+        ]
+        root_requirements = [Requirement(req) for req in lockfile_data["requirements"]]
+        locked_deps: defaultdict[str, list[Requirement]] = defaultdict(list)
+        for locked_resolve in locked_resolves:
+            for name, locked in locked_resolve.items():
+                locked_deps[name].extend(
+                    Requirement(dep) for dep in locked.get("requires_dists") or ()
+                )
+        requires_pythons = {
+            name: SpecifierSet(locked["requires_python"])
+            for locked_resolve in locked_resolves
+            for name, locked in locked_resolve.items()
+            if locked.get("requires_python")
+        }
+    except (KeyError, TypeError, InvalidRequirement, InvalidSpecifier) as e:
+        logger.debug(f"Failed to analyze lockfile requirements: {e}")
+        return None
+
+    # Requirements which some resolves lock and others don't are platform-specific.
+    all_names = set(itertools.chain.from_iterable(locked_resolves))
+    conditional = {
+        name
+        for name in all_names
+        if not all(name in locked_resolve for locked_resolve in locked_resolves)
+    }
+    conditional.update(
+        name
+        for name, requires_python in requires_pythons.items()
+        if not requires_python.contains(python_version, prereleases=True)
+    )
+    # Everything not reachable through unconditional requirements depends on the environment.
+    unconditional: set[str] = set()
+    to_visit = [
+        canonicalize_project_name(req.name) for req in root_requirements if req.marker is None
+    ]
+    while to_visit:
+        name = to_visit.pop()
+        if name in unconditional or name not in all_names:
+            continue
+        unconditional.add(name)
+        to_visit.extend(
+            canonicalize_project_name(dep.name) for dep in locked_deps[name] if dep.marker is None
+        )
+    conditional.update(all_names - unconditional)
+    return conditional
+
+
+def _pip_repos_args(python_repos: PythonRepos) -> list[str]:
+    args = []
+    if python_repos.indexes:
+        index, *extra_indexes = python_repos.indexes
+        args.append(f"--index-url={index}")
+        args.extend(f"--extra-index-url={extra_index}" for extra_index in extra_indexes)
+    else:
+        args.append("--no-index")
+    args.extend(f"--find-links={find_links}" for find_links in python_repos.find_links)
+    return args
+
+
+async def _update_exported_venv_in_place(
+    req: VenvExportRequest,
+    dest: str,
+    description: str,
+    interpreter: PythonExecutable,
+    python_version: str,
+    dist_dir: DistDir,
+    python_repos: PythonRepos,
+) -> ExportResult | None:
+    """Update a previously exported mutable virtualenv to match the current lockfile.
+
+    Returns None if the virtualenv must be exported from scratch instead.
+    """
+    requirements = req.pex_request.requirements
+    if not isinstance(requirements, EntireLockfile) or not isinstance(
+        requirements.lockfile, Lockfile
+    ):
+        return None
+    lockfile_data, lockfile_digest, maybe_manifest = await MultiGet(
+        parse_lockfile(requirements.lockfile),
+        _lockfile_digest(requirements.lockfile),
+        Get(
+            _MaybeExportedVenvManifest,
+            _ExportedVenvManifestRequest(
+                os.path.join(str(dist_dir.relpath), "export", dest, _EXPORTED_VENV_MANIFEST)
+            ),
+        ),
+    )
+    new = _ExportedVenvManifest(
+        lockfile_digest=lockfile_digest,
+        interpreter=interpreter.path,
+        python_version=python_version,
+        packages=pex_lockfile_requirements(lockfile_data, requirements.lockfile.url),
+    )
+    if not lockfile_data or not new.packages:
+        return None
+
+    diff = _exported_venv_diff(
+        maybe_manifest.manifest, new, requirements.lockfile.url, req.resolve_name
+    )
+    if diff is None:
+        return None
+    to_uninstall = sorted({*diff.removed, *diff.upgraded, *diff.downgraded})
+    to_install = sorted({*diff.added, *diff.upgraded, *diff.downgraded})
+    if not to_uninstall and not to_install:
+        return ExportResult(
+            f"{description} (already up to date)",
+            dest,
+            resolve=req.resolve_name or None,
+            preserve_existing=True,
+        )
+
+    # Updating requirements which only apply to some environments could install what a full export
+    # wouldn't, so we leave that to one.
+    conditional = _conditionally_locked(lockfile_data, python_version)
+    if conditional is None or conditional.intersection(to_install, to_uninstall):
+        return None
+
+    requirements_txt = _locked_requirements_txt(lockfile_data, set(to_install))
+    if requirements_txt is None:
+        return None
+
+    output_path = "{digest_root}"
+    tmpdir_prefix = f".{uuid.uuid4().hex}.tmp"
+    tmpdir_under_digest_root = os.path.join(output_path, tmpdir_prefix)
+    manifest_path = os.path.join(output_path, _EXPORTED_VENV_MANIFEST)
+    pip = os.path.join(output_path, "bin", "pip")
+    digest = await Get(
+        Digest,
+        CreateDigest(
+            [
+                FileContent(os.path.join(tmpdir_prefix, "requirements.txt"), requirements_txt),
+                FileContent(os.path.join(tmpdir_prefix, _EXPORTED_VENV_MANIFEST), new.serialize()),
+            ]
+        ),
+    )
+
+    post_processing_cmds = [
+        # Remove the manifest first, so that an interrupted update leads to a full export next time.
+        PostProcessingCommand(["rm", "-f", manifest_path]),
+    ]
+    if to_uninstall:
+        post_processing_cmds.append(PostProcessingCommand([pip, "uninstall", "-y", *to_uninstall]))
+    if to_install:
+        post_processing_cmds.append(
+            PostProcessingCommand(
+                [
+                    pip,
+                    "install",
+                    "--no-deps",  # The lockfile is a complete closure, so deps are accounted for.
+                    "--require-hashes",
+                    *_pip_repos_args(python_repos),
+                    "-r",
+                    os.path.join(tmpdir_under_digest_root, "requirements.txt"),
+                ]
+            )
+        )
+    post_processing_cmds.extend(
+        [
+            PostProcessingCommand(
+                [
+                    "mv",
+                    os.path.join(tmpdir_under_digest_root, _EXPORTED_VENV_MANIFEST),
+                    manifest_path,
+                ]
+            ),
+            PostProcessingCommand(["rm", "-rf", tmpdir_under_digest_root]),
+        ]
+    )
+    return ExportResult(
+        f"{description} (updated in place: {len(to_install)} installed, "
+        f"{len(to_uninstall)} uninstalled)",
+        dest,
+        digest=digest,
+        post_processing_cmds=post_processing_cmds,
+        resolve=req.resolve_name or None,
+        preserve_existing=True,
+    )
+
+
 @rule
 async def do_export(
     req: VenvExportRequest,
     pex_pex: PexPEX,
     pex_env: PexEnvironment,
     export_subsys: ExportSubsystem,
+    dist_dir: DistDir,
+    python_repos: PythonRepos,
 ) -> ExportResult:
     if not req.pex_request.internal_only:
         raise ExportError(f"The PEX to be exported for {req.resolve_name} must be internal_only.")
@@ -186,6 +569,40 @@ async def do_export(
             resolve=req.resolve_name or None,
         )
     elif export_format == PythonResolveExportFormat.mutable_virtualenv:
+        incremental = (
+            export_subsys.options.py_incremental_export and req.editable_local_dists_digest is None
+        )
+        if incremental:
+            # Locating the existing export only requires the interpreter version, so we avoid
+            # building the (potentially very large) requirements pex unless we need it.
+            interpreter_pex = await Get(
+                Pex,
+                PexRequest,
+                dataclasses.replace(
+                    req.pex_request,
+                    output_filename="interpreter.pex",
+                    requirements=PexRequirements(),
+                    sources=None,
+                    description=f"Select the interpreter for {req.resolve_name or 'requirements'}",
+                ),
+            )
+            assert interpreter_pex.python is not None
+            py_version = await _get_full_python_version(interpreter_pex)
+            update_result = await _update_exported_venv_in_place(
+                req,
+                f"{dest_prefix}/{py_version}"
+                if req.qualify_path_with_python_version
+                else dest_prefix,
+                f"mutable virtualenv for {req.resolve_name or 'requirements'} "
+                f"(using Python {py_version})",
+                interpreter_pex.python,
+                py_version,
+                dist_dir,
+                python_repos,
+            )
+            if update_result is not None:
+                return update_result
+
         # Note that an internal-only pex will always have the `python` field set.
         # See the build_pex() rule and _determine_pex_python_and_platforms() helper in pex.py.
         requirements_pex = await Get(Pex, PexRequest, req.pex_request)
@@ -286,6 +703,52 @@ async def do_export(
                 ),
             ]
 
+        # Record the installed distributions, so that later exports can update them in place.
+        if incremental:
+            requirements = req.pex_request.requirements
+            lockfile_data, lockfile_digest = (
+                await MultiGet(
+                    parse_lockfile(requirements.lockfile),
+                    _lockfile_digest(requirements.lockfile),
+                )
+                if isinstance(requirements, EntireLockfile)
+                and isinstance(requirements.lockfile, Lockfile)
+                else (None, None)
+            )
+            packages = pex_lockfile_requirements(lockfile_data)
+            if packages and lockfile_digest:
+                manifest = _ExportedVenvManifest(
+                    lockfile_digest=lockfile_digest,
+                    interpreter=requirements_pex.python.path,
+                    python_version=py_version,
+                    packages=packages,
+                )
+                manifest_digest = await Get(
+                    Digest,
+                    CreateDigest(
+                        [
+                            FileContent(
+                                os.path.join(tmpdir_prefix, _EXPORTED_VENV_MANIFEST),
+                                manifest.serialize(),
+                            )
+                        ]
+                    ),
+                )
+                merged_digest_under_tmpdir = await Get(
+                    Digest, MergeDigests([merged_digest_under_tmpdir, manifest_digest])
+                )
+                # Insert before the final removal of the tmpdir.
+                post_processing_cmds.insert(
+                    -1,
+                    PostProcessingCommand(
+                        [
+                            "mv",
+                            os.path.join(tmpdir_under_digest_root, _EXPORTED_VENV_MANIFEST),
+                            os.path.join(output_path, _EXPORTED_VENV_MANIFEST),
+                        ]
+                    ),
+                )
+
         return ExportResult(
             description,
             dest,
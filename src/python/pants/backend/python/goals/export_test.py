@@ -1,5 +1,9 @@
 # Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import dataclasses
 import os
 import re
 import sys
@@ -9,7 +13,16 @@ import pytest
 
 from pants.backend.python import target_types_rules
 from pants.backend.python.goals import export
-from pants.backend.python.goals.export import ExportVenvsRequest, PythonResolveExportFormat
+from pants.backend.python.goals.export import (
+    ExportVenvsRequest,
+    PythonResolveExportFormat,
+    _conditionally_locked,
+    _exported_venv_diff,
+    _ExportedVenvManifest,
+    _ExportedVenvManifestRequest,
+    _locked_requirements_txt,
+    _MaybeExportedVenvManifest,
+)
 from pants.backend.python.macros.python_artifact import PythonArtifact
 from pants.backend.python.target_types import (
     PythonDistribution,
@@ -17,9 +30,12 @@ from pants.backend.python.target_types import (
     PythonSourcesGeneratorTarget,
 )
 from pants.backend.python.util_rules import local_dists_pep660, pex_from_targets
+from pants.backend.python.util_rules.lockfile_diff import PythonRequirementVersion
 from pants.base.specs import RawSpecs
-from pants.core.goals.export import ExportResults
+from pants.core.goals.export import ExportResult, ExportResults
+from pants.core.goals.generate_lockfiles import LockfilePackages
 from pants.core.util_rules import distdir
+from pants.engine.fs import Digest, DigestContents
 from pants.engine.internals.parametrize import Parametrize
 from pants.engine.rules import QueryRule
 from pants.engine.target import Targets
@@ -38,6 +54,8 @@ def rule_runner() -> RuleRunner:
             *local_dists_pep660.rules(),
             QueryRule(Targets, [RawSpecs]),
             QueryRule(ExportResults, [ExportVenvsRequest]),
+            QueryRule(_MaybeExportedVenvManifest, [_ExportedVenvManifestRequest]),
+            QueryRule(DigestContents, [Digest]),
         ],
         target_types=[PythonRequirementTarget, PythonSourcesGeneratorTarget, PythonDistribution],
         objects={"python_artifact": PythonArtifact, "parametrize": Parametrize},
@@ -148,3 +166,309 @@ def test_export_venv_new_codepath(
         f"python/virtualenvs/a/{current_interpreter}",
         f"python/virtualenvs/b/{current_interpreter}",
     ]
+
+
+def test_export_venv_incrementally(rule_runner: RuleRunner) -> None:
+    vinfo = sys.version_info
+    current_interpreter = f"{vinfo.major}.{vinfo.minor}.{vinfo.micro}"
+    rule_runner.write_files(
+        {
+            "lock.json": dedent(
+                """\
+                // Some Pants header
+                {
+                  "allow_builds": true,
+                  "allow_prereleases": false,
+                  "allow_wheels": true,
+                  "build_isolation": true,
+                  "constraints": [],
+                  "locked_resolves": [
+                    {
+                      "locked_requirements": [
+                        {
+                          "artifacts": [
+                            {
+                              "algorithm": "sha256",
+                              "hash": "00d2dde5a675579325902536738dd27e4fac1fd68f773fe36c21044eb559e187",
+                              "url": "https://files.pythonhosted.org/packages/53/18/a56e2fe47b259bb52201093a3a9d4a32014f9d85071ad07e9d60600890ca/ansicolors-1.1.8-py2.py3-none-any.whl"
+                            },
+                            {
+                              "algorithm": "sha256",
+                              "hash": "99f94f5e3348a0bcd43c82e5fc4414013ccc19d70bd939ad71e0133ce9c372e0",
+                              "url": "https://files.pythonhosted.org/packages/76/31/7faed52088732704523c259e24c26ce6f2f33fbeff2ff59274560c27628e/ansicolors-1.1.8.zip"
+                            }
+                          ],
+                          "project_name": "ansicolors",
+                          "requires_dists": [],
+                          "requires_python": null,
+                          "version": "1.1.8"
+                        }
+                      ],
+                      "platform_tag": null
+                    }
+                  ],
+                  "pex_version": "2.1.70",
+                  "prefer_older_binary": false,
+                  "requirements": [
+                    "ansicolors"
+                  ],
+                  "requires_python": [],
+                  "resolver_version": "pip-2020-resolver",
+                  "style": "universal",
+                  "transitive": true,
+                  "use_pep517": null
+                }
+                """
+            ),
+        }
+    )
+    rule_runner.set_options(
+        [
+            f"--python-interpreter-constraints=['=={current_interpreter}']",
+            "--python-enable-resolves=True",
+            "--python-resolves={'a': 'lock.json'}",
+            "--export-resolve=a",
+            "--export-py-incremental-export",
+            # Turn off lockfile validation to make the test simpler.
+            "--python-invalid-lockfile-behavior=ignore",
+            # Turn off python synthetic lockfile targets to make the test simpler.
+            "--no-python-enable-lockfile-targets",
+        ],
+        env_inherit={"PATH", "PYENV_ROOT"},
+    )
+
+    def export(session: str) -> tuple[ExportResult, dict[str, bytes]]:
+        rule_runner.new_session(session)
+        (result,) = rule_runner.request(ExportResults, [ExportVenvsRequest(targets=())])
+        contents = rule_runner.request(DigestContents, [result.digest])
+        return result, {os.path.basename(fc.path): fc.content for fc in contents}
+
+    # Without a previous export, the virtualenv is exported from scratch, recording its manifest.
+    result, contents = export("first export")
+    assert result.reldir == f"python/virtualenvs/a/{current_interpreter}"
+    assert not result.preserve_existing
+    assert result.post_processing_cmds[-2].argv[0] == "mv"
+    assert result.post_processing_cmds[-2].argv[2] == "{digest_root}/.pants-export-manifest.json"
+    manifest = _ExportedVenvManifest.parse(contents[".pants-export-manifest.json"])
+    assert manifest.python_version == current_interpreter
+    assert {name: str(version) for name, version in manifest.packages.items()} == {
+        "ansicolors": "1.1.8"
+    }
+
+    # Pretend that the virtualenv was exported from an older lockfile.
+    manifest_path = os.path.join("dist/export", result.reldir, ".pants-export-manifest.json")
+    old_manifest = dataclasses.replace(
+        manifest,
+        packages=LockfilePackages(
+            {
+                "ansicolors": PythonRequirementVersion.parse("1.1.7"),
+                "six": PythonRequirementVersion.parse("1.16.0"),
+            }
+        ),
+    )
+    rule_runner.write_files({manifest_path: old_manifest.serialize()})
+    result, contents = export("update in place")
+    assert result.preserve_existing
+    assert "updated in place: 1 installed, 2 uninstalled" in result.description
+    argvs = [cmd.argv for cmd in result.post_processing_cmds]
+    assert argvs[0] == ("rm", "-f", "{digest_root}/.pants-export-manifest.json")
+    assert argvs[1] == ("{digest_root}/bin/pip", "uninstall", "-y", "ansicolors", "six")
+    assert argvs[2][:4] == ("{digest_root}/bin/pip", "install", "--no-deps", "--require-hashes")
+    assert argvs[3][0] == "mv"
+    assert argvs[3][2] == "{digest_root}/.pants-export-manifest.json"
+    assert contents["requirements.txt"] == (
+        b"ansicolors==1.1.8"
+        b" --hash=sha256:00d2dde5a675579325902536738dd27e4fac1fd68f773fe36c21044eb559e187"
+        b" --hash=sha256:99f94f5e3348a0bcd43c82e5fc4414013ccc19d70bd939ad71e0133ce9c372e0\n"
+    )
+    assert _ExportedVenvManifest.parse(contents[".pants-export-manifest.json"]) == manifest
+
+    # Once updated, the virtualenv is left as it is.
+    rule_runner.write_files({manifest_path: manifest.serialize()})
+    result, contents = export("up to date")
+    assert result.preserve_existing
+    assert "already up to date" in result.description
+    assert result.post_processing_cmds == ()
+    assert contents == {}
+
+
+def test_locked_requirements_txt() -> None:
+    lockfile_data = {
+        "locked_resolves": [
+            {
+                "locked_requirements": [
+                    {
+                        "project_name": "ansicolors",
+                        "version": "1.1.8",
+                        "artifacts": [
+                            {"algorithm": "sha256", "hash": "abc", "url": "https://a/b.whl"},
+                            {"algorithm": "sha256", "hash": "def", "url": "https://a/b.zip"},
+                        ],
+                    },
+                    {
+                        "project_name": "cowsay",
+                        "version": "5.0",
+                        "artifacts": [
+                            {"algorithm": "sha256", "hash": "123", "url": "https://c/d.whl"}
+                        ],
+                    },
+                    {
+                        "project_name": "vcs-dep",
+                        "version": "0.1",
+                        "artifacts": [{"url": "git+https://e/f"}],
+                    },
+                ]
+            },
+            {
+                "locked_requirements": [
+                    {
+                        "project_name": "ansicolors",
+                        "version": "1.1.8",
+                        "artifacts": [
+                            {"algorithm": "sha256", "hash": "abc", "url": "https://a/b.whl"},
+                            {"algorithm": "sha256", "hash": "ghi", "url": "https://a/c.whl"},
+                        ],
+                    },
+                    {
+                        "project_name": "cowsay",
+                        "version": "6.0",
+                        "artifacts": [
+                            {"algorithm": "sha256", "hash": "456", "url": "https://c/e.whl"}
+                        ],
+                    },
+                ]
+            },
+        ]
+    }
+    # Requirements locked by several resolves are only rendered once.
+    assert _locked_requirements_txt(lockfile_data, {"ansicolors"}) == (
+        b"ansicolors==1.1.8 --hash=sha256:abc --hash=sha256:def --hash=sha256:ghi\n"
+    )
+    # Requirements that can't be pinned by hash, or only to a single version, can't be installed
+    # incrementally.
+    assert _locked_requirements_txt(lockfile_data, {"ansicolors", "vcs-dep"}) is None
+    assert _locked_requirements_txt(lockfile_data, {"ansicolors", "cowsay"}) is None
+
+
+def _locked_requirement(
+    project_name: str, *requires_dists: str, requires_python: str | None = None
+) -> dict:
+    return {
+        "project_name": project_name,
+        "version": "1.0",
+        "artifacts": [{"algorithm": "sha256", "hash": "abc", "url": "https://a/b.whl"}],
+        "requires_dists": list(requires_dists),
+        "requires_python": requires_python,
+    }
+
+
+def test_conditionally_locked() -> None:
+    lockfile_data = {
+        "requirements": ["requests[socks]", "colorama; sys_platform == 'win32'", "old"],
+        "locked_resolves": [
+            {
+                "locked_requirements": [
+                    _locked_requirement("requests", "idna>=2", 'PySocks!=1.5.7; extra == "socks"'),
+                    _locked_requirement("idna", requires_python=">=3.5"),
+                    _locked_requirement("pysocks"),
+                    _locked_requirement("colorama"),
+                    _locked_requirement("old", requires_python="<3"),
+                    _locked_requirement("appnope"),
+                ]
+            },
+            {
+                "locked_requirements": [
+                    _locked_requirement("requests", "idna>=2"),
+                    _locked_requirement("idna"),
+                    _locked_requirement("pysocks"),
+                    _locked_requirement("colorama"),
+                    _locked_requirement("old", requires_python="<3"),
+                ]
+            },
+        ],
+    }
+    assert _conditionally_locked(lockfile_data, "3.9.18") == {
+        # Only required under a marker, including for an extra.
+        "colorama",
+        "pysocks",
+        # Not compatible with the interpreter.
+        "old",
+        # Only locked for some platforms.
+        "appnope",
+    }
+    assert _conditionally_locked({"locked_resolves": []}, "3.9.18") is None
+
+
+def _manifest(
+    lockfile_digest: str = "abc",
+    interpreter: str = "/usr/bin/python3",
+    python_version: str = "3.9.18",
+    **versions: str,
+) -> _ExportedVenvManifest:
+    return _ExportedVenvManifest(
+        lockfile_digest=lockfile_digest,
+        interpreter=interpreter,
+        python_version=python_version,
+        packages=LockfilePackages(
+            {name: PythonRequirementVersion.parse(version) for name, version in versions.items()}
+        ),
+    )
+
+
+def test_read_exported_venv_manifest(rule_runner: RuleRunner) -> None:
+    manifest = _manifest(ansicolors="1.1.8", cowsay="5.0")
+    rule_runner.write_files(
+        {
+            "dist/export/a/.pants-export-manifest.json": manifest.serialize(),
+            # A manifest written before the lockfile and interpreter were recorded.
+            "dist/export/b/.pants-export-manifest.json": '{"packages": {"cowsay": "5.0"}}',
+            "dist/export/c/.pants-export-manifest.json": "not json",
+        }
+    )
+
+    def read(venv: str) -> _ExportedVenvManifest | None:
+        path = os.path.join("dist/export", venv, ".pants-export-manifest.json")
+        return rule_runner.request(
+            _MaybeExportedVenvManifest, [_ExportedVenvManifestRequest(path)]
+        ).manifest
+
+    assert read("a") == manifest
+    assert read("b") is None
+    assert read("c") is None
+    assert read("missing") is None
+
+
+def test_exported_venv_diff() -> None:
+    old = _manifest(ansicolors="1.1.7", cowsay="5.0", six="1.16.0")
+
+    def diff(new: _ExportedVenvManifest) -> dict[str, list[str]] | None:
+        result = _exported_venv_diff(old, new, "lock.txt", "a")
+        if result is None:
+            return None
+        return {
+            "added": sorted(result.added),
+            "removed": sorted(result.removed),
+            "upgraded": sorted(result.upgraded),
+            "downgraded": sorted(result.downgraded),
+        }
+
+    # Only the changed distributions are updated in place.
+    assert diff(_manifest("def", ansicolors="1.1.8", cowsay="5.0", colors="1.0")) == {
+        "added": ["colors"],
+        "removed": ["six"],
+        "upgraded": ["ansicolors"],
+        "downgraded": [],
+    }
+    # An unchanged lockfile leaves the virtualenv as it is.
+    assert diff(_manifest(ansicolors="1.1.7", cowsay="5.0", six="1.16.0")) == {
+        "added": [],
+        "removed": [],
+        "upgraded": [],
+        "downgraded": [],
+    }
+    # A changed interpreter, or a lockfile change which no locked version shows, needs a full
+    # export, as does a virtualenv without a manifest.
+    assert diff(_manifest("def", ansicolors="1.1.7", cowsay="5.0", six="1.16.0")) is None
+    assert diff(_manifest(python_version="3.9.19", ansicolors="1.1.8")) is None
+    assert diff(_manifest(interpreter="/opt/python3", ansicolors="1.1.8")) is None
+    assert _exported_venv_diff(None, old, "lock.txt", "a") is None
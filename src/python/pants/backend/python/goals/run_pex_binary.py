@@ -1,14 +1,16 @@
 # Copyright 2020 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import dataclasses
 import os
 
 from pants.backend.python.goals.package_pex_binary import (
     PexBinaryFieldSet,
     PexFromTargetsRequestForBuiltPackage,
 )
-from pants.backend.python.target_types import PexLayout
-from pants.backend.python.util_rules.pex_environment import PythonExecutable
+from pants.backend.python.goals.run_helper import _create_python_source_run_request
+from pants.backend.python.target_types import PexBinaryDefaults, PexLayout
+from pants.backend.python.util_rules.pex_environment import PexEnvironment, PythonExecutable
 from pants.backend.python.util_rules.pex_from_targets import InterpreterConstraintsRequest
 from pants.core.goals.package import BuiltPackage
 from pants.core.goals.run import RunRequest
@@ -17,7 +19,29 @@ from pants.util.logging import LogLevel
 
 
 @rule(level=LogLevel.DEBUG)
-async def create_pex_binary_run_request(field_set: PexBinaryFieldSet) -> RunRequest:
+async def create_pex_binary_run_request(
+    field_set: PexBinaryFieldSet, pex_binary_defaults: PexBinaryDefaults, pex_env: PexEnvironment
+) -> RunRequest:
+    if (
+        pex_binary_defaults.run_from_venv
+        and not field_set.platforms.value
+        and not field_set.complete_platforms.value
+    ):
+        # Run from a cached venv of the requirements plus the sources, without building the PEX.
+        run_request = await _create_python_source_run_request(
+            field_set.address,
+            entry_point_field=field_set.entry_point,
+            pex_env=pex_env,
+            run_in_sandbox=True,
+            console_script=field_set.script.value,
+            executable=field_set.executable.value,
+        )
+        return dataclasses.replace(
+            run_request,
+            args=(*run_request.args, *(field_set.args.value or ())),
+            extra_env={**run_request.extra_env, **(field_set.env.value or {})},
+        )
+
     pex_request = await Get(PexFromTargetsRequestForBuiltPackage, PexBinaryFieldSet, field_set)
     built_pex = await Get(BuiltPackage, PexFromTargetsRequestForBuiltPackage, pex_request)
 
@@ -168,6 +168,45 @@ def test_no_strip_pex_env_issues_12057() -> None:
         assert result.exit_code == 42, result.stderr
 
 
+def test_run_from_venv() -> None:
+    sources = {
+        "src/app.py": dedent(
+            """\
+            import os
+            import sys
+
+            if __name__ == "__main__":
+                print(" ".join(sys.argv[1:]))
+                print(os.environ["GREETING"])
+            """
+        ),
+        "src/BUILD": dedent(
+            """\
+            python_sources(name="lib")
+            pex_binary(
+                name="binary",
+                entry_point="app.py",
+                args=["--frozen"],
+                env={{"GREETING": "hello"}},
+            )
+            """
+        ),
+    }
+    with setup_tmpdir(sources) as tmpdir:
+        args = [
+            "--backend-packages=pants.backend.python",
+            f"--source-root-patterns=['/{tmpdir}/src']",
+            "--pex-binary-defaults-run-from-venv",
+            "run",
+            f"{tmpdir}/src:binary",
+            "--",
+            "--passthrough",
+        ]
+        result = run_pants(args)
+        assert result.exit_code == 0, result.stderr
+        assert result.stdout.splitlines() == ["--frozen --passthrough", "hello"]
+
+
 def test_local_dist() -> None:
     sources = {
         "foo/bar.py": "BAR = 'LOCAL DIST'",
@@ -5,9 +5,9 @@ from __future__ import annotations
 
 from typing import Sequence
 
-from pants.option.option_types import StrListOption
+from pants.option.option_types import BoolOption, StrListOption
 from pants.option.subsystem import Subsystem
-from pants.util.strutil import safe_shlex_join, safe_shlex_split
+from pants.util.strutil import safe_shlex_join, safe_shlex_split, softwrap
 
 
 class PythonNativeCodeSubsystem(Subsystem):
@@ -36,6 +36,22 @@ class PythonNativeCodeSubsystem(Subsystem):
             ),
             advanced=True,
         )
+        use_ccache = BoolOption(
+            default=False,
+            help=softwrap(
+                """
+                If true, compile the native extensions of `python_distribution` targets through
+                `ccache`, using an append-only cache shared by all such builds.
+
+                Object files are then reused across builds of a distribution whenever the
+                preprocessed source and compiler flags are unchanged, even if other inputs to
+                the build (such as unrelated Python sources) changed.
+
+                Requires a `ccache` binary on the `[system-binaries].system_binary_paths`.
+                """
+            ),
+            advanced=True,
+        )
 
         @property
         def subprocess_env_vars(self) -> dict[str, str]:
@@ -921,6 +921,26 @@ class PexBinaryDefaults(Subsystem):
         ),
         advanced=True,
     )
+    run_from_venv = BoolOption(
+        default=False,
+        help=softwrap(
+            f"""
+            If true, the `run` goal runs `{PexBinary.alias}` targets directly from a cached
+            virtualenv of their requirements, with their first-party sources on the `sys.path`,
+            rather than first building the PEX file.
+
+            This skips building (and re-extracting) the PEX on every run, which speeds up
+            edit/run loops: after a source edit, only the changed sources need to be copied into
+            the sandbox. The `{PexArgsField.alias}` and `{PexEnvField.alias}` fields are still
+            honored, but most other packaging-related fields are not, so the runtime environment
+            may differ from that of the packaged PEX.
+
+            Targets that set `{PexPlatformsField.alias}` or
+            `{PexCompletePlatformsField.alias}` are always packaged before running.
+            """
+        ),
+        advanced=True,
+    )
 
 
 # -----------------------------------------------------------------------------------------------
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import io
 import os
 from collections import abc
@@ -12,6 +13,7 @@ from typing import Any, Mapping
 import toml
 
 from pants.backend.python.subsystems import setuptools
+from pants.backend.python.subsystems.python_native_code import PythonNativeCodeSubsystem
 from pants.backend.python.subsystems.setup import PythonSetup
 from pants.backend.python.subsystems.setuptools import Setuptools
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
@@ -19,6 +21,11 @@ from pants.backend.python.util_rules.pex import Pex, PexRequest, VenvPex, VenvPe
 from pants.backend.python.util_rules.pex import rules as pex_rules
 from pants.backend.python.util_rules.pex_requirements import EntireLockfile, PexRequirements
 from pants.base.glob_match_error_behavior import GlobMatchErrorBehavior
+from pants.core.util_rules.system_binaries import (
+    BinaryPathRequest,
+    BinaryPaths,
+    SystemBinariesSubsystem,
+)
 from pants.engine.fs import (
     CreateDigest,
     Digest,
@@ -30,7 +37,7 @@ from pants.engine.fs import (
     RemovePrefix,
     Snapshot,
 )
-from pants.engine.internals.selectors import Get
+from pants.engine.internals.selectors import Get, MultiGet
 from pants.engine.process import ProcessResult
 from pants.engine.rules import collect_rules, rule
 from pants.util.frozendict import FrozenDict
@@ -137,18 +144,27 @@ class DistBuildResult:
     sdist_path: str | None
 
 
-# Note that the shim is capable of building a wheel and an sdist in one invocation, and that
-# is how we currently run it.  We may in the future choose to invoke it twice, for finer-grained
-# invalidation (e.g., so that we don't rebuild an sdist on wheel_config_settings changes).
-# But then we would incur two process executions instead of one, and it's not yet clear if that is
-# preferable. Even if we do decide to run in two passes, it'll still be better to have a single
-# shim for both, so we can use the same merged digest, instead of needing two almost-identical
-# ones, that differ only on the shim.
+# Note that the shim is capable of building a wheel and an sdist in one invocation, but we run it
+# once per dist type, so that each is cached independently: the wheel build is then shared between
+# consumers that only need the wheel (e.g., local dists for `test` and `run`) and `package`, and
+# isn't invalidated by changes to `sdist_config_settings` (and vice versa). Both invocations share
+# the same build backend PEX and input chroot.
 _BACKEND_SHIM_BOILERPLATE = """
 # DO NOT EDIT THIS FILE -- AUTOGENERATED BY PANTS
 
 import errno
 import os
+
+# If requested, compile native code through a compiler launcher (e.g., ccache).
+compiler_launcher = os.environ.get("_PANTS_COMPILER_LAUNCHER")
+if compiler_launcher:
+    import sysconfig
+
+    for compiler_var in ("CC", "CXX"):
+        compiler = os.environ.get(compiler_var) or sysconfig.get_config_var(compiler_var)
+        if compiler:
+            os.environ[compiler_var] = compiler_launcher + " " + compiler
+
 import {build_backend_module}
 
 backend = {build_backend_object}
@@ -176,6 +192,10 @@ if sdist_path:
 """
 
 
+_CCACHE_NAMED_CACHE = "python_native_code_ccache"
+_CCACHE_DIR = ".cache/ccache"
+
+
 def interpolate_backend_shim(dist_dir: str, request: DistBuildRequest) -> bytes:
     # See https://www.python.org/dev/peps/pep-0517/#source-trees.
     module_path, _, object_path = request.build_system.build_backend.partition(":")
@@ -197,8 +217,13 @@ def interpolate_backend_shim(dist_dir: str, request: DistBuildRequest) -> bytes:
     ).encode()
 
 
-@rule
-async def run_pep517_build(request: DistBuildRequest, python_setup: PythonSetup) -> DistBuildResult:
+@rule(desc="Run PEP 517 build backend", level=LogLevel.DEBUG)
+async def run_pep517_build(
+    request: DistBuildRequest,
+    python_setup: PythonSetup,
+    python_native_code: PythonNativeCodeSubsystem.EnvironmentAware,
+    system_binaries: SystemBinariesSubsystem.EnvironmentAware,
+) -> DistBuildResult:
     # Note that this pex has no entrypoint. We use it to run our generated shim, which
     # in turn imports from and invokes the build backend.
     build_backend_pex = await Get(
@@ -209,6 +234,7 @@ async def run_pep517_build(request: DistBuildRequest, python_setup: PythonSetup)
             requirements=request.build_system.requires,
             pex_path=request.extra_build_time_requirements,
             interpreter_constraints=request.interpreter_constraints,
+            description="Set up PEP 517 build environment",
         ),
     )
 
@@ -216,19 +242,38 @@ async def run_pep517_build(request: DistBuildRequest, python_setup: PythonSetup)
     dist_dir = "dist"
     backend_shim_name = "backend_shim.py"
     backend_shim_path = os.path.join(request.working_directory, backend_shim_name)
-    backend_shim_digest = await Get(
-        Digest,
-        CreateDigest(
-            [
-                FileContent(
-                    backend_shim_path,
-                    interpolate_backend_shim(os.path.join(dist_dir, request.output_path), request),
-                ),
-            ]
-        ),
-    )
 
-    merged_digest = await Get(Digest, MergeDigests((request.input, backend_shim_digest)))
+    # Build each dist type in its own process (see the note above _BACKEND_SHIM_BOILERPLATE).
+    # We drop the config settings of the other dist type, so that they don't affect the cache key.
+    single_dist_requests = []
+    if request.build_wheel:
+        single_dist_requests.append(
+            dataclasses.replace(request, build_sdist=False, sdist_config_settings=None)
+        )
+    if request.build_sdist:
+        single_dist_requests.append(
+            dataclasses.replace(request, build_wheel=False, wheel_config_settings=None)
+        )
+    backend_shim_digests = await MultiGet(
+        Get(
+            Digest,
+            CreateDigest(
+                [
+                    FileContent(
+                        backend_shim_path,
+                        interpolate_backend_shim(
+                            os.path.join(dist_dir, request.output_path), single_dist_request
+                        ),
+                    ),
+                ]
+            ),
+        )
+        for single_dist_request in single_dist_requests
+    )
+    merged_digests = await MultiGet(
+        Get(Digest, MergeDigests((request.input, backend_shim_digest)))
+        for backend_shim_digest in backend_shim_digests
+    )
 
     extra_env = {
         **(request.extra_build_time_env or {}),
@@ -237,33 +282,60 @@ async def run_pep517_build(request: DistBuildRequest, python_setup: PythonSetup)
     if python_setup.macos_big_sur_compatibility and is_macos_big_sur():
         extra_env["MACOSX_DEPLOYMENT_TARGET"] = "10.16"
 
-    result = await Get(
-        ProcessResult,
-        VenvPexProcess(
-            build_backend_pex,
-            argv=(backend_shim_name,),
-            input_digest=merged_digest,
-            extra_env=extra_env,
-            working_directory=request.working_directory,
-            output_directories=(dist_dir,),  # Relative to the working_directory.
-            description=(
-                f"Run {request.build_system.build_backend} for {request.target_address_spec}"
-                if request.target_address_spec
-                else f"Run {request.build_system.build_backend}"
+    append_only_caches = {}
+    if python_native_code.use_ccache:
+        ccache_request = BinaryPathRequest(
+            binary_name="ccache", search_path=system_binaries.system_binary_paths
+        )
+        ccache_paths = await Get(BinaryPaths, BinaryPathRequest, ccache_request)
+        ccache = ccache_paths.first_path_or_raise(
+            ccache_request, rationale="use `ccache`, as `[python-native-code].use_ccache` is set"
+        )
+        append_only_caches[_CCACHE_NAMED_CACHE] = _CCACHE_DIR
+        extra_env.update(
+            {
+                "_PANTS_COMPILER_LAUNCHER": ccache.path,
+                "CCACHE_DIR": os.path.join("{chroot}", _CCACHE_DIR),
+                # Hash paths relative to the sandbox, so that hits are shared across sandboxes.
+                "CCACHE_BASEDIR": "{chroot}",
+                "CCACHE_NOHASHDIR": "1",
+            }
+        )
+
+    results = await MultiGet(
+        Get(
+            ProcessResult,
+            VenvPexProcess(
+                build_backend_pex,
+                argv=(backend_shim_name,),
+                input_digest=merged_digest,
+                extra_env=extra_env,
+                working_directory=request.working_directory,
+                output_directories=(dist_dir,),  # Relative to the working_directory.
+                description=(
+                    f"Run {request.build_system.build_backend} to build "
+                    f"{'a wheel' if single_dist_request.build_wheel else 'an sdist'}"
+                    + (f" for {request.target_address_spec}" if request.target_address_spec else "")
+                ),
+                level=LogLevel.DEBUG,
+                append_only_caches=append_only_caches,
             ),
-            level=LogLevel.DEBUG,
-        ),
+        )
+        for single_dist_request, merged_digest in zip(single_dist_requests, merged_digests)
     )
-    output_lines = result.stdout.decode().splitlines()
     paths = {}
-    for line in output_lines:
-        for dist_type in ["wheel", "sdist"]:
-            if line.startswith(f"{dist_type}: "):
-                paths[dist_type] = os.path.join(
-                    request.output_path, line[len(dist_type) + 2 :].strip()
-                )
+    for result in results:
+        for line in result.stdout.decode().splitlines():
+            for dist_type in ["wheel", "sdist"]:
+                if line.startswith(f"{dist_type}: "):
+                    paths[dist_type] = os.path.join(
+                        request.output_path, line[len(dist_type) + 2 :].strip()
+                    )
     # Note that output_digest paths are relative to the working_directory.
-    output_digest = await Get(Digest, RemovePrefix(result.output_digest, dist_dir))
+    output_digests = await MultiGet(
+        Get(Digest, RemovePrefix(result.output_digest, dist_dir)) for result in results
+    )
+    output_digest = await Get(Digest, MergeDigests(output_digests))
     output_snapshot = await Get(Snapshot, Digest, output_digest)
     for dist_type, path in paths.items():
         if path not in output_snapshot.files:
@@ -8,13 +8,14 @@ import pytest
 from pants.backend.python.util_rules import dists, pex
 from pants.backend.python.util_rules.dists import (
     BuildSystem,
+    BuildSystemRequest,
     DistBuildRequest,
     DistBuildResult,
     distutils_repr,
 )
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
 from pants.backend.python.util_rules.pex_requirements import PexRequirements
-from pants.engine.fs import CreateDigest, FileContent
+from pants.engine.fs import CreateDigest, FileContent, Snapshot
 from pants.engine.internals.native_engine import Digest
 from pants.testutil.python_interpreter_selection import (
     skip_unless_python27_present,
@@ -30,7 +31,9 @@ def rule_runner() -> RuleRunner:
         rules=[
             *dists.rules(),
             *pex.rules(),
+            QueryRule(BuildSystem, [BuildSystemRequest]),
             QueryRule(DistBuildResult, [DistBuildRequest]),
+            QueryRule(Snapshot, [Digest]),
         ],
     )
     ret.set_options(
@@ -80,6 +83,57 @@ def test_works_with_python39(rule_runner: RuleRunner) -> None:
     do_test_backend_shim(rule_runner, constraints="CPython==3.9.*")
 
 
+@skip_unless_python39_present
+def test_wheel_only_build(rule_runner: RuleRunner) -> None:
+    setup_py = "from setuptools import setup; setup(name='foobar', version='1.2.3')"
+    input_digest = rule_runner.request(
+        Digest, [CreateDigest([FileContent("setup.py", setup_py.encode())])]
+    )
+    req = DistBuildRequest(
+        build_system=BuildSystem(PexRequirements(["setuptools", "wheel"]), "setuptools.build_meta"),
+        interpreter_constraints=InterpreterConstraints(["CPython==3.9.*"]),
+        build_wheel=True,
+        build_sdist=False,
+        input=input_digest,
+        working_directory="",
+        dist_source_root=".",
+        build_time_source_roots=tuple(),
+        output_path="dist",
+        sdist_config_settings=FrozenDict({"setting1": ("value1",)}),
+    )
+    res = rule_runner.request(DistBuildResult, [req])
+    assert res.sdist_path is None
+    assert res.wheel_path == "dist/foobar-1.2.3-py3-none-any.whl"
+    assert rule_runner.request(Snapshot, [res.output]).files == (res.wheel_path,)
+
+
+@skip_unless_python39_present
+def test_setup_py_only_build(rule_runner: RuleRunner) -> None:
+    # Without a pyproject.toml, the legacy setuptools build system (with requirements from the
+    # setuptools lockfile) is used.
+    setup_py = "from setuptools import setup; setup(name='foobar', version='1.2.3')"
+    input_digest = rule_runner.request(
+        Digest, [CreateDigest([FileContent("setup.py", setup_py.encode())])]
+    )
+    build_system = rule_runner.request(BuildSystem, [BuildSystemRequest(input_digest, "")])
+    assert build_system.build_backend == "setuptools.build_meta:__legacy__"
+
+    req = DistBuildRequest(
+        build_system=build_system,
+        interpreter_constraints=InterpreterConstraints(["CPython==3.9.*"]),
+        build_wheel=True,
+        build_sdist=True,
+        input=input_digest,
+        working_directory="",
+        dist_source_root=".",
+        build_time_source_roots=tuple(),
+        output_path="dist",
+    )
+    res = rule_runner.request(DistBuildResult, [req])
+    assert res.sdist_path == "dist/foobar-1.2.3.tar.gz"
+    assert res.wheel_path == "dist/foobar-1.2.3-py3-none-any.whl"
+
+
 def test_distutils_repr() -> None:
     testdata = {
         "foo": "bar",
@@ -42,7 +42,9 @@ from pants.engine.fs import (
     EMPTY_DIGEST,
     CreateDigest,
     Digest,
+    DigestEntries,
     FileContent,
+    FileEntry,
     GlobMatchErrorBehavior,
     PathGlobs,
     Paths,
@@ -412,6 +414,10 @@ async def infer_runtime_platforms(request: RuntimePlatformsRequest) -> RuntimePl
     )
 
 
+# The path at which FaaS artifacts are initially created, before being moved to their output path.
+_FAAS_ARTIFACT_FILENAME = "faas_artifact.zip"
+
+
 @dataclass(frozen=True)
 class BuildPythonFaaSRequest:
     address: Address
@@ -505,6 +511,12 @@ async def build_python_faas(
 
     output_filename = request.output_path.value_or_default(file_ending="zip")
 
+    # NB: We create the artifact at a fixed path, and only then move it to the target-specific
+    # `output_filename`, so that `pex3 venv create` (which installs and zips every distribution)
+    # is cached by the content of its inputs rather than by target. For example, artifacts that
+    # contain only third-party requirements (such as `python_aws_lambda_layer`s with
+    # `include_sources=False`) are built once per unique requirement closure, and then shared by
+    # every target with that same closure.
     result = await Get(
         PexVenv,
         PexVenvRequest(
@@ -514,10 +526,21 @@ async def build_python_faas(
             complete_platforms=platforms.complete_platforms,
             extra_args=request.pex3_venv_create_extra_args.value or (),
             prefix=request.prefix_in_artifact,
-            output_path=Path(output_filename),
+            output_path=Path(_FAAS_ARTIFACT_FILENAME),
             description=f"Build {request.target_name} artifact for {request.address}",
         ),
     )
+    artifact_entries = await Get(DigestEntries, Digest, result.digest)
+    artifact_entry = next(
+        entry for entry in artifact_entries if entry.path == _FAAS_ARTIFACT_FILENAME
+    )
+    assert isinstance(artifact_entry, FileEntry)
+    artifact_digest = await Get(
+        Digest,
+        CreateDigest(
+            [FileEntry(output_filename, artifact_entry.file_digest, artifact_entry.is_executable)]
+        ),
+    )
 
     extra_log_lines = []
 
@@ -537,7 +560,7 @@ async def build_python_faas(
         output_filename,
         extra_log_lines=tuple(extra_log_lines),
     )
-    return BuiltPackage(digest=result.digest, artifacts=(artifact,))
+    return BuiltPackage(digest=artifact_digest, artifacts=(artifact,))
 
 
 def rules():
@@ -38,7 +38,14 @@ from pants.backend.python.util_rules.pex_venv import PexVenv, PexVenvRequest
 from pants.build_graph.address import Address
 from pants.core.goals.package import OutputPathField
 from pants.core.target_types import FileTarget
-from pants.engine.fs import EMPTY_DIGEST, CreateDigest, Digest
+from pants.engine.fs import (
+    EMPTY_DIGEST,
+    EMPTY_FILE_DIGEST,
+    CreateDigest,
+    Digest,
+    DigestEntries,
+    FileEntry,
+)
 from pants.engine.internals.scheduler import ExecutionError
 from pants.engine.target import InferredDependencies, InvalidFieldException, Target
 from pants.testutil.rule_runner import (
@@ -448,6 +455,11 @@ def test_venv_create_extra_args_are_passed_through() -> None:
                 mock=lambda _: Pex(digest=EMPTY_DIGEST, name="pex", python=None),
             ),
             MockGet(output_type=PexVenv, input_types=(PexVenvRequest,), mock=mock_get_pex_venv),
+            MockGet(
+                output_type=DigestEntries,
+                input_types=(Digest,),
+                mock=lambda _: DigestEntries([FileEntry("faas_artifact.zip", EMPTY_FILE_DIGEST)]),
+            ),
         ],
     )
 
@@ -3,24 +3,29 @@
 
 from __future__ import annotations
 
+import dataclasses
 import logging
 import shlex
 from dataclasses import dataclass
 from typing import Iterable
 
+from pants.backend.python.subsystems.setup import PythonSetup
 from pants.backend.python.subsystems.setuptools import PythonDistributionFieldSet
+from pants.backend.python.util_rules import package_dists
+from pants.backend.python.util_rules.dists import DistBuildRequest, DistBuildResult
+from pants.backend.python.util_rules.dists import rules as dists_rules
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
+from pants.backend.python.util_rules.package_dists import create_dist_build_request
 from pants.backend.python.util_rules.pex import Pex, PexRequest
 from pants.backend.python.util_rules.pex import rules as pex_rules
 from pants.backend.python.util_rules.pex_requirements import PexRequirements
 from pants.backend.python.util_rules.python_sources import PythonSourceFiles
 from pants.build_graph.address import Address
-from pants.core.goals.package import BuiltPackage, PackageFieldSet
 from pants.core.util_rules import system_binaries
 from pants.core.util_rules.source_files import SourceFiles
 from pants.core.util_rules.system_binaries import BashBinary, UnzipBinary
 from pants.engine.addresses import Addresses
-from pants.engine.fs import Digest, DigestSubset, MergeDigests, PathGlobs, Snapshot
+from pants.engine.fs import EMPTY_DIGEST, Digest, DigestSubset, MergeDigests, PathGlobs, Snapshot
 from pants.engine.process import Process, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import (
@@ -29,6 +34,7 @@ from pants.engine.target import (
     WrappedTarget,
     WrappedTargetRequest,
 )
+from pants.engine.unions import UnionMembership
 from pants.util.dirutil import fast_relpath_optional
 from pants.util.docutil import doc_url
 from pants.util.strutil import softwrap
@@ -50,15 +56,27 @@ async def isolate_local_dist_wheels(
     dist_field_set: PythonDistributionFieldSet,
     bash: BashBinary,
     unzip_binary: UnzipBinary,
+    python_setup: PythonSetup,
+    union_membership: UnionMembership,
 ) -> LocalDistWheels:
-    dist = await Get(BuiltPackage, PackageFieldSet, dist_field_set)
-    wheels_snapshot = await Get(Snapshot, DigestSubset(dist.digest, PathGlobs(["**/*.whl"])))
-
-    # A given local dist might build a wheel and an sdist (and maybe other artifacts -
-    # we don't know what setup command was run...)
-    # As long as there is a wheel, we can ignore the other artifacts.
-    artifacts = {(a.relpath or "") for a in dist.artifacts}
-    wheels = [wheel for wheel in wheels_snapshot.files if wheel in artifacts]
+    dist_build_request = await create_dist_build_request(
+        field_set=dist_field_set,
+        python_setup=python_setup,
+        union_membership=union_membership,
+        validate_wheel_sdist=False,
+    )
+    # We only consume the wheel, so we don't build the sdist (if any). Since wheels and sdists are
+    # built by separate processes, this wheel build is shared with `package` of the same dist.
+    if dist_build_request.build_wheel:
+        dist = await Get(
+            DistBuildResult,
+            DistBuildRequest,
+            dataclasses.replace(dist_build_request, build_sdist=False),
+        )
+        wheels_snapshot = await Get(Snapshot, DigestSubset(dist.output, PathGlobs(["**/*.whl"])))
+    else:
+        wheels_snapshot = await Get(Snapshot, Digest, EMPTY_DIGEST)
+    wheels = list(wheels_snapshot.files)
 
     if not wheels:
         tgt = await Get(
@@ -224,6 +242,8 @@ async def build_local_dists(
 def rules():
     return (
         *collect_rules(),
+        *dists_rules(),
+        *package_dists.rules(),
         *pex_rules(),
         *system_binaries.rules(),
     )
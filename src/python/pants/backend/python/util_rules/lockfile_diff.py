@@ -46,9 +46,10 @@ class PythonRequirementVersion:
         return getattr(self._parsed, key)
 
 
-def _pex_lockfile_requirements(
+def pex_lockfile_requirements(
     lockfile_data: Mapping[str, Any] | None, path: str | None = None
 ) -> LockfilePackages:
+    """The version of each distribution locked in the given parsed Pex lockfile."""
     if not lockfile_data:
         return LockfilePackages({})
 
@@ -71,7 +72,8 @@ def _pex_lockfile_requirements(
     return LockfilePackages(requirements)
 
 
-async def _parse_lockfile(lockfile: Lockfile) -> FrozenDict[str, Any] | None:
+async def parse_lockfile(lockfile: Lockfile) -> FrozenDict[str, Any] | None:
+    """Load and parse the given Pex lockfile, or return None if it cannot be read."""
     try:
         loaded = await Get(
             LoadedLockfile,
@@ -102,7 +104,7 @@ async def _generate_python_lockfile_diff(
     new_content = next(c for c in new_digest_contents if c.path == path).content
     new_content = strip_comments_from_pex_json_lockfile(new_content)
     new = await _parse_lockfile_content(new_content, path)
-    old = await _parse_lockfile(
+    old = await parse_lockfile(
         Lockfile(
             url=path,
             url_description_of_origin="existing lockfile",
@@ -112,6 +114,6 @@ async def _generate_python_lockfile_diff(
     return LockfileDiff.create(
         path=path,
         resolve_name=resolve_name,
-        old=_pex_lockfile_requirements(old),
-        new=_pex_lockfile_requirements(new, path),
+        old=pex_lockfile_requirements(old),
+        new=pex_lockfile_requirements(new, path),
     )
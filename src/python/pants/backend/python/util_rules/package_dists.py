@@ -535,7 +535,7 @@ class GeneratedSetupPy:
     digest: Digest
 
 
-@rule
+@rule(desc="Generate python_distribution chroot", level=LogLevel.DEBUG)
 async def generate_chroot(
     request: DistBuildChrootRequest, subsys: SetupPyGeneration
 ) -> DistBuildChroot:
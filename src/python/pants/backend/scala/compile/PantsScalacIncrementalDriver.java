@@ -0,0 +1,1091 @@
+package org.pantsbuild.scalac;
+
+import java.io.ByteArrayInputStream;
+import java.io.DataInputStream;
+import java.io.IOException;
+import java.lang.reflect.Method;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.FileVisitResult;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.Paths;
+import java.nio.file.SimpleFileVisitor;
+import java.nio.file.StandardCopyOption;
+import java.nio.file.attribute.BasicFileAttributes;
+import java.security.MessageDigest;
+import java.security.NoSuchAlgorithmException;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Collections;
+import java.util.HashMap;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Map;
+import java.util.Objects;
+import java.util.Set;
+import java.util.TreeMap;
+import java.util.TreeSet;
+import java.util.UUID;
+
+/**
+ * Runs the Scala compiler incrementally, in the style of Zinc.
+ *
+ * <p>The analysis of the previous successful compile (a content hash of each source, the class
+ * files it produced, and the public API of those class files) is stored under the given state
+ * directory, which lives in an append-only cache. On the next compile, only sources whose content
+ * changed are recompiled, along with any sources which use a name whose API changed as a result,
+ * or which extend a class whose API changed. This repeats until the API of the recompiled sources
+ * stops changing.
+ *
+ * <p>All sources are compiled from scratch if there is no usable analysis, if the compiler options
+ * or classpath changed, if the API of a package object changed, or if more than half of the sources
+ * would need to be recompiled anyway.
+ *
+ * <p>Usage: {@code <state dir> <output dir> <compiler main> <classpath> <option>... -- <source>...}
+ */
+public final class PantsScalacIncrementalDriver {
+  private static final String FORMAT = "pants-scalac-incremental 1";
+  private static final String CURRENT = "CURRENT";
+  private static final String GENERATION_PREFIX = "gen-";
+  private static final long STALE_GENERATION_MILLIS = 60L * 60L * 1000L;
+  private static final double RECOMPILE_ALL_FRACTION = 0.5;
+
+  private final Path stateDir;
+  private final Path outputDir;
+  private final String compilerMain;
+  private final String classpath;
+  private final List<String> options;
+  private final List<String> sources;
+  private final Map<String, String> hashes = new TreeMap<>();
+  private final Map<String, Set<String>> tokens = new HashMap<>();
+
+  private PantsScalacIncrementalDriver(
+      Path stateDir,
+      Path outputDir,
+      String compilerMain,
+      String classpath,
+      List<String> options,
+      List<String> sources) {
+    this.stateDir = stateDir;
+    this.outputDir = outputDir;
+    this.compilerMain = compilerMain;
+    this.classpath = classpath;
+    this.options = options;
+    this.sources = sources;
+  }
+
+  public static void main(String[] args) throws Exception {
+    if (args.length < 4) {
+      System.err.println(
+          "Usage: <state dir> <output dir> <compiler main> <classpath> <option>... -- <source>...");
+      System.exit(2);
+    }
+    List<String> rest = Arrays.asList(args).subList(4, args.length);
+    int separator = rest.indexOf("--");
+    if (separator < 0) {
+      System.err.println("Expected `--` between the compiler options and the sources.");
+      System.exit(2);
+    }
+    PantsScalacIncrementalDriver driver =
+        new PantsScalacIncrementalDriver(
+            Paths.get(args[0]),
+            Paths.get(args[1]),
+            args[2],
+            args[3],
+            new ArrayList<>(rest.subList(0, separator)),
+            new ArrayList<>(rest.subList(separator + 1, rest.size())));
+    System.exit(driver.run() ? 0 : 1);
+  }
+
+  private boolean run() throws Exception {
+    boolean hasJavaSources = false;
+    for (String source : sources) {
+      hashes.put(source, Hasher.hex(Files.readAllBytes(Paths.get(source))));
+      hasJavaSources |= source.endsWith(".java");
+    }
+    Files.createDirectories(outputDir);
+
+    // Java sources are only parsed by scalac, so their products can't be tracked.
+    if (hasJavaSources) {
+      return compileAll() != null;
+    }
+
+    String fingerprint = fingerprint();
+    Analysis previous = null;
+    try {
+      previous = Analysis.load(stateDir, fingerprint);
+    } catch (IOException e) {
+      warn("Ignoring unreadable analysis in " + stateDir + ": " + e);
+    }
+
+    Map<String, SourceAnalysis> result;
+    if (previous == null) {
+      result = compileAll();
+    } else {
+      try {
+        result = compileIncrementally(previous);
+      } catch (IOException e) {
+        warn("Falling back to a full compile: " + e);
+        result = compileAll();
+      }
+    }
+    if (result == null) {
+      return false;
+    }
+    if (result != INCOMPLETE) {
+      try {
+        save(new Analysis(fingerprint, result, outputDir), previous);
+      } catch (IOException e) {
+        warn("Failed to save analysis to " + stateDir + ": " + e);
+      }
+    }
+    return true;
+  }
+
+  private String fingerprint() {
+    Hasher hasher = new Hasher().add(FORMAT).add(compilerMain).add(classpath);
+    for (String option : options) {
+      hasher.add(option);
+    }
+    return hasher.hex();
+  }
+
+  /** The analysis of a successful compile whose products could not all be traced to a source. */
+  private static final Map<String, SourceAnalysis> INCOMPLETE =
+      Collections.unmodifiableMap(new TreeMap<String, SourceAnalysis>());
+
+  /** Compiles all sources from scratch. Returns null if compilation failed. */
+  private Map<String, SourceAnalysis> compileAll() throws Exception {
+    deleteRecursively(outputDir);
+    Files.createDirectories(outputDir);
+    if (!compile(sources, outputDir, classpath)) {
+      return null;
+    }
+    Map<String, SourceAnalysis> analysis = analyze(sources, outputDir);
+    return analysis != null ? analysis : INCOMPLETE;
+  }
+
+  private Map<String, SourceAnalysis> compileIncrementally(Analysis previous) throws Exception {
+    Map<String, SourceAnalysis> current = new TreeMap<>();
+    Set<String> pending = new TreeSet<>();
+    for (String source : sources) {
+      SourceAnalysis before = previous.sources.get(source);
+      if (before != null && before.hash.equals(hashes.get(source))) {
+        current.put(source, before);
+      } else {
+        pending.add(source);
+      }
+    }
+    ApiChanges changes = new ApiChanges();
+    for (Map.Entry<String, SourceAnalysis> entry : previous.sources.entrySet()) {
+      if (!hashes.containsKey(entry.getKey())) {
+        changes.record(entry.getValue(), null);
+      }
+    }
+
+    deleteRecursively(outputDir);
+    Files.createDirectories(outputDir);
+    for (SourceAnalysis analysis : current.values()) {
+      for (String product : analysis.products) {
+        link(previous.classesDir.resolve(product), outputDir.resolve(product));
+      }
+    }
+
+    Set<String> compiled = new HashSet<>();
+    pending.addAll(invalidatedBy(changes, current, pending));
+    int round = 0;
+    while (!pending.isEmpty() || changes.invalidateAll) {
+      if (changes.invalidateAll
+          || compiled.size() + pending.size() > RECOMPILE_ALL_FRACTION * sources.size()) {
+        return compileAll();
+      }
+      for (String source : pending) {
+        SourceAnalysis stale = current.remove(source);
+        if (stale != null) {
+          for (String product : stale.products) {
+            Files.deleteIfExists(outputDir.resolve(product));
+          }
+        }
+      }
+
+      Path roundDir = outputDir.resolveSibling(outputDir.getFileName() + ".round" + round++);
+      deleteRecursively(roundDir);
+      Files.createDirectories(roundDir);
+      String roundClasspath =
+          classpath.isEmpty() ? outputDir.toString() : outputDir + ":" + classpath;
+      if (!compile(new ArrayList<>(pending), roundDir, roundClasspath)) {
+        return null;
+      }
+      Map<String, SourceAnalysis> recompiled = analyze(pending, roundDir);
+      if (recompiled == null) {
+        return compileAll();
+      }
+
+      changes = new ApiChanges();
+      for (Map.Entry<String, SourceAnalysis> entry : recompiled.entrySet()) {
+        changes.record(previous.sources.get(entry.getKey()), entry.getValue());
+        for (String product : entry.getValue().products) {
+          Path target = outputDir.resolve(product);
+          if (Files.exists(target)) {
+            // The product moved between sources: start over rather than guess at its owner.
+            return compileAll();
+          }
+          Files.createDirectories(target.getParent());
+          Files.move(roundDir.resolve(product), target, StandardCopyOption.REPLACE_EXISTING);
+        }
+      }
+      deleteRecursively(roundDir);
+      current.putAll(recompiled);
+      compiled.addAll(pending);
+
+      Set<String> done = new HashSet<>(compiled);
+      pending = new TreeSet<>(invalidatedBy(changes, current, done));
+    }
+    return current;
+  }
+
+  /**
+   * Returns the sources (other than those in `exclude`) which use a name whose API changed, or
+   * which (transitively) extend a class whose API changed.
+   */
+  private Set<String> invalidatedBy(
+      ApiChanges changes, Map<String, SourceAnalysis> current, Set<String> exclude)
+      throws IOException {
+    Set<String> result = new TreeSet<>();
+    if (changes.isEmpty()) {
+      return result;
+    }
+    Set<String> changedTypes = new HashSet<>(changes.types);
+    boolean grew = true;
+    while (grew) {
+      grew = false;
+      for (String source : sources) {
+        if (exclude.contains(source) || result.contains(source)) {
+          continue;
+        }
+        SourceAnalysis analysis = current.get(source);
+        boolean inherits = false;
+        if (analysis != null) {
+          for (ClassApi api : analysis.classes.values()) {
+            inherits |= !Collections.disjoint(api.supertypes, changedTypes);
+          }
+        }
+        if (inherits || !Collections.disjoint(tokens(source), changes.names)) {
+          result.add(source);
+          grew = true;
+          if (inherits) {
+            for (ClassApi api : analysis.classes.values()) {
+              changedTypes.add(api.name);
+            }
+          }
+        }
+      }
+    }
+    return result;
+  }
+
+  private boolean compile(List<String> toCompile, Path destination, String compileClasspath)
+      throws Exception {
+    List<String> args = new ArrayList<>(options);
+    if (!compileClasspath.isEmpty()) {
+      args.add("-classpath");
+      args.add(compileClasspath);
+    }
+    args.add("-d");
+    args.add(destination.toString());
+    args.addAll(toCompile);
+    return invokeCompiler(compilerMain, args.toArray(new String[0]));
+  }
+
+  /**
+   * Invokes the `process` method of the compiler's main object, which (unlike `main`) reports
+   * failure without exiting.
+   */
+  private static boolean invokeCompiler(String main, String[] args) throws Exception {
+    Class<?> moduleClass = Class.forName(main + "$");
+    Object module = moduleClass.getField("MODULE$").get(null);
+    Method process = null;
+    for (Method method : moduleClass.getMethods()) {
+      Class<?>[] params = method.getParameterTypes();
+      if (method.getName().equals("process")
+          && params.length > 0
+          && params[0] == String[].class
+          && (process == null || params.length < process.getParameterTypes().length)) {
+        boolean nullable = true;
+        for (int i = 1; i < params.length; i++) {
+          nullable &= !params[i].isPrimitive();
+        }
+        if (nullable) {
+          process = method;
+        }
+      }
+    }
+    if (process == null) {
+      throw new NoSuchMethodException(main + ".process(String[])");
+    }
+    Object[] processArgs = new Object[process.getParameterTypes().length];
+    processArgs[0] = args;
+    Object result = process.invoke(module, processArgs);
+    if (result instanceof Boolean) {
+      return (Boolean) result;
+    }
+    // Older versions of scalac return Unit, and newer versions of the compiler return a reporter.
+    Object reporter =
+        result != null ? result : moduleClass.getMethod("reporter").invoke(module);
+    return !(Boolean) reporter.getClass().getMethod("hasErrors").invoke(reporter);
+  }
+
+  /**
+   * Attributes each file under `dir` to the source in `compiled` which produced it, and computes
+   * the API of the class files. Returns null if some file could not be attributed.
+   */
+  private Map<String, SourceAnalysis> analyze(Iterable<String> compiled, Path dir)
+      throws IOException {
+    Map<String, SourceAnalysis> result = new TreeMap<>();
+    for (String source : compiled) {
+      result.put(source, new SourceAnalysis(hashes.get(source)));
+    }
+    Map<String, String> classOwners = new HashMap<>();
+    List<String> others = new ArrayList<>();
+    for (String product : listFiles(dir)) {
+      if (!product.endsWith(".class")) {
+        others.add(product);
+        continue;
+      }
+      ClassApi api = ClassApi.read(Files.readAllBytes(dir.resolve(product)));
+      String owner = classOwner(api.sourceFile, product, result.keySet());
+      if (owner == null) {
+        return null;
+      }
+      classOwners.put(product, owner);
+      SourceAnalysis analysis = result.get(owner);
+      analysis.products.add(product);
+      if (isApiClass(product)) {
+        analysis.classes.put(product, api);
+      }
+    }
+    for (String product : others) {
+      String owner = null;
+      if (product.endsWith(".tasty")) {
+        // Scala 3 stores the full typed trees of a class beside it, and they are part of its API.
+        String stem = product.substring(0, product.length() - ".tasty".length());
+        for (String classFile : Arrays.asList(stem + ".class", stem + "$.class")) {
+          if (owner == null && classOwners.containsKey(classFile)) {
+            owner = classOwners.get(classFile);
+            ClassApi api = result.get(owner).classes.get(classFile);
+            if (api != null) {
+              api.header =
+                  new Hasher()
+                      .add(api.header)
+                      .add(Hasher.hex(Files.readAllBytes(dir.resolve(product))))
+                      .hex();
+            }
+          }
+        }
+      } else if (product.startsWith("META-INF/semanticdb/") && product.endsWith(".semanticdb")) {
+        String path =
+            product.substring(
+                "META-INF/semanticdb/".length(), product.length() - ".semanticdb".length());
+        for (String source : result.keySet()) {
+          if (source.equals(path) || source.endsWith("/" + path) || path.endsWith("/" + source)) {
+            owner = source;
+          }
+        }
+      }
+      if (owner == null) {
+        return null;
+      }
+      result.get(owner).products.add(product);
+    }
+    return result;
+  }
+
+  private static String classOwner(String sourceFile, String product, Set<String> candidates) {
+    if (sourceFile == null) {
+      return null;
+    }
+    String packageDir = product.substring(0, product.lastIndexOf('/') + 1);
+    List<String> matches = new ArrayList<>();
+    for (String candidate : candidates) {
+      if (candidate.equals(sourceFile) || candidate.endsWith("/" + sourceFile)) {
+        matches.add(candidate);
+      }
+    }
+    if (matches.size() > 1) {
+      List<String> inPackage = new ArrayList<>();
+      for (String match : matches) {
+        String qualified = packageDir + sourceFile;
+        if (match.equals(qualified) || match.endsWith("/" + qualified)) {
+          inPackage.add(match);
+        }
+      }
+      matches = inPackage;
+    }
+    return matches.size() == 1 ? matches.get(0) : null;
+  }
+
+  /** Anonymous and local classes can't be referenced from other sources. */
+  private static boolean isApiClass(String product) {
+    String base =
+        product.substring(product.lastIndexOf('/') + 1, product.length() - ".class".length());
+    String[] segments = base.split("\\$");
+    for (int i = 1; i < segments.length; i++) {
+      String segment = segments[i];
+      if (segment.equals("anon")
+          || segment.equals("anonfun")
+          || (!segment.isEmpty() && Character.isDigit(segment.charAt(0)))) {
+        return false;
+      }
+    }
+    return true;
+  }
+
+  private Set<String> tokens(String source) throws IOException {
+    Set<String> result = tokens.get(source);
+    if (result == null) {
+      byte[] content = Files.readAllBytes(Paths.get(source));
+      result = Names.tokenize(new String(content, StandardCharsets.UTF_8));
+      tokens.put(source, result);
+    }
+    return result;
+  }
+
+  private void save(Analysis analysis, Analysis previous) throws IOException {
+    Files.createDirectories(stateDir);
+    String generation = GENERATION_PREFIX + UUID.randomUUID();
+    Path generationDir = stateDir.resolve(generation);
+    Path classesDir = generationDir.resolve("classes");
+    Files.createDirectories(classesDir);
+    for (SourceAnalysis source : analysis.sources.values()) {
+      for (String product : source.products) {
+        link(outputDir.resolve(product), classesDir.resolve(product));
+      }
+    }
+    Files.write(
+        generationDir.resolve("analysis"),
+        analysis.serialize().getBytes(StandardCharsets.UTF_8));
+
+    Path pointer = stateDir.resolve(CURRENT + "." + generation);
+    Files.write(pointer, generation.getBytes(StandardCharsets.UTF_8));
+    Files.move(
+        pointer,
+        stateDir.resolve(CURRENT),
+        StandardCopyOption.REPLACE_EXISTING,
+        StandardCopyOption.ATOMIC_MOVE);
+
+    // Remove the generation this compile started from, and any left behind by concurrent compiles.
+    try {
+      if (previous != null) {
+        deleteRecursively(previous.classesDir.getParent());
+      }
+      long cutoff = System.currentTimeMillis() - STALE_GENERATION_MILLIS;
+      for (Path child : listChildren(stateDir)) {
+        String name = child.getFileName().toString();
+        if (name.startsWith(GENERATION_PREFIX)
+            && !name.equals(generation)
+            && Files.getLastModifiedTime(child).toMillis() < cutoff) {
+          deleteRecursively(child);
+        }
+      }
+    } catch (IOException e) {
+      warn("Failed to clean up old analysis in " + stateDir + ": " + e);
+    }
+  }
+
+  private static void warn(String message) {
+    System.err.println("[scalac-incremental] " + message);
+  }
+
+  private static void link(Path from, Path to) throws IOException {
+    Files.createDirectories(to.getParent());
+    try {
+      Files.createLink(to, from);
+    } catch (IOException | UnsupportedOperationException e) {
+      Files.copy(from, to, StandardCopyOption.REPLACE_EXISTING);
+    }
+  }
+
+  private static List<Path> listChildren(Path dir) throws IOException {
+    List<Path> result = new ArrayList<>();
+    if (Files.isDirectory(dir)) {
+      try (java.nio.file.DirectoryStream<Path> stream = Files.newDirectoryStream(dir)) {
+        for (Path child : stream) {
+          result.add(child);
+        }
+      }
+    }
+    return result;
+  }
+
+  /** Returns the `/`-separated relative paths of all files under `dir`, sorted. */
+  private static List<String> listFiles(final Path dir) throws IOException {
+    final List<String> result = new ArrayList<>();
+    Files.walkFileTree(
+        dir,
+        new SimpleFileVisitor<Path>() {
+          @Override
+          public FileVisitResult visitFile(Path file, BasicFileAttributes attrs) {
+            result.add(dir.relativize(file).toString().replace('\\', '/'));
+            return FileVisitResult.CONTINUE;
+          }
+        });
+    Collections.sort(result);
+    return result;
+  }
+
+  private static void deleteRecursively(Path path) throws IOException {
+    if (!Files.exists(path)) {
+      return;
+    }
+    Files.walkFileTree(
+        path,
+        new SimpleFileVisitor<Path>() {
+          @Override
+          public FileVisitResult visitFile(Path file, BasicFileAttributes attrs)
+              throws IOException {
+            Files.delete(file);
+            return FileVisitResult.CONTINUE;
+          }
+
+          @Override
+          public FileVisitResult postVisitDirectory(Path dir, IOException e) throws IOException {
+            if (e != null) {
+              throw e;
+            }
+            Files.delete(dir);
+            return FileVisitResult.CONTINUE;
+          }
+        });
+  }
+
+  /** The persisted result of a successful compile. */
+  private static final class Analysis {
+    final String fingerprint;
+    final Map<String, SourceAnalysis> sources;
+    final Path classesDir;
+
+    Analysis(String fingerprint, Map<String, SourceAnalysis> sources, Path classesDir) {
+      this.fingerprint = fingerprint;
+      this.sources = sources;
+      this.classesDir = classesDir;
+    }
+
+    /** Loads the current analysis, or returns null if there is none for this fingerprint. */
+    static Analysis load(Path stateDir, String fingerprint) throws IOException {
+      Path current = stateDir.resolve(CURRENT);
+      if (!Files.isRegularFile(current)) {
+        return null;
+      }
+      Path generationDir =
+          stateDir.resolve(new String(Files.readAllBytes(current), StandardCharsets.UTF_8).trim());
+      List<String> lines =
+          Files.readAllLines(generationDir.resolve("analysis"), StandardCharsets.UTF_8);
+      if (lines.size() < 2
+          || !lines.get(0).equals(FORMAT)
+          || !lines.get(1).equals("fingerprint\t" + fingerprint)) {
+        return null;
+      }
+      Map<String, SourceAnalysis> sources = new TreeMap<>();
+      SourceAnalysis source = null;
+      ClassApi api = null;
+      for (String line : lines.subList(2, lines.size())) {
+        String[] fields = line.split("\t", -1);
+        switch (fields[0]) {
+          case "source":
+            source = new SourceAnalysis(fields[2]);
+            sources.put(fields[1], source);
+            break;
+          case "product":
+            source.products.add(fields[1]);
+            break;
+          case "class":
+            api = new ClassApi(fields[2], fields[3]);
+            if (!fields[4].isEmpty()) {
+              api.supertypes.addAll(Arrays.asList(fields[4].split(",")));
+            }
+            source.classes.put(fields[1], api);
+            break;
+          case "member":
+            api.members.put(fields[1], fields[2]);
+            break;
+          default:
+            throw new IOException("Unexpected analysis line: " + line);
+        }
+      }
+      return new Analysis(fingerprint, sources, generationDir.resolve("classes"));
+    }
+
+    String serialize() {
+      StringBuilder out = new StringBuilder();
+      out.append(FORMAT).append('\n');
+      out.append("fingerprint\t").append(fingerprint).append('\n');
+      for (Map.Entry<String, SourceAnalysis> source : sources.entrySet()) {
+        out.append("source\t").append(source.getKey()).append('\t');
+        out.append(source.getValue().hash).append('\n');
+        for (String product : source.getValue().products) {
+          out.append("product\t").append(product).append('\n');
+        }
+        for (Map.Entry<String, ClassApi> entry : source.getValue().classes.entrySet()) {
+          ClassApi api = entry.getValue();
+          out.append("class\t").append(entry.getKey()).append('\t').append(api.name);
+          out.append('\t').append(api.header).append('\t');
+          out.append(String.join(",", api.supertypes)).append('\n');
+          for (Map.Entry<String, String> member : api.members.entrySet()) {
+            out.append("member\t").append(member.getKey()).append('\t');
+            out.append(member.getValue()).append('\n');
+          }
+        }
+      }
+      return out.toString();
+    }
+  }
+
+  private static final class SourceAnalysis {
+    final String hash;
+    final List<String> products = new ArrayList<>();
+    final Map<String, ClassApi> classes = new TreeMap<>();
+
+    SourceAnalysis(String hash) {
+      this.hash = hash;
+    }
+  }
+
+  /** The names and types whose API changed between two compiles. */
+  private static final class ApiChanges {
+    final Set<String> names = new HashSet<>();
+    final Set<String> types = new HashSet<>();
+    boolean invalidateAll = false;
+
+    boolean isEmpty() {
+      return names.isEmpty() && types.isEmpty() && !invalidateAll;
+    }
+
+    void record(SourceAnalysis before, SourceAnalysis after) {
+      Map<String, ClassApi> previous =
+          before != null ? before.classes : Collections.<String, ClassApi>emptyMap();
+      Map<String, ClassApi> next =
+          after != null ? after.classes : Collections.<String, ClassApi>emptyMap();
+      Set<String> products = new TreeSet<>(previous.keySet());
+      products.addAll(next.keySet());
+      for (String product : products) {
+        ClassApi x = previous.get(product);
+        ClassApi y = next.get(product);
+        if (x == null || y == null || !x.header.equals(y.header)) {
+          ClassApi api = x != null ? x : y;
+          types.add(api.name);
+          names.addAll(Names.ofClass(api.name));
+          invalidateAll |= Names.isPackageObject(api.name);
+          continue;
+        }
+        Set<String> members = new TreeSet<>(x.members.keySet());
+        members.addAll(y.members.keySet());
+        for (String member : members) {
+          if (!Objects.equals(x.members.get(member), y.members.get(member))) {
+            types.add(x.name);
+            names.addAll(member.equals("<init>") ? Names.ofClass(x.name) : Names.ofMember(member));
+          }
+        }
+      }
+    }
+  }
+
+  /** The parts of a class file which other sources can observe. */
+  private static final class ClassApi {
+    final String name;
+    String header;
+    final Set<String> supertypes = new TreeSet<>();
+    final Map<String, String> members = new TreeMap<>();
+    String sourceFile;
+
+    ClassApi(String name, String header) {
+      this.name = name;
+      this.header = header;
+    }
+
+    private static final int ACC_PRIVATE = 0x0002;
+    private static final int ACC_SUPER = 0x0020;
+
+    static ClassApi read(byte[] bytes) throws IOException {
+      DataInputStream in = new DataInputStream(new ByteArrayInputStream(bytes));
+      if (in.readInt() != 0xCAFEBABE) {
+        throw new IOException("Not a class file.");
+      }
+      in.readUnsignedShort();
+      in.readUnsignedShort();
+      ConstantPool pool = new ConstantPool(in);
+
+      int access = in.readUnsignedShort() & ~ACC_SUPER;
+      String name = pool.className(in.readUnsignedShort());
+      int superIndex = in.readUnsignedShort();
+      Hasher header = new Hasher().add("class").add(access).add(name);
+      ClassApi api = new ClassApi(name, null);
+      if (superIndex != 0) {
+        api.supertypes.add(pool.className(superIndex));
+      }
+      int interfaces = in.readUnsignedShort();
+      for (int i = 0; i < interfaces; i++) {
+        api.supertypes.add(pool.className(in.readUnsignedShort()));
+      }
+      for (String supertype : api.supertypes) {
+        header.add(supertype);
+      }
+
+      Map<String, List<String>> overloads = new TreeMap<>();
+      for (String kind : Arrays.asList("field", "method")) {
+        int count = in.readUnsignedShort();
+        for (int i = 0; i < count; i++) {
+          int memberAccess = in.readUnsignedShort();
+          String memberName = pool.utf8(in.readUnsignedShort());
+          Hasher member =
+              new Hasher()
+                  .add(kind)
+                  .add(memberAccess)
+                  .add(memberName)
+                  .add(pool.utf8(in.readUnsignedShort()));
+          readAttributes(in, pool, member, null);
+          if ((memberAccess & ACC_PRIVATE) == 0 && isApiMember(memberName)) {
+            if (!overloads.containsKey(memberName)) {
+              overloads.put(memberName, new ArrayList<String>());
+            }
+            overloads.get(memberName).add(member.hex());
+          }
+        }
+      }
+      // Overloads share a name, so combine their hashes independently of their order.
+      for (Map.Entry<String, List<String>> entry : overloads.entrySet()) {
+        Collections.sort(entry.getValue());
+        Hasher member = new Hasher();
+        for (String hash : entry.getValue()) {
+          member.add(hash);
+        }
+        api.members.put(entry.getKey(), member.hex());
+      }
+      readAttributes(in, pool, header, api);
+      api.header = header.hex();
+      return api;
+    }
+
+    private static boolean isApiMember(String name) {
+      return !name.equals("<clinit>")
+          && !name.contains("$anonfun$")
+          && !name.equals("$deserializeLambda$");
+    }
+
+    /**
+     * Hashes the attributes which are part of the API into `hasher`, resolving constant pool
+     * references (which are renumbered whenever method bodies change).
+     */
+    private static void readAttributes(
+        DataInputStream in, ConstantPool pool, Hasher hasher, ClassApi classApi)
+        throws IOException {
+      int count = in.readUnsignedShort();
+      for (int i = 0; i < count; i++) {
+        String attribute = pool.utf8(in.readUnsignedShort());
+        byte[] data = new byte[in.readInt()];
+        in.readFully(data);
+        DataInputStream body = new DataInputStream(new ByteArrayInputStream(data));
+        switch (attribute) {
+          case "SourceFile":
+            if (classApi != null) {
+              classApi.sourceFile = pool.utf8(body.readUnsignedShort());
+            }
+            break;
+          case "Signature":
+            hasher.add(attribute).add(pool.utf8(body.readUnsignedShort()));
+            break;
+          case "ConstantValue":
+            hasher.add(attribute).add(pool.constant(body.readUnsignedShort()));
+            break;
+          case "Exceptions":
+          case "PermittedSubclasses":
+            hasher.add(attribute);
+            int classes = body.readUnsignedShort();
+            for (int j = 0; j < classes; j++) {
+              hasher.add(pool.className(body.readUnsignedShort()));
+            }
+            break;
+          case "RuntimeVisibleAnnotations":
+          case "RuntimeInvisibleAnnotations":
+            hasher.add(attribute);
+            readAnnotations(body, pool, hasher);
+            break;
+          case "RuntimeVisibleParameterAnnotations":
+          case "RuntimeInvisibleParameterAnnotations":
+            hasher.add(attribute);
+            int parameters = body.readUnsignedByte();
+            for (int j = 0; j < parameters; j++) {
+              readAnnotations(body, pool, hasher);
+            }
+            break;
+          case "AnnotationDefault":
+            hasher.add(attribute);
+            readElementValue(body, pool, hasher);
+            break;
+          case "ScalaSig":
+          case "TASTY":
+          case "Deprecated":
+            hasher.add(attribute).add(Hasher.hex(data));
+            break;
+          default:
+            // Code, debug information, inlining hints, etc. are not part of the API.
+            break;
+        }
+      }
+    }
+
+    private static void readAnnotations(DataInputStream in, ConstantPool pool, Hasher hasher)
+        throws IOException {
+      int count = in.readUnsignedShort();
+      for (int i = 0; i < count; i++) {
+        readAnnotation(in, pool, hasher);
+      }
+    }
+
+    private static void readAnnotation(DataInputStream in, ConstantPool pool, Hasher hasher)
+        throws IOException {
+      hasher.add(pool.utf8(in.readUnsignedShort()));
+      int pairs = in.readUnsignedShort();
+      for (int i = 0; i < pairs; i++) {
+        hasher.add(pool.utf8(in.readUnsignedShort()));
+        readElementValue(in, pool, hasher);
+      }
+    }
+
+    private static void readElementValue(DataInputStream in, ConstantPool pool, Hasher hasher)
+        throws IOException {
+      char tag = (char) in.readUnsignedByte();
+      hasher.add(String.valueOf(tag));
+      switch (tag) {
+        case 'e':
+          hasher.add(pool.utf8(in.readUnsignedShort())).add(pool.utf8(in.readUnsignedShort()));
+          break;
+        case 'c':
+          hasher.add(pool.utf8(in.readUnsignedShort()));
+          break;
+        case '@':
+          readAnnotation(in, pool, hasher);
+          break;
+        case '[':
+          int values = in.readUnsignedShort();
+          for (int i = 0; i < values; i++) {
+            readElementValue(in, pool, hasher);
+          }
+          break;
+        default:
+          hasher.add(pool.constant(in.readUnsignedShort()));
+          break;
+      }
+    }
+  }
+
+  private static final class ConstantPool {
+    private final int[] tags;
+    private final Object[] values;
+
+    ConstantPool(DataInputStream in) throws IOException {
+      int count = in.readUnsignedShort();
+      tags = new int[count];
+      values = new Object[count];
+      for (int i = 1; i < count; i++) {
+        int tag = in.readUnsignedByte();
+        tags[i] = tag;
+        switch (tag) {
+          case 1: // Utf8
+            values[i] = in.readUTF();
+            break;
+          case 3: // Integer
+            values[i] = in.readInt();
+            break;
+          case 4: // Float
+            values[i] = in.readFloat();
+            break;
+          case 5: // Long
+            values[i++] = in.readLong();
+            break;
+          case 6: // Double
+            values[i++] = in.readDouble();
+            break;
+          case 7: // Class
+          case 8: // String
+          case 16: // MethodType
+          case 19: // Module
+          case 20: // Package
+            values[i] = in.readUnsignedShort();
+            break;
+          case 15: // MethodHandle
+            in.readUnsignedByte();
+            in.readUnsignedShort();
+            break;
+          case 9: // Fieldref
+          case 10: // Methodref
+          case 11: // InterfaceMethodref
+          case 12: // NameAndType
+          case 17: // Dynamic
+          case 18: // InvokeDynamic
+            in.readUnsignedShort();
+            in.readUnsignedShort();
+            break;
+          default:
+            throw new IOException("Unknown constant pool tag " + tag + ".");
+        }
+      }
+    }
+
+    String utf8(int index) {
+      return (String) values[index];
+    }
+
+    String className(int index) {
+      return utf8((Integer) values[index]);
+    }
+
+    String constant(int index) {
+      if (tags[index] == 8) {
+        return "String:" + utf8((Integer) values[index]);
+      }
+      return tags[index] + ":" + values[index];
+    }
+  }
+
+  /** Helpers for matching the names defined by class files against the names used in sources. */
+  private static final class Names {
+    private static final String OPERATOR_CHARS = "!#%&*+-/:<=>?@\\^|~";
+    private static final String[][] ENCODINGS = {
+      {"$tilde", "~"}, {"$eq", "="}, {"$less", "<"}, {"$greater", ">"}, {"$bang", "!"},
+      {"$hash", "#"}, {"$percent", "%"}, {"$up", "^"}, {"$amp", "&"}, {"$bar", "|"},
+      {"$times", "*"}, {"$div", "/"}, {"$plus", "+"}, {"$minus", "-"}, {"$colon", ":"},
+      {"$bslash", "\\"}, {"$qmark", "?"}, {"$at", "@"},
+    };
+
+    static boolean isPackageObject(String className) {
+      String base = className.substring(className.lastIndexOf('/') + 1);
+      if (base.endsWith("$")) {
+        base = base.substring(0, base.length() - 1);
+      }
+      return base.equals("package") || base.endsWith("$package");
+    }
+
+    static Set<String> ofClass(String className) {
+      return ofMember(className.substring(className.lastIndexOf('/') + 1));
+    }
+
+    /**
+     * The source-level names a JVM name may correspond to. Since `$` both separates nested names
+     * and encodes operators, both readings are included.
+     */
+    static Set<String> ofMember(String name) {
+      Set<String> result = new HashSet<>();
+      for (String candidate : Arrays.asList(name, decode(name))) {
+        for (String segment : candidate.split("\\$")) {
+          if (segment.isEmpty()
+              || segment.equals("anon")
+              || segment.equals("anonfun")
+              || Character.isDigit(segment.charAt(0))) {
+            continue;
+          }
+          result.add(segment);
+          if (segment.endsWith("_=") && segment.length() > 2) {
+            result.add(segment.substring(0, segment.length() - 2));
+          }
+        }
+      }
+      return result;
+    }
+
+    private static String decode(String name) {
+      StringBuilder out = new StringBuilder();
+      int i = 0;
+      outer:
+      while (i < name.length()) {
+        if (name.charAt(i) == '$') {
+          for (String[] encoding : ENCODINGS) {
+            if (name.startsWith(encoding[0], i)) {
+              out.append(encoding[1]);
+              i += encoding[0].length();
+              continue outer;
+            }
+          }
+        }
+        out.append(name.charAt(i++));
+      }
+      return out.toString();
+    }
+
+    private static boolean isOperatorChar(char c) {
+      return OPERATOR_CHARS.indexOf(c) >= 0;
+    }
+
+    /** Splits source text into identifiers, operators and backquoted names. */
+    static Set<String> tokenize(String text) {
+      Set<String> result = new HashSet<>();
+      int i = 0;
+      int length = text.length();
+      while (i < length) {
+        char c = text.charAt(i);
+        int end = i + 1;
+        if (Character.isJavaIdentifierStart(c)) {
+          while (end < length && Character.isJavaIdentifierPart(text.charAt(end))) {
+            end++;
+          }
+          // An identifier ending in `_` may continue with operator characters, e.g. `unary_!`.
+          if (text.charAt(end - 1) == '_') {
+            while (end < length && isOperatorChar(text.charAt(end))) {
+              end++;
+            }
+          }
+          result.add(text.substring(i, end));
+        } else if (c == '`') {
+          end = text.indexOf('`', i + 1);
+          if (end < 0) {
+            break;
+          }
+          result.add(text.substring(i + 1, end));
+          end++;
+        } else if (isOperatorChar(c)) {
+          while (end < length && isOperatorChar(text.charAt(end))) {
+            end++;
+          }
+          result.add(text.substring(i, end));
+        }
+        i = end;
+      }
+      return result;
+    }
+  }
+
+  private static final class Hasher {
+    private final MessageDigest digest = newDigest();
+
+    private static MessageDigest newDigest() {
+      try {
+        return MessageDigest.getInstance("SHA-256");
+      } catch (NoSuchAlgorithmException e) {
+        throw new IllegalStateException(e);
+      }
+    }
+
+    static String hex(byte[] bytes) {
+      Hasher hasher = new Hasher();
+      hasher.digest.update(bytes);
+      return hasher.hex();
+    }
+
+    Hasher add(String value) {
+      digest.update(String.valueOf(value).getBytes(StandardCharsets.UTF_8));
+      digest.update((byte) 0);
+      return this;
+    }
+
+    Hasher add(int value) {
+      return add(Integer.toString(value));
+    }
+
+    String hex() {
+      StringBuilder out = new StringBuilder();
+      for (byte b : digest.digest()) {
+        out.append(String.format("%02x", b));
+      }
+      return out.toString();
+    }
+  }
+}
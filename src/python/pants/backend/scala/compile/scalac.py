@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from dataclasses import dataclass
 from itertools import chain
 
@@ -28,7 +29,15 @@ from pants.backend.scala.util_rules.versions import (
 from pants.core.util_rules.source_files import SourceFilesRequest
 from pants.core.util_rules.stripped_source_files import StrippedSourceFiles
 from pants.core.util_rules.system_binaries import BashBinary, ZipBinary
-from pants.engine.fs import EMPTY_DIGEST, CreateDigest, Digest, Directory, MergeDigests
+from pants.engine.fs import (
+    EMPTY_DIGEST,
+    CreateDigest,
+    Digest,
+    Directory,
+    FileContent,
+    MergeDigests,
+    RemovePrefix,
+)
 from pants.engine.process import FallibleProcessResult, Process, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import CoarsenedTarget, SourcesField
@@ -43,16 +52,22 @@ from pants.jvm.compile import (
     FallibleClasspathEntry,
 )
 from pants.jvm.compile import rules as jvm_compile_rules
-from pants.jvm.jdk_rules import JdkEnvironment, JdkRequest, JvmProcess
+from pants.jvm.jdk_rules import InternalJdk, JdkEnvironment, JdkRequest, JvmProcess
 from pants.jvm.resolve.common import ArtifactRequirements
 from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
 from pants.jvm.strip_jar import strip_jar
 from pants.jvm.strip_jar.strip_jar import StripJarRequest
 from pants.jvm.subsystems import JvmSubsystem
 from pants.util.logging import LogLevel
+from pants.util.resources import read_resource
 
 logger = logging.getLogger(__name__)
 
+_INCREMENTAL_DRIVER_BASENAME = "PantsScalacIncrementalDriver.java"
+_INCREMENTAL_DRIVER_MAIN = "org.pantsbuild.scalac.PantsScalacIncrementalDriver"
+_INCREMENTAL_CACHE_NAME = "scalac_incremental"
+_INCREMENTAL_CACHE_DIR = ".cache/scalac_incremental"
+
 
 class CompileScalaSourceRequest(ClasspathEntryRequest):
     field_sets = (ScalaFieldSet, ScalaGeneratorFieldSet)
@@ -64,6 +79,11 @@ class ScalaLibraryRequest:
     version: ScalaVersion
 
 
+@dataclass(frozen=True)
+class ScalacIncrementalDriverClassfiles:
+    digest: Digest
+
+
 # TODO: This code is duplicated in the scalac and BSP rules.
 def compute_output_jar_filename(ctgt: CoarsenedTarget) -> str:
     return f"{ctgt.representative.address.path_safe_spec}.scalac.jar"
@@ -146,9 +166,12 @@ async def compile_scala_source(
 
     toolcp_relpath = "__toolcp"
     local_scalac_plugins_relpath = "__localplugincp"
+    incremental_driver_relpath = "__incrementaldriver"
     usercp = "__cp"
 
-    user_classpath = Classpath(direct_dependency_classpath_entries, request.resolve)
+    user_classpath = Classpath(
+        ClasspathEntry.for_compilation(direct_dependency_classpath_entries), request.resolve
+    )
 
     tool_classpath, sources_digest, jdk = await MultiGet(
         Get(
@@ -175,6 +198,9 @@ async def compile_scala_source(
         toolcp_relpath: tool_classpath.digest,
         local_scalac_plugins_relpath: local_plugins.classpath.digest,
     }
+    if scalac.incremental:
+        incremental_driver = await Get(ScalacIncrementalDriverClassfiles)
+        extra_immutable_input_digests[incremental_driver_relpath] = incremental_driver.digest
     extra_nailgun_keys = tuple(extra_immutable_input_digests)
     extra_immutable_input_digests.update(user_classpath.immutable_inputs(prefix=usercp))
 
@@ -185,30 +211,61 @@ async def compile_scala_source(
     compilation_empty_dir = await Get(Digest, CreateDigest([Directory(compilation_output_dir)]))
     merged_digest = await Get(Digest, MergeDigests([sources_digest, compilation_empty_dir]))
 
+    bootclasspath_args = (
+        "-bootclasspath",
+        ":".join(tool_classpath.classpath_entries(toolcp_relpath)),
+    )
+    source_files = sorted(
+        chain.from_iterable(
+            sources.snapshot.files for _, sources in component_members_and_scala_source_files
+        )
+    )
+    classpath_entries = tool_classpath.classpath_entries(toolcp_relpath)
+    extra_append_only_caches = {}
+    if scalac.incremental:
+        # The driver keeps the analysis of each target's previous compile in a directory of the
+        # named cache, and uses it to decide which sources need to be recompiled.
+        state_dir = os.path.join(
+            _INCREMENTAL_CACHE_DIR,
+            request.resolve.name,
+            request.component.representative.address.path_safe_spec,
+        )
+        classpath_entries = (*classpath_entries, incremental_driver_relpath)
+        extra_append_only_caches[_INCREMENTAL_CACHE_NAME] = _INCREMENTAL_CACHE_DIR
+        argv = [
+            _INCREMENTAL_DRIVER_MAIN,
+            state_dir,
+            compilation_output_dir,
+            scala_artifacts.compiler_main,
+            classpath_arg,
+            *bootclasspath_args,
+            *local_plugins.args(local_scalac_plugins_relpath),
+            *scalac.args,
+            "--",
+            *source_files,
+        ]
+    else:
+        argv = [
+            scala_artifacts.compiler_main,
+            *bootclasspath_args,
+            *local_plugins.args(local_scalac_plugins_relpath),
+            *(("-classpath", classpath_arg) if classpath_arg else ()),
+            *scalac.args,
+            "-d",
+            compilation_output_dir,
+            *source_files,
+        ]
+
     compile_result = await Get(
         FallibleProcessResult,
         JvmProcess(
             jdk=jdk,
-            classpath_entries=tool_classpath.classpath_entries(toolcp_relpath),
-            argv=[
-                scala_artifacts.compiler_main,
-                "-bootclasspath",
-                ":".join(tool_classpath.classpath_entries(toolcp_relpath)),
-                *local_plugins.args(local_scalac_plugins_relpath),
-                *(("-classpath", classpath_arg) if classpath_arg else ()),
-                *scalac.args,
-                "-d",
-                compilation_output_dir,
-                *sorted(
-                    chain.from_iterable(
-                        sources.snapshot.files
-                        for _, sources in component_members_and_scala_source_files
-                    )
-                ),
-            ],
+            classpath_entries=classpath_entries,
+            argv=argv,
             input_digest=merged_digest,
             extra_immutable_input_digests=extra_immutable_input_digests,
             extra_nailgun_keys=extra_nailgun_keys,
+            extra_append_only_caches=extra_append_only_caches,
             output_directories=(compilation_output_dir,),
             description=f"Compile {request.component} with scalac",
             level=LogLevel.DEBUG,
@@ -258,6 +315,55 @@ async def compile_scala_source(
     )
 
 
+# TODO(13879): Consolidate compilation of wrapper binaries to common rules.
+@rule
+async def build_scalac_incremental_driver(jdk: InternalJdk) -> ScalacIncrementalDriverClassfiles:
+    dest_dir = "classfiles"
+    source_digest = await Get(
+        Digest,
+        CreateDigest(
+            [
+                FileContent(
+                    path=_INCREMENTAL_DRIVER_BASENAME,
+                    content=read_resource(
+                        "pants.backend.scala.compile", _INCREMENTAL_DRIVER_BASENAME
+                    ),
+                ),
+                Directory(dest_dir),
+            ]
+        ),
+    )
+    process_result = await Get(
+        ProcessResult,
+        JvmProcess(
+            jdk=jdk,
+            classpath_entries=[f"{jdk.java_home}/lib/tools.jar"],
+            argv=[
+                "com.sun.tools.javac.Main",
+                # The driver runs on the JDK of the target being compiled, which may be older.
+                "-source",
+                "8",
+                "-target",
+                "8",
+                "-Xlint:-options",
+                "-d",
+                dest_dir,
+                _INCREMENTAL_DRIVER_BASENAME,
+            ],
+            input_digest=source_digest,
+            output_directories=(dest_dir,),
+            description=f"Compile {_INCREMENTAL_DRIVER_BASENAME} with javac",
+            level=LogLevel.DEBUG,
+            # NB: We do not use nailgun for this process, since it is launched exactly once.
+            use_nailgun=False,
+        ),
+    )
+    stripped_classfiles_digest = await Get(
+        Digest, RemovePrefix(process_result.output_digest, dest_dir)
+    )
+    return ScalacIncrementalDriverClassfiles(stripped_classfiles_digest)
+
+
 @rule
 async def fetch_scala_library(request: ScalaLibraryRequest) -> ClasspathEntry:
     scala_artifacts = await Get(
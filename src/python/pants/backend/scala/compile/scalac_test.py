@@ -329,6 +329,48 @@ def test_compile_with_missing_dep_fails(
     )
 
 
+@maybe_skip_jdk_test
+def test_compile_incremental(
+    rule_runner: RuleRunner, scala_stdlib_jvm_lockfile: JVMLockfileFixture
+) -> None:
+    rule_runner.set_options(
+        args=["--scala-version-for-resolve={'jvm-default':'2.13.8'}", "--scalac-incremental"],
+        env_inherit=PYTHON_BOOTSTRAP_ENV,
+    )
+    rule_runner.write_files(
+        {
+            "BUILD": "scala_sources(name = 'main')",
+            "3rdparty/jvm/BUILD": scala_stdlib_jvm_lockfile.requirements_as_jvm_artifact_targets(),
+            "3rdparty/jvm/default.lock": scala_stdlib_jvm_lockfile.serialized_lockfile,
+            "Example.scala": SCALA_LIB_MAIN_SOURCE,
+            "ExampleLib.scala": SCALA_LIB_SOURCE,
+        }
+    )
+
+    def compile() -> FallibleClasspathEntry:
+        request = CompileScalaSourceRequest(
+            component=expect_single_expanded_coarsened_target(
+                rule_runner, Address(spec_path="", target_name="main")
+            ),
+            resolve=make_resolve(rule_runner),
+        )
+        return rule_runner.request(FallibleClasspathEntry, [request])
+
+    assert compile().result == CompileResult.SUCCEEDED
+
+    # A change which doesn't affect the API of `C` only recompiles its own source.
+    rule_runner.write_files(
+        {"ExampleLib.scala": SCALA_LIB_SOURCE.replace('"hello!"', '"hello again!"')}
+    )
+    assert compile().result == CompileResult.SUCCEEDED
+
+    # But removing a member which `Main` uses must recompile (and fail) `Main` as well.
+    rule_runner.write_files({"ExampleLib.scala": SCALA_LIB_SOURCE.replace("hello", "goodbye")})
+    fallible_result = compile()
+    assert fallible_result.result == CompileResult.FAILED
+    assert "value hello is not a member of" in fallible_result.stderr
+
+
 @pytest.fixture
 def joda_jvm_lockfile_def() -> JVMLockfileFixtureDefinition:
     return JVMLockfileFixtureDefinition(
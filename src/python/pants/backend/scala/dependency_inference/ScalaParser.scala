@@ -476,13 +476,35 @@ object ScalaParser {
     analysisTraverser.toAnalysis
   }
 
+  // Usage: either `<analysis output path> <source> <scala version> <source3>`, or
+  // `--batch <analysis output dir> <scala version> <source3> <sources>...` to analyze many
+  // sources in one invocation, writing the analysis of each to `<analysis output dir>/<source>.json`.
   def main(args: Array[String]): Unit = {
-    val outputPath = java.nio.file.Paths.get(args(0))
-    val pathStr = args(1)
-    val scalaVersion = args(2)
-    val source3 = args(3).toBoolean
-    val analysis = analyze(pathStr, scalaVersion, source3)
+    if (args(0) == "--batch") {
+      val outputDir = java.nio.file.Paths.get(args(1))
+      val scalaVersion = args(2)
+      val source3 = args(3).toBoolean
+      args.drop(4).foreach { pathStr =>
+        val analysis =
+          try {
+            analyze(pathStr, scalaVersion, source3)
+          } catch {
+            case e: Exception => throw new RuntimeException(s"Failed to analyze $pathStr", e)
+          }
+        val outputPath = outputDir.resolve(pathStr + ".json")
+        java.nio.file.Files.createDirectories(outputPath.getParent)
+        writeAnalysis(outputPath, analysis)
+      }
+    } else {
+      val outputPath = java.nio.file.Paths.get(args(0))
+      val pathStr = args(1)
+      val scalaVersion = args(2)
+      val source3 = args(3).toBoolean
+      writeAnalysis(outputPath, analyze(pathStr, scalaVersion, source3))
+    }
+  }
 
+  private def writeAnalysis(outputPath: java.nio.file.Path, analysis: Analysis): Unit = {
     val json = analysis.asJson.noSpaces
     java.nio.file.Files.write(
       outputPath,
@@ -11,6 +11,7 @@ from pants.backend.scala.compile.scalac_plugins import (
 )
 from pants.backend.scala.dependency_inference import scala_parser, symbol_mapper
 from pants.backend.scala.dependency_inference.scala_parser import ScalaSourceDependencyAnalysis
+from pants.backend.scala.dependency_inference.symbol_mapper import AllScalaSourceDependencyAnalyses
 from pants.backend.scala.subsystems.scala import ScalaSubsystem
 from pants.backend.scala.subsystems.scala_infer import ScalaInferSubsystem
 from pants.backend.scala.target_types import ScalaDependenciesField, ScalaSourceField
@@ -21,7 +22,7 @@ from pants.backend.scala.util_rules.versions import (
 )
 from pants.build_graph.address import Address
 from pants.core.util_rules.source_files import SourceFilesRequest
-from pants.engine.rules import Get, MultiGet, collect_rules, rule
+from pants.engine.rules import Get, collect_rules, rule
 from pants.engine.target import (
     DependenciesRequest,
     ExplicitlyProvidedDependencies,
@@ -62,15 +63,21 @@ async def infer_scala_dependencies_via_source_analysis(
     scala_infer_subsystem: ScalaInferSubsystem,
     jvm: JvmSubsystem,
     symbol_mapping: SymbolMapping,
+    all_analyses: AllScalaSourceDependencyAnalyses,
 ) -> InferredDependencies:
     if not scala_infer_subsystem.imports:
         return InferredDependencies([])
 
     address = request.field_set.address
-    explicitly_provided_deps, analysis = await MultiGet(
-        Get(ExplicitlyProvidedDependencies, DependenciesRequest(request.field_set.dependencies)),
-        Get(ScalaSourceDependencyAnalysis, SourceFilesRequest([request.field_set.source])),
+    explicitly_provided_deps = await Get(
+        ExplicitlyProvidedDependencies, DependenciesRequest(request.field_set.dependencies)
     )
+    # Only sources which `analyze_all_scala_sources` did not see are analyzed here.
+    analysis = all_analyses.analyses.get(address)
+    if analysis is None:
+        analysis = await Get(
+            ScalaSourceDependencyAnalysis, SourceFilesRequest([request.field_set.source])
+        )
 
     symbols: OrderedSet[str] = OrderedSet()
     if scala_infer_subsystem.imports:
@@ -203,6 +203,22 @@ class AnalyzeScalaSourceRequest:
     source3: bool
 
 
+@dataclass(frozen=True)
+class AnalyzeScalaSourcesBatchRequest:
+    """Analyze any number of source files in a single invocation of the parser."""
+
+    source_files: SourceFiles
+    scala_version: ScalaVersion
+    source3: bool
+
+
+@dataclass(frozen=True)
+class ScalaSourceDependencyAnalysisBatch:
+    """The analysis of each file in an `AnalyzeScalaSourcesBatchRequest`, by path."""
+
+    analyses: FrozenDict[str, ScalaSourceDependencyAnalysis]
+
+
 @rule(level=LogLevel.DEBUG)
 async def create_analyze_scala_source_request(
     scala_subsystem: ScalaSubsystem, jvm: JvmSubsystem, scalac: Scalac, request: SourceFilesRequest
@@ -311,6 +327,86 @@ async def resolve_fallible_result_to_analysis(
     return ScalaSourceDependencyAnalysis.from_json_dict(analysis)
 
 
+@rule(level=LogLevel.DEBUG)
+async def analyze_scala_sources_batch(
+    jdk: InternalJdk,
+    processor_classfiles: ScalaParserCompiledClassfiles,
+    request: AnalyzeScalaSourcesBatchRequest,
+) -> ScalaSourceDependencyAnalysisBatch:
+    source_files = request.source_files
+    if not source_files.files:
+        return ScalaSourceDependencyAnalysisBatch(FrozenDict())
+
+    source_prefix = "__source_to_analyze"
+    processorcp_relpath = "__processorcp"
+    toolcp_relpath = "__toolcp"
+
+    parser_lockfile_request = await Get(
+        GenerateJvmLockfileFromTool, ScalaParserToolLockfileSentinel()
+    )
+
+    tool_classpath, prefixed_source_files_digest = await MultiGet(
+        Get(
+            ToolClasspath,
+            ToolClasspathRequest(lockfile=parser_lockfile_request),
+        ),
+        Get(Digest, AddPrefix(source_files.snapshot.digest, source_prefix)),
+    )
+
+    extra_immutable_input_digests = {
+        toolcp_relpath: tool_classpath.digest,
+        processorcp_relpath: processor_classfiles.digest,
+    }
+
+    analysis_output_dir = "__source_analysis"
+
+    process_result = await Get(
+        ProcessResult,
+        JvmProcess(
+            jdk=jdk,
+            classpath_entries=[
+                *tool_classpath.classpath_entries(toolcp_relpath),
+                processorcp_relpath,
+            ],
+            argv=[
+                "org.pantsbuild.backend.scala.dependency_inference.ScalaParser",
+                "--batch",
+                analysis_output_dir,
+                str(request.scala_version),
+                str(request.source3),
+                *(os.path.join(source_prefix, file) for file in source_files.files),
+            ],
+            input_digest=prefixed_source_files_digest,
+            extra_immutable_input_digests=extra_immutable_input_digests,
+            output_directories=(analysis_output_dir,),
+            extra_nailgun_keys=extra_immutable_input_digests,
+            description=(
+                f"Analyzing {source_files.files[0]}"
+                if len(source_files.files) == 1
+                else f"Analyzing {len(source_files.files)} Scala sources"
+            ),
+            level=LogLevel.DEBUG,
+        ),
+    )
+
+    analysis_digest = await Get(
+        Digest,
+        RemovePrefix(
+            process_result.output_digest, os.path.join(analysis_output_dir, source_prefix)
+        ),
+    )
+    analysis_contents = await Get(DigestContents, Digest, analysis_digest)
+    return ScalaSourceDependencyAnalysisBatch(
+        FrozenDict(
+            (
+                file_content.path[: -len(".json")],
+                ScalaSourceDependencyAnalysis.from_json_dict(json.loads(file_content.content)),
+            )
+            for file_content in analysis_contents
+        )
+    )
+
+
 # TODO(13879): Consolidate compilation of wrapper binaries to common rules.
 @rule
 async def setup_scala_parser_classfiles(jdk: InternalJdk) -> ScalaParserCompiledClassfiles:
@@ -8,15 +8,17 @@ from pants.backend.scala import target_types
 from pants.backend.scala.dependency_inference import scala_parser
 from pants.backend.scala.dependency_inference.scala_parser import (
     AnalyzeScalaSourceRequest,
+    AnalyzeScalaSourcesBatchRequest,
     ScalaImport,
     ScalaProvidedSymbol,
     ScalaSourceDependencyAnalysis,
+    ScalaSourceDependencyAnalysisBatch,
 )
 from pants.backend.scala.target_types import ScalaSourceField, ScalaSourceTarget
 from pants.backend.scala.util_rules import versions
 from pants.build_graph.address import Address
 from pants.core.util_rules import source_files
-from pants.core.util_rules.source_files import SourceFilesRequest
+from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.engine import process
 from pants.engine.target import SourcesField
 from pants.jvm import jdk_rules
@@ -41,6 +43,8 @@ def rule_runner() -> RuleRunner:
             *versions.rules(),
             QueryRule(AnalyzeScalaSourceRequest, (SourceFilesRequest,)),
             QueryRule(ScalaSourceDependencyAnalysis, (AnalyzeScalaSourceRequest,)),
+            QueryRule(ScalaSourceDependencyAnalysisBatch, (AnalyzeScalaSourcesBatchRequest,)),
+            QueryRule(SourceFiles, (SourceFilesRequest,)),
         ],
         target_types=[ScalaSourceTarget],
     )
@@ -735,3 +739,51 @@ def test_type_context_bounds(rule_runner: RuleRunner) -> None:
         "foo.Applicative",
         "foo.Functor",
     ]
+
+
+def test_parser_batch(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "BUILD": textwrap.dedent(
+                """\
+                scala_source(name="a", source="a/A.scala")
+                scala_source(name="b", source="b/B.scala")
+                """
+            ),
+            "a/A.scala": textwrap.dedent(
+                """
+                package org.pantsbuild.a
+
+                import org.pantsbuild.b.B
+
+                class A extends B
+                """
+            ),
+            "b/B.scala": textwrap.dedent(
+                """
+                package org.pantsbuild.b
+
+                class B
+                """
+            ),
+        }
+    )
+    targets = [rule_runner.get_target(Address("", target_name=name)) for name in ("a", "b")]
+    source_files = rule_runner.request(
+        SourceFiles, [SourceFilesRequest(tgt[ScalaSourceField] for tgt in targets)]
+    )
+
+    batch = rule_runner.request(
+        ScalaSourceDependencyAnalysisBatch,
+        [
+            AnalyzeScalaSourcesBatchRequest(
+                source_files, versions.ScalaVersion.parse("2.13.8"), False
+            )
+        ],
+    )
+
+    assert set(batch.analyses) == {"a/A.scala", "b/B.scala"}
+    assert set(batch.analyses["a/A.scala"].all_imports()) == {"org.pantsbuild.b.B"}
+    assert "org.pantsbuild.b.B" in {
+        symbol.name for symbol in batch.analyses["b/B.scala"].provided_symbols
+    }
@@ -3,15 +3,23 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from dataclasses import dataclass
 from typing import Mapping
 
-from pants.backend.scala.dependency_inference.scala_parser import ScalaSourceDependencyAnalysis
+from pants.backend.scala.dependency_inference.scala_parser import (
+    AnalyzeScalaSourcesBatchRequest,
+    ScalaSourceDependencyAnalysis,
+    ScalaSourceDependencyAnalysisBatch,
+)
+from pants.backend.scala.subsystems.scala import ScalaSubsystem
+from pants.backend.scala.subsystems.scalac import Scalac
 from pants.backend.scala.target_types import ScalaSourceField
-from pants.core.util_rules.source_files import SourceFilesRequest
+from pants.backend.scala.util_rules.versions import ScalaVersion
+from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.engine.addresses import Address
 from pants.engine.internals.selectors import Get, MultiGet
 from pants.engine.rules import collect_rules, rule
-from pants.engine.target import AllTargets, Targets
+from pants.engine.target import AllTargets, Target, Targets
 from pants.engine.unions import UnionRule
 from pants.jvm.dependency_inference import symbol_mapper
 from pants.jvm.dependency_inference.artifact_mapper import (
@@ -19,9 +27,14 @@ from pants.jvm.dependency_inference.artifact_mapper import (
     MutableTrieNode,
     SymbolNamespace,
 )
-from pants.jvm.dependency_inference.symbol_mapper import FirstPartyMappingRequest, SymbolMap
+from pants.jvm.dependency_inference.symbol_mapper import (
+    FirstPartyMappingRequest,
+    SymbolMap,
+    partition_sources_for_analysis,
+)
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmResolveField
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 
 
@@ -40,6 +53,53 @@ def find_all_scala_targets(targets: AllTargets) -> AllScalaTargets:
     return AllScalaTargets(tgt for tgt in targets if tgt.has_field(ScalaSourceField))
 
 
+@dataclass(frozen=True)
+class AllScalaSourceDependencyAnalyses:
+    """The dependency analysis of the source of every Scala target, by address."""
+
+    analyses: FrozenDict[Address, ScalaSourceDependencyAnalysis]
+
+
+@rule(desc="Analyze all Scala sources", level=LogLevel.DEBUG)
+async def analyze_all_scala_sources(
+    scala_targets: AllScalaTargets,
+    scala_subsystem: ScalaSubsystem,
+    scalac: Scalac,
+    jvm: JvmSubsystem,
+) -> AllScalaSourceDependencyAnalyses:
+    # Sources are parsed using the dialect of the Scala version of their resolve, so only sources
+    # with the same Scala version may share a batch.
+    targets_by_version: dict[ScalaVersion, list[Target]] = defaultdict(list)
+    for tgt in scala_targets:
+        resolve = tgt[JvmResolveField].normalized_value(jvm)
+        targets_by_version[scala_subsystem.version_for_resolve(resolve)].append(tgt)
+    source3 = "-Xsource:3" in scalac.args
+
+    batches = [
+        (scala_version, batch)
+        for scala_version, targets in targets_by_version.items()
+        for batch in partition_sources_for_analysis(targets, ScalaSourceField)
+    ]
+    all_source_files = await MultiGet(
+        Get(SourceFiles, SourceFilesRequest(tgt[ScalaSourceField] for tgt in batch))
+        for _, batch in batches
+    )
+    analysis_batches = await MultiGet(
+        Get(
+            ScalaSourceDependencyAnalysisBatch,
+            AnalyzeScalaSourcesBatchRequest(source_files, scala_version, source3),
+        )
+        for (scala_version, _), source_files in zip(batches, all_source_files)
+    )
+    return AllScalaSourceDependencyAnalyses(
+        FrozenDict(
+            (tgt.address, analysis_batch.analyses[tgt[ScalaSourceField].file_path])
+            for (_, batch), analysis_batch in zip(batches, analysis_batches)
+            for tgt in batch
+        )
+    )
+
+
 SCALA_PACKAGE_OBJECT_NAMESPACE: SymbolNamespace = "package object"
 
 
@@ -58,19 +118,14 @@ def _symbol_namespace(address: Address) -> SymbolNamespace:
 async def map_first_party_scala_targets_to_symbols(
     _: FirstPartyScalaTargetsMappingRequest,
     scala_targets: AllScalaTargets,
+    all_analyses: AllScalaSourceDependencyAnalyses,
     jvm: JvmSubsystem,
 ) -> SymbolMap:
-    source_analysis = await MultiGet(
-        Get(ScalaSourceDependencyAnalysis, SourceFilesRequest([target[ScalaSourceField]]))
-        for target in scala_targets
-    )
-    address_and_analysis = zip(
-        [(tgt.address, tgt[JvmResolveField].normalized_value(jvm)) for tgt in scala_targets],
-        source_analysis,
-    )
-
     mapping: Mapping[str, MutableTrieNode] = defaultdict(MutableTrieNode)
-    for (address, resolve), analysis in address_and_analysis:
+    for tgt in scala_targets:
+        address = tgt.address
+        resolve = tgt[JvmResolveField].normalized_value(jvm)
+        analysis = all_analyses.analyses[address]
         namespace = _symbol_namespace(address)
         for symbol in analysis.provided_symbols:
             mapping[resolve].insert(
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from pants.option.option_types import ArgsListOption, DictOption
+from pants.option.option_types import ArgsListOption, BoolOption, DictOption
 from pants.option.subsystem import Subsystem
 from pants.util.strutil import softwrap
 
@@ -35,6 +35,24 @@ class Scalac(Subsystem):
         ),
     )
 
+    incremental = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, compile Scala targets incrementally: when a target changes, only its changed
+            sources are recompiled, along with the sources which use a name whose API changed as a
+            result.
+
+            The analysis of the previous compile of each target is stored in an append-only cache
+            keyed by the target's address and resolve. A full compile is used when there is no
+            analysis yet, when the compiler options or classpath of the target change, when a
+            target contains Java sources, when a package object's API changes, or when more than
+            half of a target's sources would need to be recompiled anyway.
+            """
+        ),
+    )
+
     def parsed_default_plugins(self) -> dict[str, list[str]]:
         return {
             key: [i.strip() for i in value.split(",")]
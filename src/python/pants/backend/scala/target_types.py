@@ -39,6 +39,7 @@ from pants.engine.unions import UnionMembership, UnionRule
 from pants.jvm import target_types as jvm_target_types
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import (
+    JunitTestBatchCompatibilityTagField,
     JunitTestExtraEnvVarsField,
     JunitTestSourceField,
     JunitTestTimeoutField,
@@ -217,6 +218,7 @@ class ScalaJunitTestTarget(Target):
         ScalaConsumedPluginNamesField,
         JunitTestTimeoutField,
         JunitTestExtraEnvVarsField,
+        JunitTestBatchCompatibilityTagField,
         JvmResolveField,
         JvmProvidesTypesField,
         JvmJdkField,
@@ -259,6 +261,7 @@ class ScalaJunitTestsGeneratorTarget(TargetFilesGenerator):
         ScalaConsumedPluginNamesField,
         JunitTestTimeoutField,
         JunitTestExtraEnvVarsField,
+        JunitTestBatchCompatibilityTagField,
         JvmJdkField,
         JvmProvidesTypesField,
         JvmResolveField,
@@ -25,7 +25,7 @@ from pants.core.target_types import FileSourceField
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.engine.addresses import Addresses
 from pants.engine.env_vars import EnvironmentVars, EnvironmentVarsRequest
-from pants.engine.fs import Digest, DigestSubset, MergeDigests, PathGlobs, RemovePrefix, Snapshot
+from pants.engine.fs import Digest, DigestSubset, PathGlobs, RemovePrefix, Snapshot
 from pants.engine.process import (
     FallibleProcessResult,
     InteractiveProcess,
@@ -35,7 +35,7 @@ from pants.engine.process import (
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import SourcesField, TransitiveTargets, TransitiveTargetsRequest
 from pants.engine.unions import UnionRule
-from pants.jvm.classpath import Classpath
+from pants.jvm.classpath import Classpath, ClasspathJarFarm
 from pants.jvm.goals import lockfile
 from pants.jvm.jdk_rules import JdkEnvironment, JdkRequest, JvmProcess
 from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
@@ -110,18 +110,21 @@ async def setup_scalatest_for_target(
         ),
     )
 
-    input_digest = await Get(Digest, MergeDigests((*classpath.digests(), files.snapshot.digest)))
+    # Link the classpath from a farm of shared JARs, rather than materializing it per-sandbox.
+    jar_farm = await Get(ClasspathJarFarm, Classpath, classpath)
+    input_digest = files.snapshot.digest
 
     toolcp_relpath = "__toolcp"
     extra_immutable_input_digests = {
         toolcp_relpath: scalatest_classpath.digest,
+        **jar_farm.immutable_input_digests,
     }
 
     reports_dir_prefix = "__reports_dir"
     reports_dir = f"{reports_dir_prefix}/{request.field_set.address.path_safe_spec}"
 
     # Classfiles produced by the root `scalatest_test` targets are the only ones which should run.
-    user_classpath_arg = ":".join(classpath.root_args())
+    user_classpath_arg = ":".join(jar_farm.root_args)
 
     # Cache test runs only if they are successful, or not at all if `--test-force`.
     cache_scope = (
@@ -139,7 +142,7 @@ async def setup_scalatest_for_target(
     process = JvmProcess(
         jdk=jdk,
         classpath_entries=[
-            *classpath.args(),
+            *jar_farm.args,
             *scalatest_classpath.classpath_entries(toolcp_relpath),
         ],
         argv=[
@@ -81,6 +81,9 @@ class ExportResult:
     # Set for the common special case of exporting a resolve, and names that resolve.
     # Set to None for other export results.
     resolve: str | None
+    # If set, any existing content under reldir is left in place (rather than being removed)
+    # before the digest is materialized, so that the post-processing commands can update it.
+    preserve_existing: bool
 
     def __init__(
         self,
@@ -90,12 +93,14 @@ class ExportResult:
         digest: Digest = EMPTY_DIGEST,
         post_processing_cmds: Iterable[PostProcessingCommand] = tuple(),
         resolve: str | None = None,
+        preserve_existing: bool = False,
     ):
         object.__setattr__(self, "description", description)
         object.__setattr__(self, "reldir", reldir)
         object.__setattr__(self, "digest", digest)
         object.__setattr__(self, "post_processing_cmds", tuple(post_processing_cmds))
         object.__setattr__(self, "resolve", resolve)
+        object.__setattr__(self, "preserve_existing", preserve_existing)
 
 
 class ExportResults(Collection[ExportResult]):
@@ -146,6 +151,8 @@ async def export(
     )
     output_dir = os.path.join(str(dist_dir.relpath), "export")
     for result in flattened_results:
+        if result.preserve_existing:
+            continue
         digest_root = os.path.join(build_root.path, output_dir, result.reldir)
         safe_rmtree(digest_root)
     merged_digest = await Get(Digest, MergeDigests(prefixed_digests))
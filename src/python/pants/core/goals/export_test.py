@@ -65,12 +65,14 @@ def mock_export(
     edr: ExportRequest,
     digest: Digest,
     post_processing_cmds: tuple[PostProcessingCommand, ...],
+    preserve_existing: bool = False,
 ) -> ExportResult:
     return ExportResult(
         description=f"mock export for {','.join(t.address.spec for t in edr.targets)}",
         reldir="mock",
         digest=digest,
         post_processing_cmds=post_processing_cmds,
+        preserve_existing=preserve_existing,
     )
 
 
@@ -86,7 +88,9 @@ def _mock_run(rule_runner: RuleRunner, ip: InteractiveProcess) -> InteractivePro
     return InteractiveProcessResult(0)
 
 
-def run_export_rule(rule_runner: RuleRunner, targets: List[Target]) -> Tuple[int, str]:
+def run_export_rule(
+    rule_runner: RuleRunner, targets: List[Target], preserve_existing: bool = False
+) -> Tuple[int, str]:
     union_membership = UnionMembership({ExportRequest: [MockExportRequest]})
     with open(os.path.join(rule_runner.build_root, "somefile"), "wb") as fp:
         fp.write(b"SOMEFILE")
@@ -120,6 +124,7 @@ def run_export_rule(rule_runner: RuleRunner, targets: List[Target]) -> Tuple[int
                                         ["cp", "{digest_root}/foo/bar", "{digest_root}/foo/bar2"]
                                     ),
                                 ),
+                                preserve_existing,
                             ),
                         )
                     ),
@@ -144,7 +149,8 @@ def run_export_rule(rule_runner: RuleRunner, targets: List[Target]) -> Tuple[int
         return result.exit_code, stdio_reader.get_stdout()
 
 
-def test_run_export_rule() -> None:
+@pytest.mark.parametrize("preserve_existing", [False, True])
+def test_run_export_rule(preserve_existing: bool) -> None:
     rule_runner = RuleRunner(
         rules=[
             UnionRule(ExportRequest, MockExportRequest),
@@ -154,7 +160,11 @@ def test_run_export_rule() -> None:
         ],
         target_types=[MockTarget],
     )
-    exit_code, stdout = run_export_rule(rule_runner, [make_target("foo/bar", "baz")])
+    # A file from a previous export, which is only kept if the result preserves it.
+    rule_runner.write_files({"dist/export/mock/foo/old": "OLD"})
+    exit_code, stdout = run_export_rule(
+        rule_runner, [make_target("foo/bar", "baz")], preserve_existing
+    )
     assert exit_code == 0
     assert "Wrote mock export for foo/bar:baz to dist/export/mock" in stdout
     for filename in ["bar", "bar1", "bar2"]:
@@ -164,6 +174,8 @@ def test_run_export_rule() -> None:
         assert os.path.isfile(expected_dist_path)
         with open(expected_dist_path, "rb") as fp:
             assert fp.read() == b"BAR"
+    old_dist_path = os.path.join(rule_runner.build_root, "dist", "export", "mock", "foo", "old")
+    assert os.path.isfile(old_dist_path) == preserve_existing
 
 
 def _e(path, env):
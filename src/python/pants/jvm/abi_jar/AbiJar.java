@@ -0,0 +1,589 @@
+package org.pantsbuild.abijar;
+
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.OutputStream;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.Paths;
+import java.util.ArrayList;
+import java.util.Calendar;
+import java.util.GregorianCalendar;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.TreeMap;
+import java.util.zip.ZipEntry;
+import java.util.zip.ZipInputStream;
+import java.util.zip.ZipOutputStream;
+
+/**
+ * Creates ABI jars: copies of jars which only contain the information needed to compile against
+ * them, in the style of Bazel's `ijar`.
+ *
+ * <p>Method bodies, private and synthetic members, local and anonymous classes, and debug
+ * information are removed, and the constant pool of each class is rebuilt from what remains. The
+ * result is that a change which does not affect the API of a class (such as a change to a method
+ * body) produces a byte-for-byte identical ABI jar.
+ */
+public class AbiJar {
+  // A fixed timestamp for all entries, so that the output only depends on the API.
+  private static final long ENTRY_TIME =
+      new GregorianCalendar(2000, Calendar.JANUARY, 1).getTimeInMillis();
+
+  public static void main(String[] args) {
+    Path inputPath = Paths.get(args[0]);
+    Path outputPath = Paths.get(args[1]);
+
+    for (int i = 2; i < args.length; i++) {
+      String jarName = args[i];
+      try {
+        strip(inputPath.resolve(jarName), outputPath.resolve(jarName));
+      } catch (IOException ex) {
+        System.err.println(jarName + ": " + ex);
+        System.exit(1);
+      }
+    }
+  }
+
+  private static void strip(Path input, Path output) throws IOException {
+    Map<String, byte[]> entries = new TreeMap<>();
+    try (ZipInputStream in = new ZipInputStream(Files.newInputStream(input))) {
+      ZipEntry entry;
+      while ((entry = in.getNextEntry()) != null) {
+        String name = entry.getName();
+        if (entry.isDirectory() || name.equals("META-INF/MANIFEST.MF")) {
+          continue;
+        }
+        byte[] content = readAll(in);
+        if (name.endsWith(".class") && !name.endsWith("module-info.class")) {
+          content = ClassStripper.strip(content);
+          if (content == null) {
+            continue;
+          }
+        }
+        entries.put(name, content);
+      }
+    }
+
+    Files.createDirectories(output.toAbsolutePath().getParent());
+    try (OutputStream file = Files.newOutputStream(output);
+        ZipOutputStream out = new ZipOutputStream(file)) {
+      for (Map.Entry<String, byte[]> entry : entries.entrySet()) {
+        ZipEntry zipEntry = new ZipEntry(entry.getKey());
+        zipEntry.setTime(ENTRY_TIME);
+        out.putNextEntry(zipEntry);
+        out.write(entry.getValue());
+        out.closeEntry();
+      }
+    }
+  }
+
+  private static byte[] readAll(InputStream in) throws IOException {
+    ByteArrayOutputStream out = new ByteArrayOutputStream();
+    byte[] buffer = new byte[8192];
+    int read;
+    while ((read = in.read(buffer)) != -1) {
+      out.write(buffer, 0, read);
+    }
+    return out.toByteArray();
+  }
+
+  private static final class Attribute {
+    final String name;
+    final byte[] data;
+
+    Attribute(String name, byte[] data) {
+      this.name = name;
+      this.data = data;
+    }
+  }
+
+  private static final class Member {
+    final int access;
+    final String name;
+    final String descriptor;
+    final List<Attribute> attributes;
+
+    Member(int access, String name, String descriptor, List<Attribute> attributes) {
+      this.access = access;
+      this.name = name;
+      this.descriptor = descriptor;
+      this.attributes = attributes;
+    }
+  }
+
+  private static final class ClassStripper {
+    private static final int ACC_PRIVATE = 0x0002;
+    private static final int ACC_BRIDGE = 0x0040;
+    private static final int ACC_SYNTHETIC = 0x1000;
+
+    private final int[] tags;
+    private final Object[] values;
+    private final Pool pool = new Pool();
+
+    private ClassStripper(DataInputStream in) throws IOException {
+      int count = in.readUnsignedShort();
+      tags = new int[count];
+      values = new Object[count];
+      for (int i = 1; i < count; i++) {
+        int tag = in.readUnsignedByte();
+        tags[i] = tag;
+        switch (tag) {
+          case 1: // Utf8
+            values[i] = in.readUTF();
+            break;
+          case 3: // Integer
+          case 4: // Float
+            values[i] = in.readInt();
+            break;
+          case 5: // Long
+          case 6: // Double
+            values[i++] = in.readLong();
+            break;
+          case 7: // Class
+          case 8: // String
+          case 16: // MethodType
+          case 19: // Module
+          case 20: // Package
+            values[i] = in.readUnsignedShort();
+            break;
+          case 15: // MethodHandle
+            in.readUnsignedByte();
+            in.readUnsignedShort();
+            break;
+          case 9: // Fieldref
+          case 10: // Methodref
+          case 11: // InterfaceMethodref
+          case 12: // NameAndType
+          case 17: // Dynamic
+          case 18: // InvokeDynamic
+            in.readUnsignedShort();
+            in.readUnsignedShort();
+            break;
+          default:
+            throw new IOException("Unknown constant pool tag " + tag + ".");
+        }
+      }
+    }
+
+    /** Returns the ABI of the given class, or null if it is a local or anonymous class. */
+    static byte[] strip(byte[] classfile) throws IOException {
+      DataInputStream in = new DataInputStream(new ByteArrayInputStream(classfile));
+      if (in.readInt() != 0xCAFEBABE) {
+        throw new IOException("Not a class file.");
+      }
+      int minor = in.readUnsignedShort();
+      int major = in.readUnsignedShort();
+      ClassStripper stripper = new ClassStripper(in);
+
+      int access = in.readUnsignedShort();
+      String name = stripper.className(in.readUnsignedShort());
+      int superIndex = in.readUnsignedShort();
+      String superName = superIndex == 0 ? null : stripper.className(superIndex);
+      List<String> interfaces = new ArrayList<>();
+      int interfaceCount = in.readUnsignedShort();
+      for (int i = 0; i < interfaceCount; i++) {
+        interfaces.add(stripper.className(in.readUnsignedShort()));
+      }
+      List<Member> fields = stripper.readMembers(in);
+      List<Member> methods = stripper.readMembers(in);
+      List<Attribute> attributes = stripper.readAttributes(in);
+      for (Attribute attribute : attributes) {
+        if (attribute.name.equals("EnclosingMethod")) {
+          return null;
+        }
+      }
+
+      ByteArrayOutputStream bodyBytes = new ByteArrayOutputStream();
+      DataOutputStream body = new DataOutputStream(bodyBytes);
+      Pool pool = stripper.pool;
+      body.writeShort(access);
+      body.writeShort(pool.classRef(name));
+      body.writeShort(superName == null ? 0 : pool.classRef(superName));
+      body.writeShort(interfaces.size());
+      for (String iface : interfaces) {
+        body.writeShort(pool.classRef(iface));
+      }
+      stripper.writeMembers(body, fields, false);
+      stripper.writeMembers(body, methods, true);
+      stripper.writeAttributes(body, attributes);
+
+      ByteArrayOutputStream result = new ByteArrayOutputStream();
+      DataOutputStream out = new DataOutputStream(result);
+      out.writeInt(0xCAFEBABE);
+      out.writeShort(minor);
+      out.writeShort(major);
+      out.writeShort(pool.size());
+      out.write(pool.bytes());
+      out.write(bodyBytes.toByteArray());
+      return result.toByteArray();
+    }
+
+    private String utf8(int index) {
+      return (String) values[index];
+    }
+
+    private String className(int index) {
+      return utf8((Integer) values[index]);
+    }
+
+    /** Copies a loadable constant into the new pool, returning its new index. */
+    private int constant(int index) throws IOException {
+      switch (tags[index]) {
+        case 1:
+          return pool.utf8(utf8(index));
+        case 3:
+        case 4:
+          return pool.add(tags[index], (Integer) values[index]);
+        case 5:
+        case 6:
+          return pool.add(tags[index], (Long) values[index]);
+        case 7:
+          return pool.classRef(className(index));
+        case 8:
+          return pool.string(utf8((Integer) values[index]));
+        default:
+          throw new IOException("Unexpected constant pool tag " + tags[index] + ".");
+      }
+    }
+
+    private List<Member> readMembers(DataInputStream in) throws IOException {
+      List<Member> members = new ArrayList<>();
+      int count = in.readUnsignedShort();
+      for (int i = 0; i < count; i++) {
+        int access = in.readUnsignedShort();
+        String name = utf8(in.readUnsignedShort());
+        String descriptor = utf8(in.readUnsignedShort());
+        members.add(new Member(access, name, descriptor, readAttributes(in)));
+      }
+      return members;
+    }
+
+    private List<Attribute> readAttributes(DataInputStream in) throws IOException {
+      List<Attribute> attributes = new ArrayList<>();
+      int count = in.readUnsignedShort();
+      for (int i = 0; i < count; i++) {
+        String name = utf8(in.readUnsignedShort());
+        byte[] data = new byte[in.readInt()];
+        in.readFully(data);
+        attributes.add(new Attribute(name, data));
+      }
+      return attributes;
+    }
+
+    private void writeMembers(DataOutputStream out, List<Member> members, boolean methods)
+        throws IOException {
+      List<Member> kept = new ArrayList<>();
+      for (Member member : members) {
+        boolean synthetic = (member.access & ACC_SYNTHETIC) != 0;
+        boolean bridge = methods && (member.access & ACC_BRIDGE) != 0;
+        if ((member.access & ACC_PRIVATE) == 0 && (!synthetic || bridge)) {
+          kept.add(member);
+        }
+      }
+      out.writeShort(kept.size());
+      for (Member member : kept) {
+        out.writeShort(member.access);
+        out.writeShort(pool.utf8(member.name));
+        out.writeShort(pool.utf8(member.descriptor));
+        writeAttributes(out, member.attributes);
+      }
+    }
+
+    /** Writes the attributes which are needed to compile against a class, dropping the rest. */
+    private void writeAttributes(DataOutputStream out, List<Attribute> attributes)
+        throws IOException {
+      List<Attribute> kept = new ArrayList<>();
+      for (Attribute attribute : attributes) {
+        byte[] data = rewrite(attribute);
+        if (data != null) {
+          kept.add(new Attribute(attribute.name, data));
+        }
+      }
+      out.writeShort(kept.size());
+      for (Attribute attribute : kept) {
+        out.writeShort(pool.utf8(attribute.name));
+        out.writeInt(attribute.data.length);
+        out.write(attribute.data);
+      }
+    }
+
+    /** Returns the attribute with its constant pool references remapped, or null to drop it. */
+    private byte[] rewrite(Attribute attribute) throws IOException {
+      DataInputStream in = new DataInputStream(new ByteArrayInputStream(attribute.data));
+      ByteArrayOutputStream bytes = new ByteArrayOutputStream();
+      DataOutputStream out = new DataOutputStream(bytes);
+      switch (attribute.name) {
+        case "Deprecated":
+        case "Synthetic":
+          break;
+        case "Signature":
+          out.writeShort(pool.utf8(utf8(in.readUnsignedShort())));
+          break;
+        case "ConstantValue":
+          out.writeShort(constant(in.readUnsignedShort()));
+          break;
+        case "Exceptions":
+        case "PermittedSubclasses":
+          {
+            int count = in.readUnsignedShort();
+            out.writeShort(count);
+            for (int i = 0; i < count; i++) {
+              out.writeShort(pool.classRef(className(in.readUnsignedShort())));
+            }
+            break;
+          }
+        case "InnerClasses":
+          {
+            // Local and anonymous classes are removed, so drop their entries.
+            List<int[]> entries = new ArrayList<>();
+            int count = in.readUnsignedShort();
+            for (int i = 0; i < count; i++) {
+              int[] entry = {
+                in.readUnsignedShort(),
+                in.readUnsignedShort(),
+                in.readUnsignedShort(),
+                in.readUnsignedShort()
+              };
+              if (entry[1] != 0 && entry[2] != 0) {
+                entries.add(entry);
+              }
+            }
+            if (entries.isEmpty()) {
+              return null;
+            }
+            out.writeShort(entries.size());
+            for (int[] entry : entries) {
+              out.writeShort(pool.classRef(className(entry[0])));
+              out.writeShort(pool.classRef(className(entry[1])));
+              out.writeShort(pool.utf8(utf8(entry[2])));
+              out.writeShort(entry[3]);
+            }
+            break;
+          }
+        case "MethodParameters":
+          {
+            int count = in.readUnsignedByte();
+            out.writeByte(count);
+            for (int i = 0; i < count; i++) {
+              int name = in.readUnsignedShort();
+              out.writeShort(name == 0 ? 0 : pool.utf8(utf8(name)));
+              out.writeShort(in.readUnsignedShort());
+            }
+            break;
+          }
+        case "Record":
+          {
+            int count = in.readUnsignedShort();
+            out.writeShort(count);
+            for (int i = 0; i < count; i++) {
+              out.writeShort(pool.utf8(utf8(in.readUnsignedShort())));
+              out.writeShort(pool.utf8(utf8(in.readUnsignedShort())));
+              writeAttributes(out, readAttributes(in));
+            }
+            break;
+          }
+        case "RuntimeVisibleAnnotations":
+        case "RuntimeInvisibleAnnotations":
+          copyAnnotations(in, out);
+          break;
+        case "RuntimeVisibleParameterAnnotations":
+        case "RuntimeInvisibleParameterAnnotations":
+          {
+            int count = in.readUnsignedByte();
+            out.writeByte(count);
+            for (int i = 0; i < count; i++) {
+              copyAnnotations(in, out);
+            }
+            break;
+          }
+        case "RuntimeVisibleTypeAnnotations":
+        case "RuntimeInvisibleTypeAnnotations":
+          if (!copyTypeAnnotations(in, out)) {
+            return null;
+          }
+          break;
+        case "AnnotationDefault":
+          copyElementValue(in, out);
+          break;
+        default:
+          // Code, debug information, bootstrap methods, nest membership, etc.
+          return null;
+      }
+      return bytes.toByteArray();
+    }
+
+    private void copyAnnotations(DataInputStream in, DataOutputStream out) throws IOException {
+      int count = in.readUnsignedShort();
+      out.writeShort(count);
+      for (int i = 0; i < count; i++) {
+        copyAnnotation(in, out);
+      }
+    }
+
+    private void copyAnnotation(DataInputStream in, DataOutputStream out) throws IOException {
+      out.writeShort(pool.utf8(utf8(in.readUnsignedShort())));
+      int pairs = in.readUnsignedShort();
+      out.writeShort(pairs);
+      for (int i = 0; i < pairs; i++) {
+        out.writeShort(pool.utf8(utf8(in.readUnsignedShort())));
+        copyElementValue(in, out);
+      }
+    }
+
+    private void copyElementValue(DataInputStream in, DataOutputStream out) throws IOException {
+      int tag = in.readUnsignedByte();
+      out.writeByte(tag);
+      switch ((char) tag) {
+        case 'e':
+          out.writeShort(pool.utf8(utf8(in.readUnsignedShort())));
+          out.writeShort(pool.utf8(utf8(in.readUnsignedShort())));
+          break;
+        case 'c':
+          out.writeShort(pool.utf8(utf8(in.readUnsignedShort())));
+          break;
+        case '@':
+          copyAnnotation(in, out);
+          break;
+        case '[':
+          {
+            int count = in.readUnsignedShort();
+            out.writeShort(count);
+            for (int i = 0; i < count; i++) {
+              copyElementValue(in, out);
+            }
+            break;
+          }
+        default:
+          out.writeShort(constant(in.readUnsignedShort()));
+          break;
+      }
+    }
+
+    /**
+     * Copies type annotations on declarations. Returns false for targets which only occur in
+     * method bodies, which are not expected outside of `Code` attributes.
+     */
+    private boolean copyTypeAnnotations(DataInputStream in, DataOutputStream out)
+        throws IOException {
+      int count = in.readUnsignedShort();
+      out.writeShort(count);
+      for (int i = 0; i < count; i++) {
+        int targetType = in.readUnsignedByte();
+        out.writeByte(targetType);
+        switch (targetType) {
+          case 0x00: // Type parameter of a class.
+          case 0x01: // Type parameter of a method.
+          case 0x16: // Formal parameter.
+            out.writeByte(in.readUnsignedByte());
+            break;
+          case 0x10: // Supertype.
+          case 0x17: // Throws clause.
+            out.writeShort(in.readUnsignedShort());
+            break;
+          case 0x11: // Bound of a class type parameter.
+          case 0x12: // Bound of a method type parameter.
+            out.writeByte(in.readUnsignedByte());
+            out.writeByte(in.readUnsignedByte());
+            break;
+          case 0x13: // Field or record component.
+          case 0x14: // Return type or constructed type.
+          case 0x15: // Receiver type.
+            break;
+          default:
+            return false;
+        }
+        int pathLength = in.readUnsignedByte();
+        out.writeByte(pathLength);
+        for (int j = 0; j < pathLength; j++) {
+          out.writeByte(in.readUnsignedByte());
+          out.writeByte(in.readUnsignedByte());
+        }
+        copyAnnotation(in, out);
+      }
+      return true;
+    }
+  }
+
+  /** A constant pool which is built up in order of first use. */
+  private static final class Pool {
+    private final Map<String, Integer> indices = new HashMap<>();
+    private final ByteArrayOutputStream bytes = new ByteArrayOutputStream();
+    private final DataOutputStream out = new DataOutputStream(bytes);
+    private int next = 1;
+
+    int size() {
+      return next;
+    }
+
+    byte[] bytes() {
+      return bytes.toByteArray();
+    }
+
+    int utf8(String value) throws IOException {
+      String key = "1:" + value;
+      Integer index = indices.get(key);
+      if (index == null) {
+        out.writeByte(1);
+        out.writeUTF(value);
+        index = allocate(key, 1);
+      }
+      return index;
+    }
+
+    int classRef(String name) throws IOException {
+      return ref(7, name);
+    }
+
+    int string(String value) throws IOException {
+      return ref(8, value);
+    }
+
+    private int ref(int tag, String value) throws IOException {
+      String key = tag + ":" + value;
+      Integer index = indices.get(key);
+      if (index == null) {
+        int utf8 = utf8(value);
+        out.writeByte(tag);
+        out.writeShort(utf8);
+        index = allocate(key, 1);
+      }
+      return index;
+    }
+
+    int add(int tag, int bits) throws IOException {
+      String key = tag + ":" + bits;
+      Integer index = indices.get(key);
+      if (index == null) {
+        out.writeByte(tag);
+        out.writeInt(bits);
+        index = allocate(key, 1);
+      }
+      return index;
+    }
+
+    int add(int tag, long bits) throws IOException {
+      String key = tag + ":" + bits;
+      Integer index = indices.get(key);
+      if (index == null) {
+        out.writeByte(tag);
+        out.writeLong(bits);
+        // Longs and doubles take up two slots.
+        index = allocate(key, 2);
+      }
+      return index;
+    }
+
+    private int allocate(String key, int slots) {
+      int index = next;
+      indices.put(key, index);
+      next += slots;
+      return index;
+    }
+  }
+}
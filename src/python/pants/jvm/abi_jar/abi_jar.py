@@ -0,0 +1,120 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Tuple
+
+from pants.engine.fs import AddPrefix, CreateDigest, Digest, Directory, FileContent
+from pants.engine.internals.native_engine import RemovePrefix
+from pants.engine.process import ProcessResult
+from pants.engine.rules import Get, collect_rules, rule
+from pants.jvm.jdk_rules import InternalJdk, JvmProcess
+from pants.util.logging import LogLevel
+from pants.util.resources import read_resource
+
+_ABI_JAR_BASENAME = "AbiJar.java"
+_OUTPUT_PATH = "__abi_jars"
+
+
+@dataclass(frozen=True)
+class AbiJarRequest:
+    """Create ABI jars for the given jars, at the same filenames.
+
+    An ABI jar only contains what is needed to compile against a jar (its non-private signatures,
+    constants and annotations), so a change which does not affect the API of a jar (such as a
+    change to a method body) produces an identical ABI jar.
+    """
+
+    digest: Digest
+    filenames: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class AbiJarCompiledClassfiles:
+    digest: Digest
+
+
+@rule(level=LogLevel.DEBUG)
+async def create_abi_jars(
+    processor_classfiles: AbiJarCompiledClassfiles,
+    jdk: InternalJdk,
+    request: AbiJarRequest,
+) -> Digest:
+    filenames = list(request.filenames)
+
+    if len(filenames) == 0:
+        return request.digest
+
+    input_path = "__jars_to_strip"
+    processorcp_relpath = "__processorcp"
+
+    prefixed_jars_digest = await Get(Digest, AddPrefix(request.digest, input_path))
+
+    extra_immutable_input_digests = {
+        processorcp_relpath: processor_classfiles.digest,
+    }
+
+    process_result = await Get(
+        ProcessResult,
+        JvmProcess(
+            jdk=jdk,
+            classpath_entries=[processorcp_relpath],
+            argv=["org.pantsbuild.abijar.AbiJar", input_path, _OUTPUT_PATH, *filenames],
+            input_digest=prefixed_jars_digest,
+            extra_immutable_input_digests=extra_immutable_input_digests,
+            output_directories=(_OUTPUT_PATH,),
+            extra_nailgun_keys=extra_immutable_input_digests,
+            description=f"Create ABI jar for {filenames[0]}",
+            level=LogLevel.DEBUG,
+        ),
+    )
+
+    return await Get(Digest, RemovePrefix(process_result.output_digest, _OUTPUT_PATH))
+
+
+# TODO(13879): Consolidate compilation of wrapper binaries to common rules.
+@rule
+async def build_processors(jdk: InternalJdk) -> AbiJarCompiledClassfiles:
+    dest_dir = "classfiles"
+    source_digest = await Get(
+        Digest,
+        CreateDigest(
+            [
+                FileContent(
+                    path=_ABI_JAR_BASENAME,
+                    content=read_resource("pants.jvm.abi_jar", _ABI_JAR_BASENAME),
+                ),
+                Directory(dest_dir),
+            ]
+        ),
+    )
+
+    process_result = await Get(
+        ProcessResult,
+        JvmProcess(
+            jdk=jdk,
+            classpath_entries=[f"{jdk.java_home}/lib/tools.jar"],
+            argv=[
+                "com.sun.tools.javac.Main",
+                "-d",
+                dest_dir,
+                _ABI_JAR_BASENAME,
+            ],
+            input_digest=source_digest,
+            output_directories=(dest_dir,),
+            description=f"Compile {_ABI_JAR_BASENAME} with javac",
+            level=LogLevel.DEBUG,
+            # NB: We do not use nailgun for this process, since it is launched exactly once.
+            use_nailgun=False,
+        ),
+    )
+    stripped_classfiles_digest = await Get(
+        Digest, RemovePrefix(process_result.output_digest, dest_dir)
+    )
+    return AbiJarCompiledClassfiles(digest=stripped_classfiles_digest)
+
+
+def rules():
+    return collect_rules()
@@ -0,0 +1,124 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from textwrap import dedent
+
+import pytest
+
+from pants.backend.java.compile.javac import rules as javac_rules
+from pants.backend.java.dependency_inference.rules import rules as java_dep_inf_rules
+from pants.backend.java.target_types import JavaSourcesGeneratorTarget
+from pants.backend.java.target_types import rules as target_types_rules
+from pants.build_graph.address import Address
+from pants.core.util_rules.archive import rules as archive_rules
+from pants.engine.addresses import Addresses
+from pants.engine.internals.graph import rules as graph_rules
+from pants.engine.internals.native_engine import Digest, MergeDigests
+from pants.jvm import jdk_rules
+from pants.jvm.abi_jar import abi_jar
+from pants.jvm.abi_jar.abi_jar import AbiJarRequest
+from pants.jvm.classpath import Classpath
+from pants.jvm.classpath import rules as classpath_rules
+from pants.jvm.resolve import jvm_tool
+from pants.jvm.resolve.coursier_test_util import EMPTY_JVM_LOCKFILE
+from pants.jvm.strip_jar import strip_jar
+from pants.jvm.testutil import maybe_skip_jdk_test
+from pants.jvm.util_rules import rules as util_rules
+from pants.testutil.rule_runner import PYTHON_BOOTSTRAP_ENV, QueryRule, RuleRunner
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    rule_runner = RuleRunner(
+        rules=[
+            *classpath_rules(),
+            *archive_rules(),
+            *abi_jar.rules(),
+            *strip_jar.rules(),
+            *jvm_tool.rules(),
+            *graph_rules(),
+            *javac_rules(),
+            *jdk_rules.rules(),
+            *java_dep_inf_rules(),
+            *target_types_rules(),
+            *util_rules(),
+            QueryRule(Classpath, (Addresses,)),
+            QueryRule(Digest, (AbiJarRequest,)),
+        ],
+        target_types=[
+            JavaSourcesGeneratorTarget,
+        ],
+    )
+    rule_runner.set_options(args=[], env_inherit=PYTHON_BOOTSTRAP_ENV)
+    return rule_runner
+
+
+def _abi_jar_for(rule_runner: RuleRunner, source: str) -> Digest:
+    rule_runner.write_files(
+        {
+            "BUILD": 'java_sources(name="example")',
+            "3rdparty/jvm/default.lock": EMPTY_JVM_LOCKFILE,
+            "Example.java": dedent(source),
+        }
+    )
+    tgt = rule_runner.get_target(Address("", target_name="example"))
+    classpath = rule_runner.request(Classpath, [Addresses((tgt.address,))])
+    jar = rule_runner.request(Digest, [MergeDigests([*classpath.digests()])])
+    return rule_runner.request(Digest, [AbiJarRequest(jar, tuple(classpath.args()))])
+
+
+@maybe_skip_jdk_test
+def test_abi_jar_ignores_implementation(rule_runner: RuleRunner) -> None:
+    original = _abi_jar_for(
+        rule_runner,
+        """
+        package org.pantsbuild.example;
+
+        public class Example {
+            public static final String GREETING = "Hello";
+
+            public static String greet(String name) {
+                return GREETING + ", " + name + "!";
+            }
+        }
+        """,
+    )
+    implementation_changed = _abi_jar_for(
+        rule_runner,
+        """
+        package org.pantsbuild.example;
+
+        public class Example {
+            public static final String GREETING = "Hello";
+
+            public static String greet(String name) {
+                return helper(name);
+            }
+
+            private static String helper(String name) {
+                Runnable r = () -> System.out.println(name);
+                r.run();
+                return GREETING + " " + name;
+            }
+        }
+        """,
+    )
+    api_changed = _abi_jar_for(
+        rule_runner,
+        """
+        package org.pantsbuild.example;
+
+        public class Example {
+            public static final String GREETING = "Goodbye";
+
+            public static String greet(String name) {
+                return GREETING + ", " + name + "!";
+            }
+        }
+        """,
+    )
+
+    assert original == implementation_changed
+    assert original != api_changed
@@ -5,17 +5,18 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Iterator
+from typing import Iterable, Iterator
 
 from pants.core.util_rules import system_binaries
 from pants.core.util_rules.system_binaries import UnzipBinary
-from pants.engine.fs import Digest, MergeDigests, RemovePrefix
+from pants.engine.fs import Digest, DigestSubset, MergeDigests, PathGlobs, RemovePrefix
 from pants.engine.process import Process, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import CoarsenedTargets
 from pants.jvm.compile import ClasspathEntry, ClasspathEntryRequest, ClasspathEntryRequestFactory
 from pants.jvm.compile import rules as jvm_compile_rules
 from pants.jvm.resolve.key import CoursierResolveKey
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 
 logger = logging.getLogger(__name__)
@@ -92,6 +93,69 @@ async def classpath(
     return Classpath(classpath_entries, resolve)
 
 
+@dataclass(frozen=True)
+class ClasspathJarFarm:
+    """The JARs of a `Classpath`, as a "farm" of immutable inputs with one input per unique JAR.
+
+    `Classpath.immutable_inputs` has one input per `ClasspathEntry`, and so a JAR which is exported
+    by multiple entries (as the transitive dependencies of third-party artifacts are) is
+    materialized once per entry. The inputs of a farm are instead keyed by the Digest of each
+    individual JAR: because immutable inputs are materialized once per Digest and then symlinked
+    into each sandbox, every process using a farm shares a single copy of each JAR.
+
+    Use `immutable_input_digests` as the argument to `Process.immutable_input_digests` (or
+    `JvmProcess.extra_immutable_input_digests`), and `args`/`root_args` as classpath entries.
+    """
+
+    immutable_input_digests: FrozenDict[str, Digest]
+    args: tuple[str, ...]
+    root_args: tuple[str, ...]
+
+
+_JAR_FARM_PREFIX = "__jars"
+
+
+@rule
+async def classpath_jar_farm(classpath: Classpath) -> ClasspathJarFarm:
+    entries = tuple(ClasspathEntry.closure(classpath.entries))
+
+    # Entries which contain a single JAR already have a Digest per JAR: split the others.
+    split_jars = tuple(
+        (entry, filename)
+        for entry in entries
+        if len(entry.filenames) > 1
+        for filename in entry.filenames
+    )
+    split_digests = await MultiGet(
+        Get(Digest, DigestSubset(entry.digest, PathGlobs([filename])))
+        for entry, filename in split_jars
+    )
+    jar_digests = dict(zip(split_jars, split_digests))
+
+    immutable_input_digests: dict[str, Digest] = {}
+    jar_args: dict[tuple[ClasspathEntry, str], str] = {}
+    for entry in entries:
+        for filename in entry.filenames:
+            digest = jar_digests.get((entry, filename), entry.digest)
+            relpath = f"{_JAR_FARM_PREFIX}/{digest.fingerprint[:12]}"
+            immutable_input_digests[relpath] = digest
+            jar_args[(entry, filename)] = f"{relpath}/{filename}"
+
+    def args(entries: Iterable[ClasspathEntry]) -> tuple[str, ...]:
+        # A JAR may be exported by multiple entries: only the first occurrence is significant.
+        return tuple(
+            dict.fromkeys(
+                jar_args[(entry, filename)] for entry in entries for filename in entry.filenames
+            )
+        )
+
+    return ClasspathJarFarm(
+        immutable_input_digests=FrozenDict(immutable_input_digests),
+        args=args(entries),
+        root_args=args(classpath.entries),
+    )
+
+
 @dataclass(frozen=True)
 class LooseClassfiles:
     """The contents of a classpath entry as loose classfiles.
@@ -0,0 +1,145 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import ast
+import logging
+import os
+import time
+
+import pytest
+
+from pants.engine.fs import EMPTY_DIGEST, CreateDigest, Digest, FileContent, MergeDigests
+from pants.engine.process import Process, ProcessResult
+from pants.jvm import classpath
+from pants.jvm.classpath import Classpath, ClasspathJarFarm
+from pants.jvm.compile import ClasspathEntry
+from pants.jvm.resolve.key import CoursierResolveKey
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+
+logger = logging.getLogger(__name__)
+
+# Benchmarks set up sandboxes for large classpaths, which is slow, so they only run when asked for,
+# e.g. with `--test-extra-env-vars=PANTS_RUN_BENCHMARKS=True`.
+run_benchmarks = bool(ast.literal_eval(os.environ.get("PANTS_RUN_BENCHMARKS", "False")))
+
+
+@pytest.fixture
+def rule_runner() -> RuleRunner:
+    return RuleRunner(
+        rules=[
+            *classpath.rules(),
+            QueryRule(ClasspathJarFarm, (Classpath,)),
+            QueryRule(Digest, (CreateDigest,)),
+            QueryRule(Digest, (MergeDigests,)),
+            QueryRule(ProcessResult, (Process,)),
+        ],
+    )
+
+
+def _jar_entry(rule_runner: RuleRunner, filename: str) -> ClasspathEntry:
+    digest = rule_runner.request(Digest, [CreateDigest([FileContent(filename, filename.encode())])])
+    return ClasspathEntry(digest, (filename,))
+
+
+def _exporting_entry(rule_runner: RuleRunner, entries: list[ClasspathEntry]) -> ClasspathEntry:
+    """An entry which exports the given entries, in the style of a third-party artifact."""
+    digest = rule_runner.request(Digest, [MergeDigests(entry.digest for entry in entries)])
+    return ClasspathEntry.merge(digest, entries)
+
+
+def _classpath(*entries: ClasspathEntry) -> Classpath:
+    return Classpath(entries, CoursierResolveKey("example", "example.lock", EMPTY_DIGEST))
+
+
+def _check_files_process(
+    argv: tuple[str, ...],
+    *,
+    input_digest: Digest = EMPTY_DIGEST,
+    immutable_input_digests: dict[str, Digest] | None = None,
+    salt: int = 0,
+) -> Process:
+    return Process(
+        argv=("/bin/sh", "-c", 'for f in "$@"; do test -f "$f" || exit 1; done', "sh", *argv),
+        input_digest=input_digest,
+        immutable_input_digests=immutable_input_digests,
+        env={"SALT": str(salt)},
+        description=f"Check {len(argv)} classpath entries",
+    )
+
+
+def test_jar_farm_deduplicates_exported_jars(rule_runner: RuleRunner) -> None:
+    a, b, c = (_jar_entry(rule_runner, f"{name}.jar") for name in ("a", "b", "c"))
+    root = ClasspathEntry(
+        EMPTY_DIGEST,
+        dependencies=(_exporting_entry(rule_runner, [a, b]), _exporting_entry(rule_runner, [b, c])),
+    )
+    first_party = _jar_entry(rule_runner, "first_party.jar")
+
+    jar_farm = rule_runner.request(ClasspathJarFarm, [_classpath(first_party, root)])
+
+    # Each unique JAR appears in the farm (and on the classpath) exactly once.
+    assert len(jar_farm.immutable_input_digests) == 4
+    assert [arg.rsplit("/", 1)[1] for arg in jar_farm.args] == [
+        "first_party.jar",
+        "a.jar",
+        "b.jar",
+        "c.jar",
+    ]
+    assert [arg.rsplit("/", 1)[1] for arg in jar_farm.root_args] == ["first_party.jar"]
+
+    rule_runner.request(
+        ProcessResult,
+        [
+            _check_files_process(
+                jar_farm.args, immutable_input_digests=dict(jar_farm.immutable_input_digests)
+            )
+        ],
+    )
+
+
+@pytest.mark.skipif(not run_benchmarks, reason="Set PANTS_RUN_BENCHMARKS=True to run benchmarks")
+def test_jar_farm_sandbox_setup_benchmark(rule_runner: RuleRunner) -> None:
+    """Compares sandbox setup for a 1,500 JAR classpath with and without a jar farm.
+
+    The JARs are exported in overlapping groups (as the transitive dependencies of third-party
+    artifacts are), and several distinct processes are run against each classpath. The timings are
+    logged rather than asserted, since they depend on the machine running the test.
+    """
+    jars = [_jar_entry(rule_runner, f"jar_{i}.jar") for i in range(1500)]
+    artifacts = [_exporting_entry(rule_runner, jars[i : i + 30]) for i in range(0, 1500, 15)]
+    cp = _classpath(ClasspathEntry(EMPTY_DIGEST, dependencies=artifacts))
+    process_count = 5
+
+    start = time.monotonic()
+    input_digest = rule_runner.request(Digest, [MergeDigests(cp.digests())])
+    for i in range(process_count):
+        rule_runner.request(
+            ProcessResult,
+            [_check_files_process(tuple(cp.args()), input_digest=input_digest, salt=i)],
+        )
+    input_digest_seconds = time.monotonic() - start
+
+    start = time.monotonic()
+    jar_farm = rule_runner.request(ClasspathJarFarm, [cp])
+    for i in range(process_count):
+        rule_runner.request(
+            ProcessResult,
+            [
+                _check_files_process(
+                    jar_farm.args,
+                    immutable_input_digests=dict(jar_farm.immutable_input_digests),
+                    salt=i,
+                )
+            ],
+        )
+    jar_farm_seconds = time.monotonic() - start
+
+    assert len(jar_farm.args) == 1500
+    assert len(jar_farm.immutable_input_digests) == 1500
+    logger.info(
+        f"Sandbox setup for {process_count} processes with a 1500 JAR classpath: "
+        f"{input_digest_seconds:.2f}s with an input digest, {jar_farm_seconds:.2f}s with a "
+        "jar farm."
+    )
@@ -230,6 +230,11 @@ class ClasspathEntry:
     If `[jvm].reproducible_jars`, then all JARs in a classpath entry must have had timestamps
     stripped -- either natively, or via the `pants.jvm.strip_jar` rules.
 
+    An entry may additionally have an `abi_digest`, containing ABI-only versions of its JARs (see
+    `pants.jvm.abi_jar`) at the same filenames. Compilers should use `for_compilation` to compile
+    against those where they are available, so that changes to the implementation of a dependency
+    do not invalidate the compilation of its dependents.
+
     TODO: Move to `classpath.py`.
     TODO: Generalize via https://github.com/pantsbuild/pants/issues/13112.
 
@@ -241,26 +246,68 @@ class ClasspathEntry:
     digest: Digest
     filenames: tuple[str, ...]
     dependencies: FrozenOrderedSet[ClasspathEntry]
+    abi_digest: Digest | None
 
     def __init__(
         self,
         digest: Digest,
         filenames: Iterable[str] = (),
         dependencies: Iterable[ClasspathEntry] = (),
+        abi_digest: Digest | None = None,
     ):
         object.__setattr__(self, "digest", digest)
         object.__setattr__(self, "filenames", tuple(filenames))
         object.__setattr__(self, "dependencies", FrozenOrderedSet(dependencies))
+        object.__setattr__(self, "abi_digest", abi_digest)
 
     @classmethod
-    def merge(cls, digest: Digest, entries: Iterable[ClasspathEntry]) -> ClasspathEntry:
-        """After merging the Digests for entries, merge their filenames and dependencies."""
+    def merge(
+        cls,
+        digest: Digest,
+        entries: Iterable[ClasspathEntry],
+        *,
+        abi_digest: Digest | None = None,
+    ) -> ClasspathEntry:
+        """After merging the Digests for entries, merge their filenames and dependencies.
+
+        If any of the entries have ABI jars, `abi_digest` should be the merge of their
+        `compile_digest`s.
+        """
+        entries = list(entries)
         return cls(
             digest,
             (f for cpe in entries for f in cpe.filenames),
             (d for cpe in entries for d in cpe.dependencies),
+            abi_digest,
         )
 
+    @property
+    def compile_digest(self) -> Digest:
+        """The Digest to compile against: the ABI jars of this entry if it has them."""
+        return self.abi_digest or self.digest
+
+    @classmethod
+    def for_compilation(cls, entries: Iterable[ClasspathEntry]) -> tuple[ClasspathEntry, ...]:
+        """Returns the given entries and their dependencies with their ABI jars (if any) in place
+        of their full jars.
+
+        The result should only be used for compile classpaths: ABI jars are not runnable.
+        """
+        memo: dict[ClasspathEntry, ClasspathEntry] = {}
+
+        def visit(entry: ClasspathEntry) -> ClasspathEntry:
+            result = memo.get(entry)
+            if result is None:
+                result = cls(
+                    entry.compile_digest,
+                    entry.filenames,
+                    (visit(dep) for dep in entry.dependencies),
+                )
+                memo[entry] = result
+            return result
+
+        return tuple(visit(entry) for entry in entries)
+
     @classmethod
     def args(cls, entries: Iterable[ClasspathEntry], *, prefix: str = "") -> Iterator[str]:
         """Returns the filenames for the given entries.
@@ -8,7 +8,7 @@ from typing import Any, DefaultDict, Iterable, Iterator, Tuple
 
 from pants.backend.java.subsystems.java_infer import JavaInferSubsystem
 from pants.build_graph.address import Address
-from pants.engine.rules import collect_rules, rule
+from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import AllTargets, Targets
 from pants.jvm.dependency_inference.jvm_artifact_mappings import JVM_ARTIFACT_MAPPINGS
 from pants.jvm.resolve.common import ArtifactRequirement
@@ -137,6 +137,21 @@ class FrozenTrieNode:
         )
         object.__setattr__(self, "_first_party", node.first_party)
 
+    @classmethod
+    def _create(
+        cls,
+        children: FrozenDict[str, FrozenTrieNode],
+        recursive: bool,
+        addresses: FrozenDict[SymbolNamespace, FrozenOrderedSet[Address]],
+        first_party: bool,
+    ) -> FrozenTrieNode:
+        node = cls.__new__(cls)
+        object.__setattr__(node, "_children", children)
+        object.__setattr__(node, "_recursive", recursive)
+        object.__setattr__(node, "_addresses", addresses)
+        object.__setattr__(node, "_first_party", first_party)
+        return node
+
     def find_child(self, name: str) -> FrozenTrieNode | None:
         return self._children.get(name)
 
@@ -187,20 +202,40 @@ class FrozenTrieNode:
     def merge(cls, nodes: Iterable[FrozenTrieNode]) -> FrozenTrieNode:
         """Merges the given `FrozenTrieNode` instances.
 
-        TODO: This is currently implemented as merging-from-scratch, but could be trie-aware.
+        The result is equivalent to inserting the symbols of each node into a `MutableTrieNode` in
+        order: addresses are unioned, and the `recursive` and `first_party` flags of a symbol are
+        taken from the last node which declares it. But the merge is trie-aware: a subtrie which
+        appears in only one of the given nodes is shared with the result rather than copied, so
+        the cost of a merge is proportional to the paths that the nodes have in common.
         """
-        result = MutableTrieNode()
+        nodes = list(nodes)
+        if len(nodes) == 1:
+            return nodes[0]
+
+        children: dict[str, list[FrozenTrieNode]] = defaultdict(list)
+        addresses: dict[SymbolNamespace, OrderedSet[Address]] = defaultdict(OrderedSet)
+        recursive = False
+        first_party = False
         for node in nodes:
-            for symbol, recursive, address_namespaces, first_party in node:
-                for namespace, addresses in address_namespaces.items():
-                    result.insert(
-                        symbol,
-                        addresses,
-                        recursive=recursive,
-                        first_party=first_party,
-                        namespace=namespace,
-                    )
-        return FrozenTrieNode(result)
+            for name, child in node._children.items():
+                children[name].append(child)
+            if node._addresses:
+                for namespace, namespace_addresses in node._addresses.items():
+                    addresses[namespace].update(namespace_addresses)
+                recursive = node._recursive
+                first_party = node._first_party
+
+        return cls._create(
+            FrozenDict(
+                (name, cls.merge(named_children)) for name, named_children in children.items()
+            ),
+            recursive,
+            FrozenDict(
+                (namespace, FrozenOrderedSet(namespace_addresses))
+                for namespace, namespace_addresses in addresses.items()
+            ),
+            first_party,
+        )
 
     def to_json_dict(self) -> dict[str, Any]:
         return {
@@ -221,11 +256,7 @@ class FrozenTrieNode:
             symbol.pop()
 
     def __iter__(self) -> Iterator[FrozenTrieNodeItem]:
-        """Iterates through all nodes in the trie.
-
-        TODO: This is primarily used in `FrozenTrieNode.merge`: if that method switches to
-        trie-aware merging, this should likely be removed.
-        """
+        """Iterates through all nodes in the trie."""
         yield from self._iter_helper([])
 
     def __hash__(self) -> int:
@@ -300,6 +331,38 @@ async def find_available_third_party_artifacts(
     )
 
 
+@dataclass(frozen=True)
+class ThirdPartyArtifactSymbolMappingRequest:
+    """The symbols provided by the `jvm_artifact` target(s) for a single coordinate in a resolve."""
+
+    addresses: tuple[Address, ...]
+    packages: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ThirdPartyArtifactSymbolMapping:
+    trie: FrozenTrieNode
+
+
+def _symbol_from_package_pattern(package_pattern: str) -> tuple[str, bool]:
+    wildcard_suffix = ".**"
+    if package_pattern.endswith(wildcard_suffix):
+        return package_pattern[: -len(wildcard_suffix)], True
+    else:
+        return package_pattern, False
+
+
+@rule
+def compute_third_party_artifact_symbol_mapping(
+    request: ThirdPartyArtifactSymbolMappingRequest,
+) -> ThirdPartyArtifactSymbolMapping:
+    mapping = MutableTrieNode()
+    for package in request.packages:
+        symbol, recursive = _symbol_from_package_pattern(package)
+        mapping.insert(symbol, request.addresses, first_party=False, recursive=recursive)
+    return ThirdPartyArtifactSymbolMapping(mapping.frozen())
+
+
 @rule
 async def compute_java_third_party_symbol_mapping(
     java_infer_subsystem: JavaInferSubsystem,
@@ -308,13 +371,6 @@ async def compute_java_third_party_symbol_mapping(
 ) -> ThirdPartySymbolMapping:
     """Implements the mapping logic from the `jvm_artifact` and `java-infer` help."""
 
-    def symbol_from_package_pattern(package_pattern: str) -> tuple[str, bool]:
-        wildcard_suffix = ".**"
-        if package_pattern.endswith(wildcard_suffix):
-            return package_pattern[: -len(wildcard_suffix)], True
-        else:
-            return package_pattern, False
-
     # Build a default mapping from coord to package.
     # TODO: Consider inverting the definitions of these mappings.
     default_coords_to_packages: dict[UnversionedCoordinate, OrderedSet[str]] = defaultdict(
@@ -327,8 +383,10 @@ async def compute_java_third_party_symbol_mapping(
         unversioned_coord = UnversionedCoordinate.from_coord_str(unversioned_coord_str)
         default_coords_to_packages[unversioned_coord].add(package)
 
-    # Build mappings per resolve from packages to addresses.
-    mappings: DefaultDict[_ResolveName, MutableTrieNode] = defaultdict(MutableTrieNode)
+    # Build a mapping per artifact from packages to addresses. Each is memoized independently, so
+    # that editing a single `jvm_artifact` only recomputes the mapping for that artifact.
+    resolve_names: list[_ResolveName] = []
+    artifact_mapping_requests: list[ThirdPartyArtifactSymbolMappingRequest] = []
     for (resolve_name, coord), (addresses, packages) in available_artifacts.items():
         if not packages:
             # If no packages were explicitly defined, fall back to our default mapping.
@@ -336,20 +394,32 @@ async def compute_java_third_party_symbol_mapping(
         if not packages:
             # Default to exposing the `group` name as a package.
             packages = (f"{coord.group}.**",)
-        mapping = mappings[resolve_name]
-        for package in packages:
-            symbol, recursive = symbol_from_package_pattern(package)
-            mapping.insert(symbol, addresses, first_party=False, recursive=recursive)
+        resolve_names.append(resolve_name)
+        artifact_mapping_requests.append(
+            ThirdPartyArtifactSymbolMappingRequest(addresses, packages)
+        )
+    artifact_mappings = await MultiGet(
+        Get(ThirdPartyArtifactSymbolMapping, ThirdPartyArtifactSymbolMappingRequest, request)
+        for request in artifact_mapping_requests
+    )
 
     # Mark types that have strong first-party declarations as first-party
+    provided_types = MutableTrieNode()
     for tgt in all_jvm_type_providing_tgts:
         for provides_type in tgt[JvmProvidesTypesField].value or []:
-            for mapping in mappings.values():
-                mapping.insert(provides_type, [], first_party=True, recursive=False)
+            provided_types.insert(provides_type, [], first_party=True, recursive=False)
+    provided_types_trie = provided_types.frozen()
+
+    # Then merge the mappings for each resolve: the merge shares the subtries of the artifact
+    # mappings wherever they do not overlap.
+    tries_by_resolve: DefaultDict[_ResolveName, list[FrozenTrieNode]] = defaultdict(list)
+    for resolve_name, artifact_mapping in zip(resolve_names, artifact_mappings):
+        tries_by_resolve[resolve_name].append(artifact_mapping.trie)
 
     return ThirdPartySymbolMapping(
         FrozenDict(
-            (resolve_name, FrozenTrieNode(mapping)) for resolve_name, mapping in mappings.items()
+            (resolve_name, FrozenTrieNode.merge([*tries, provided_types_trie]))
+            for resolve_name, tries in tries_by_resolve.items()
         )
     )
 
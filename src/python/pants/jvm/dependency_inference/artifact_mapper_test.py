@@ -90,6 +90,33 @@ def test_trie_node_merge_basic() -> None:
     ]
 
 
+def test_trie_node_merge_shares_disjoint_subtries() -> None:
+    one = MutableTrieNode()
+    one.insert("org.example.one", [Address("1")], recursive=True, first_party=False)
+    two = MutableTrieNode()
+    two.insert("org.example.two", [Address("2")], recursive=False, first_party=False)
+    two.insert("com.example", [Address("3")], recursive=True, first_party=False)
+    one_frozen, two_frozen = one.frozen(), two.frozen()
+
+    merged = FrozenTrieNode.merge([one_frozen, two_frozen])
+
+    def child(node: FrozenTrieNode, *path: str) -> FrozenTrieNode | None:
+        result: FrozenTrieNode | None = node
+        for name in path:
+            assert result is not None
+            result = result.find_child(name)
+        return result
+
+    assert FrozenTrieNode.merge([one_frozen]) is one_frozen
+    # Subtries which appear in only one of the inputs are shared rather than copied.
+    assert child(merged, "com") is child(two_frozen, "com")
+    assert child(merged, "org", "example", "one") is child(one_frozen, "org", "example", "one")
+    assert child(merged, "org", "example", "two") is child(two_frozen, "org", "example", "two")
+    assert merged.addresses_for_symbol("org.example.one.Foo") == FrozenDict(
+        {DEFAULT_SYMBOL_NAMESPACE: FrozenOrderedSet([Address("1")])}
+    )
+
+
 @maybe_skip_jdk_test
 def test_third_party_mapping_parsing(rule_runner: RuleRunner) -> None:
     rule_runner.set_options(
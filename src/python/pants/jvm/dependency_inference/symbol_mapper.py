@@ -6,11 +6,12 @@ from __future__ import annotations
 import logging
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from pants.build_graph.address import Address
 from pants.engine.environment import EnvironmentName
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
+from pants.engine.target import SingleSourceField, Target
 from pants.engine.unions import UnionMembership, union
 from pants.jvm.dependency_inference.artifact_mapper import (
     AllJvmTypeProvidingTargets,
@@ -20,6 +21,7 @@ from pants.jvm.dependency_inference.artifact_mapper import (
 )
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmProvidesTypesField, JvmResolveField
+from pants.util.collections import partition_sequentially
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
@@ -34,6 +36,25 @@ logger = logging.getLogger(__name__)
 
 _ResolveName = str
 
+# The target number of sources to analyze per invocation of a source parser.
+SOURCE_ANALYSIS_BATCH_SIZE = 128
+
+
+def partition_sources_for_analysis(
+    targets: Iterable[Target], source_field: type[SingleSourceField]
+) -> Iterator[list[Target]]:
+    """Partition the given targets into batches whose sources are analyzed together.
+
+    Batches are formed stably (see `partition_sequentially`), so editing, adding or removing a
+    source only invalidates the batch that contains it.
+    """
+    return partition_sequentially(
+        targets,
+        key=lambda tgt: tgt[source_field].file_path,
+        size_target=SOURCE_ANALYSIS_BATCH_SIZE,
+        size_max=4 * SOURCE_ANALYSIS_BATCH_SIZE,
+    )
+
 
 class JvmFirstPartyPackageMappingException(Exception):
     pass
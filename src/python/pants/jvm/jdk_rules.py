@@ -332,6 +332,7 @@ class JvmProcess:
     timeout_seconds: int | float | None
     extra_immutable_input_digests: FrozenDict[str, Digest]
     extra_env: FrozenDict[str, str]
+    extra_append_only_caches: FrozenDict[str, str]
     cache_scope: ProcessCacheScope | None
     use_nailgun: bool
     remote_cache_speculation_delay: int | None
@@ -350,6 +351,7 @@ class JvmProcess:
         output_directories: Iterable[str] | None = None,
         extra_immutable_input_digests: Mapping[str, Digest] | None = None,
         extra_env: Mapping[str, str] | None = None,
+        extra_append_only_caches: Mapping[str, str] | None = None,
         timeout_seconds: int | float | None = None,
         cache_scope: ProcessCacheScope | None = None,
         use_nailgun: bool = True,
@@ -371,6 +373,9 @@ class JvmProcess:
             self, "extra_immutable_input_digests", FrozenDict(extra_immutable_input_digests or {})
         )
         object.__setattr__(self, "extra_env", FrozenDict(extra_env or {}))
+        object.__setattr__(
+            self, "extra_append_only_caches", FrozenDict(extra_append_only_caches or {})
+        )
         object.__setattr__(self, "use_nailgun", use_nailgun)
         object.__setattr__(self, "remote_cache_speculation_delay", remote_cache_speculation_delay)
 
@@ -448,7 +453,7 @@ async def jvm_process(
         output_directories=request.output_directories,
         env=env,
         timeout_seconds=request.timeout_seconds,
-        append_only_caches=jdk.append_only_caches,
+        append_only_caches={**jdk.append_only_caches, **request.extra_append_only_caches},
         output_files=request.output_files,
         cache_scope=request.cache_scope or ProcessCacheScope.SUCCESSFUL,
         remote_cache_speculation_delay_millis=remote_cache_speculation_delay_millis,
@@ -1,9 +1,12 @@
 # Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+from __future__ import annotations
+
 import logging
 from dataclasses import dataclass
 from pathlib import PurePath
+from typing import Iterable
 
 from pants.core.goals.package import (
     BuiltPackage,
@@ -13,8 +16,8 @@ from pants.core.goals.package import (
 )
 from pants.core.goals.run import RunFieldSet, RunInSandboxBehavior
 from pants.engine.addresses import Addresses
-from pants.engine.fs import EMPTY_DIGEST, AddPrefix, Digest, MergeDigests
-from pants.engine.rules import Get, collect_rules, rule
+from pants.engine.fs import EMPTY_DIGEST, AddPrefix, Digest, DigestSubset, MergeDigests, PathGlobs
+from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import Dependencies
 from pants.engine.unions import UnionRule
 from pants.jvm import classpath
@@ -27,9 +30,17 @@ from pants.jvm.compile import (
     FallibleClasspathEntries,
     FallibleClasspathEntry,
 )
-from pants.jvm.jar_tool.jar_tool import JarToolRequest
+from pants.jvm.jar_tool.jar_tool import JarDuplicateAction, JarToolRequest
 from pants.jvm.jar_tool.jar_tool import rules as jar_tool_rules
-from pants.jvm.shading.rules import ShadedJar, ShadeJarRequest
+from pants.jvm.resolve.coursier_fetch import CoursierResolvedLockfile, classpath_dest_filename
+from pants.jvm.resolve.key import CoursierResolveKey
+from pants.jvm.shading.rules import (
+    ShadedJar,
+    ShadedJars,
+    ShadeJarRequest,
+    ShadeJarsRequest,
+    can_shade_jars_independently,
+)
 from pants.jvm.shading.rules import rules as shaded_jar_rules
 from pants.jvm.strip_jar.strip_jar import StripJarRequest
 from pants.jvm.subsystems import JvmSubsystem
@@ -40,6 +51,7 @@ from pants.jvm.target_types import (
     JvmDependenciesField,
     JvmJdkField,
     JvmMainClassNameField,
+    JvmShadingRule,
 )
 
 logger = logging.getLogger(__name__)
@@ -99,6 +111,95 @@ async def deploy_jar_classpath(
     )
 
 
+@dataclass(frozen=True)
+class DeployJarBaseLayerRequest:
+    """A request to merge the third-party JARs of a deploy jar into a reusable base layer.
+
+    The request deliberately contains nothing about the deploy jar which uses it other than how
+    duplicates and excluded files should be handled, so that the layer is shared by (and cached
+    across) all deploy jars with the same third-party dependencies.
+    """
+
+    digest: Digest
+    jars: tuple[str, ...]
+    policies: tuple[tuple[str, JarDuplicateAction], ...]
+    skip: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class DeployJarBaseLayer:
+    digest: Digest
+    filename: str
+
+
+_DEPLOY_JAR_BASE_LAYER_FILENAME = "__deploy_jar_base.jar"
+
+
+@rule
+async def build_deploy_jar_base_layer(request: DeployJarBaseLayerRequest) -> DeployJarBaseLayer:
+    digest = await Get(
+        Digest,
+        JarToolRequest(
+            jar_name=_DEPLOY_JAR_BASE_LAYER_FILENAME,
+            digest=request.digest,
+            jars=request.jars,
+            policies=request.policies,
+            skip=request.skip,
+            compress=True,
+        ),
+    )
+    return DeployJarBaseLayer(digest, _DEPLOY_JAR_BASE_LAYER_FILENAME)
+
+
+def _split_third_party_entries(
+    entries: Iterable[ClasspathEntry], lockfile: CoursierResolvedLockfile
+) -> tuple[tuple[ClasspathEntry, ...], tuple[ClasspathEntry, ...]]:
+    """Splits the given entries into (first-party, third-party) entries, preserving their order.
+
+    An entry is considered to be third-party if all of its files were fetched from the lockfile.
+    """
+    third_party_filenames = {
+        classpath_dest_filename(entry.coord.to_coord_str(), entry.file_name)
+        for entry in lockfile.entries
+    }
+    first_party: list[ClasspathEntry] = []
+    third_party: list[ClasspathEntry] = []
+    for entry in entries:
+        if entry.filenames and all(f in third_party_filenames for f in entry.filenames):
+            third_party.append(entry)
+        else:
+            first_party.append(entry)
+    return tuple(first_party), tuple(third_party)
+
+
+async def _shade_classpath_entries(
+    entries: Iterable[ClasspathEntry], rules: tuple[JvmShadingRule, ...]
+) -> tuple[ClasspathEntry, ...]:
+    """Shades each JAR of the given entries independently, returning an entry per shaded JAR.
+
+    Shading is cached per JAR and rule set, so JARs which are shared between deploy jars with the
+    same shading rules are only shaded once.
+    """
+    # A JAR may be exported by multiple entries: it only needs to be shaded once.
+    jars: dict[str, ClasspathEntry] = {}
+    for entry in entries:
+        for filename in entry.filenames:
+            jars.setdefault(filename, entry)
+    jar_digests = await MultiGet(
+        Get(Digest, DigestSubset(entry.digest, PathGlobs([filename])))
+        for filename, entry in jars.items()
+    )
+    shaded_jars = await Get(
+        ShadedJars,
+        ShadeJarsRequest(
+            jars=tuple(zip(jars, jar_digests)),
+            rules=rules,
+            skip_manifest=False,
+        ),
+    )
+    return tuple(ClasspathEntry(shaded.digest, (shaded.path,)) for shaded in shaded_jars)
+
+
 @rule
 async def package_deploy_jar(
     jvm: JvmSubsystem,
@@ -110,6 +211,9 @@ async def package_deploy_jar(
     2. Creating a deploy jar with a valid ZIP index and deduplicated entries
     3. (optionally) Stripping the jar of all metadata that may cause it to be non-reproducible (https://reproducible-builds.org)
     4. (optionally) Apply shading rules to the bytecode inside the jar file
+
+    Where the shading rules allow it, they are instead applied to each of the thin JARs from step 1
+    before they are assembled.
     """
 
     if field_set.main_class.value is None:
@@ -120,25 +224,58 @@ async def package_deploy_jar(
     #
 
     classpath = await Get(Classpath, Addresses([field_set.address]))
-    classpath_digest = await Get(Digest, MergeDigests(classpath.digests()))
+    entries = tuple(ClasspathEntry.closure(classpath.entries))
 
     #
     # 2. Use Pants' JAR tool to build a runnable fat JAR
     #
 
     output_filename = PurePath(field_set.output_path.value_or_default(file_ending="jar"))
+    policies = tuple(
+        (rule.pattern, JarDuplicateAction(rule.action.lower()))
+        for rule in field_set.duplicate_policy.value_or_default()
+    )
+    skip = tuple(field_set.exclude_files.value or ())
+
+    # If possible, shade each JAR of the classpath independently (and concurrently) so that JARs
+    # which are shared with other deploy jars using the same rules are only shaded once. The
+    # assembled JAR is then only shaded as a whole (in step 4) if the rules require it.
+    shading_rules = tuple(field_set.shading_rules.value or ())
+    shade_assembled_jar = bool(shading_rules) and not can_shade_jars_independently(shading_rules)
+    if shading_rules and not shade_assembled_jar:
+        entries = await _shade_classpath_entries(entries, shading_rules)
+
+    if jvm.layered_deploy_jars:
+        # Merge the third-party JARs into a base layer which is cached independently of the
+        # first-party code, and then copy it (without re-compressing its entries) into the final
+        # JAR after the first-party JARs, so that first-party entries take precedence.
+        lockfile = await Get(CoursierResolvedLockfile, CoursierResolveKey, classpath.resolve)
+        entries, third_party_entries = _split_third_party_entries(entries, lockfile)
+        if third_party_entries:
+            third_party_digest = await Get(
+                Digest, MergeDigests(entry.digest for entry in third_party_entries)
+            )
+            base_layer = await Get(
+                DeployJarBaseLayer,
+                DeployJarBaseLayerRequest(
+                    digest=third_party_digest,
+                    jars=tuple(ClasspathEntry.args(third_party_entries)),
+                    policies=policies,
+                    skip=skip,
+                ),
+            )
+            entries = (*entries, ClasspathEntry(base_layer.digest, (base_layer.filename,)))
+
+    classpath_digest = await Get(Digest, MergeDigests(entry.digest for entry in entries))
     jar_digest = await Get(
         Digest,
         JarToolRequest(
             jar_name=output_filename.name,
             digest=classpath_digest,
             main_class=field_set.main_class.value,
-            jars=classpath.args(),
-            policies=[
-                (rule.pattern, rule.action)
-                for rule in field_set.duplicate_policy.value_or_default()
-            ],
-            skip=field_set.exclude_files.value,
+            jars=ClasspathEntry.args(entries),
+            policies=policies,
+            skip=skip,
             compress=True,
         ),
     )
@@ -160,13 +297,13 @@ async def package_deploy_jar(
     #
     # 4. Apply shading rules
     #
-    if field_set.shading_rules.value:
+    if shade_assembled_jar:
         shaded_jar = await Get(
             ShadedJar,
             ShadeJarRequest(
                 path=output_filename,
                 digest=jar_digest,
-                rules=field_set.shading_rules.value,
+                rules=shading_rules,
                 skip_manifest=False,
             ),
         )
@@ -52,7 +52,7 @@ from pants.jvm.resolve.common import (
     GatherJvmCoordinatesRequest,
 )
 from pants.jvm.resolve.coordinate import Coordinate, Coordinates
-from pants.jvm.resolve.coursier_setup import Coursier, CoursierFetchProcess
+from pants.jvm.resolve.coursier_setup import Coursier, CoursierFetchProcess, CoursierSubsystem
 from pants.jvm.resolve.key import CoursierResolveKey
 from pants.jvm.resolve.lockfile_metadata import JVMLockfileMetadata, LockfileContext
 from pants.jvm.subsystems import JvmSubsystem
@@ -520,8 +520,14 @@ async def coursier_resolve_lockfile(
     return CoursierResolvedLockfile(entries=tuple(new_entries))
 
 
+class ResolvedClasspathEntries(Collection[ClasspathEntry]):
+    """A collection of resolved classpath entries."""
+
+
 @rule(desc="Fetch with coursier")
-async def fetch_with_coursier(request: CoursierFetchRequest) -> FallibleClasspathEntry:
+async def fetch_with_coursier(
+    request: CoursierFetchRequest, coursier_subsystem: CoursierSubsystem
+) -> FallibleClasspathEntry:
     # TODO: Loading this per JvmArtifact.
     lockfile = await Get(CoursierResolvedLockfile, CoursierResolveKey, request.resolve)
 
@@ -545,10 +551,23 @@ async def fetch_with_coursier(request: CoursierFetchRequest) -> FallibleClasspat
         requirement.coordinate,
     )
 
-    classpath_entries = await MultiGet(
-        Get(ClasspathEntry, CoursierLockfileEntry, entry)
-        for entry in (root_entry, *transitive_entries)
-    )
+    if coursier_subsystem.bulk_fetch:
+        # Fetch (or re-use the fetch of) the entire lockfile, and then select the entries needed.
+        all_classpath_entries = await Get(
+            ResolvedClasspathEntries, CoursierResolvedLockfile, lockfile
+        )
+        classpath_entries_by_coord = {
+            entry.coord: classpath_entry
+            for entry, classpath_entry in zip(lockfile.entries, all_classpath_entries)
+        }
+        classpath_entries = tuple(
+            classpath_entries_by_coord[entry.coord] for entry in (root_entry, *transitive_entries)
+        )
+    else:
+        classpath_entries = await MultiGet(
+            Get(ClasspathEntry, CoursierLockfileEntry, entry)
+            for entry in (root_entry, *transitive_entries)
+        )
     exported_digest = await Get(Digest, MergeDigests(cpe.digest for cpe in classpath_entries))
 
     return FallibleClasspathEntry(
@@ -559,8 +578,33 @@ async def fetch_with_coursier(request: CoursierFetchRequest) -> FallibleClasspat
     )
 
 
-class ResolvedClasspathEntries(Collection[ClasspathEntry]):
-    """A collection of resolved classpath entries."""
+async def _verified_classpath_entry(
+    entry: CoursierLockfileEntry, report_coord: str, report_file: str, fetch_output_digest: Digest
+) -> ClasspathEntry:
+    """Extract the artifact for `entry` from the output of `coursier fetch`, and confirm that it
+    matches the digest in the lockfile."""
+    resolved_coord = Coordinate.from_coord_str(report_coord)
+    if resolved_coord != entry.coord:
+        raise CoursierError(
+            f'Coursier resolved coord "{resolved_coord.to_coord_str()}" does not match requested coord "{entry.coord.to_coord_str()}".'
+        )
+
+    classpath_dest_name = classpath_dest_filename(report_coord, report_file)
+    classpath_dest = f"classpath/{classpath_dest_name}"
+
+    resolved_file_digest = await Get(
+        Digest, DigestSubset(fetch_output_digest, PathGlobs([classpath_dest]))
+    )
+    stripped_digest = await Get(Digest, RemovePrefix(resolved_file_digest, "classpath"))
+    file_digest = await Get(
+        FileDigest,
+        ExtractFileDigest(stripped_digest, classpath_dest_name),
+    )
+    if file_digest != entry.file_digest:
+        raise CoursierError(
+            f"Coursier fetch for '{resolved_coord}' succeeded, but fetched artifact {file_digest} did not match the expected artifact: {entry.file_digest}."
+        )
+    return ClasspathEntry(digest=stripped_digest, filenames=(classpath_dest_name,))
 
 
 @rule
@@ -635,33 +679,116 @@ async def coursier_fetch_one_coord(
         )
 
     dep = report_deps[0]
-    resolved_coord = Coordinate.from_coord_str(dep["coord"])
-    if resolved_coord != request.coord:
-        raise CoursierError(
-            f'Coursier resolved coord "{resolved_coord.to_coord_str()}" does not match requested coord "{request.coord.to_coord_str()}".'
+    return await _verified_classpath_entry(
+        request, dep["coord"], dep["file"], process_result.output_digest
+    )
+
+
+@dataclass(frozen=True)
+class CoursierBulkFetchRequest:
+    """Fetch many lockfile entries with a single invocation of `coursier fetch --intransitive`.
+
+    Entries which reference a `jar` or a `url` are always fetched individually.
+    """
+
+    entries: Tuple[CoursierLockfileEntry, ...]
+
+
+@dataclass(frozen=True)
+class _VerifyCoursierBulkFetchedEntry:
+    entry: CoursierLockfileEntry
+    report_coord: str
+    report_file: str
+    fetch_output_digest: Digest
+
+
+@rule(desc="Fetch with coursier in bulk", level=LogLevel.DEBUG)
+async def coursier_fetch_entries_in_bulk(
+    request: CoursierBulkFetchRequest,
+) -> ResolvedClasspathEntries:
+    """Like `coursier_fetch_one_coord`, but for many entries at once.
+
+    The fetched artifacts land in the Maven-layout Coursier cache (which is an append-only cache
+    shared between runs), and each of them is checked against its digest in the lockfile exactly as
+    `coursier_fetch_one_coord` would.
+    """
+    bulk_entries = [
+        entry for entry in request.entries if not entry.pants_address and not entry.remote_url
+    ]
+
+    report_deps_by_coord: dict[Coordinate, dict[str, Any]] = {}
+    fetch_output_digest = EMPTY_DIGEST
+    if bulk_entries:
+        coursier_resolve_info = await Get(
+            CoursierResolveInfo,
+            ArtifactRequirements(ArtifactRequirement(entry.coord) for entry in bulk_entries),
         )
 
-    classpath_dest_name = classpath_dest_filename(dep["coord"], dep["file"])
-    classpath_dest = f"classpath/{classpath_dest_name}"
+        coursier_report_file_name = "coursier_report.json"
+        process_result = await Get(
+            ProcessResult,
+            CoursierFetchProcess(
+                args=(
+                    coursier_report_file_name,
+                    "--intransitive",
+                    *coursier_resolve_info.argv,
+                ),
+                input_digest=coursier_resolve_info.digest,
+                output_directories=("classpath",),
+                output_files=(coursier_report_file_name,),
+                description=(
+                    f"Fetching {pluralize(len(bulk_entries), 'artifact')} with coursier in bulk"
+                ),
+            ),
+        )
+        report_digest = await Get(
+            Digest,
+            DigestSubset(process_result.output_digest, PathGlobs([coursier_report_file_name])),
+        )
+        report_contents = await Get(DigestContents, Digest, report_digest)
+        report = json.loads(report_contents[0].content)
+        report_deps_by_coord = {
+            Coordinate.from_coord_str(dep["coord"]): dep for dep in report["dependencies"]
+        }
+        fetch_output_digest = process_result.output_digest
 
-    resolved_file_digest = await Get(
-        Digest, DigestSubset(process_result.output_digest, PathGlobs([classpath_dest]))
+    # Entries which were not fetched in bulk (because they reference a `jar` or `url`, or because
+    # Coursier did not report them) are fetched individually.
+    classpath_entries = await MultiGet(
+        (
+            Get(
+                ClasspathEntry,
+                _VerifyCoursierBulkFetchedEntry(
+                    entry,
+                    report_deps_by_coord[entry.coord]["coord"],
+                    report_deps_by_coord[entry.coord]["file"],
+                    fetch_output_digest,
+                ),
+            )
+            if entry.coord in report_deps_by_coord
+            else Get(ClasspathEntry, CoursierLockfileEntry, entry)
+        )
+        for entry in request.entries
     )
-    stripped_digest = await Get(Digest, RemovePrefix(resolved_file_digest, "classpath"))
-    file_digest = await Get(
-        FileDigest,
-        ExtractFileDigest(stripped_digest, classpath_dest_name),
+    return ResolvedClasspathEntries(classpath_entries)
+
+
+@rule
+async def verify_coursier_bulk_fetched_entry(
+    request: _VerifyCoursierBulkFetchedEntry,
+) -> ClasspathEntry:
+    return await _verified_classpath_entry(
+        request.entry, request.report_coord, request.report_file, request.fetch_output_digest
     )
-    if file_digest != request.file_digest:
-        raise CoursierError(
-            f"Coursier fetch for '{resolved_coord}' succeeded, but fetched artifact {file_digest} did not match the expected artifact: {request.file_digest}."
-        )
-    return ClasspathEntry(digest=stripped_digest, filenames=(classpath_dest_name,))
 
 
 @rule(level=LogLevel.DEBUG)
-async def coursier_fetch_lockfile(lockfile: CoursierResolvedLockfile) -> ResolvedClasspathEntries:
+async def coursier_fetch_lockfile(
+    lockfile: CoursierResolvedLockfile, coursier_subsystem: CoursierSubsystem
+) -> ResolvedClasspathEntries:
     """Fetch every artifact in a lockfile."""
+    if coursier_subsystem.bulk_fetch:
+        return await Get(ResolvedClasspathEntries, CoursierBulkFetchRequest(lockfile.entries))
     classpath_entries = await MultiGet(
         Get(ClasspathEntry, CoursierLockfileEntry, entry) for entry in lockfile.entries
     )
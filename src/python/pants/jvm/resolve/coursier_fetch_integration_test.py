@@ -16,7 +16,12 @@ from pants.engine.target import Targets
 from pants.jvm.compile import ClasspathEntry
 from pants.jvm.resolve.common import ArtifactRequirement, ArtifactRequirements
 from pants.jvm.resolve.coordinate import Coordinate, Coordinates
-from pants.jvm.resolve.coursier_fetch import CoursierLockfileEntry, CoursierResolvedLockfile
+from pants.jvm.resolve.coursier_fetch import (
+    CoursierBulkFetchRequest,
+    CoursierLockfileEntry,
+    CoursierResolvedLockfile,
+    ResolvedClasspathEntries,
+)
 from pants.jvm.resolve.coursier_fetch import rules as coursier_fetch_rules
 from pants.jvm.target_types import JvmArtifactJarSourceField, JvmArtifactTarget
 from pants.jvm.testutil import maybe_skip_jdk_test
@@ -42,6 +47,8 @@ def rule_runner() -> RuleRunner:
             QueryRule(Targets, [RawSpecs]),
             QueryRule(CoursierResolvedLockfile, (ArtifactRequirements,)),
             QueryRule(ClasspathEntry, (CoursierLockfileEntry,)),
+            QueryRule(ResolvedClasspathEntries, (CoursierBulkFetchRequest,)),
+            QueryRule(ResolvedClasspathEntries, (CoursierResolvedLockfile,)),
             QueryRule(FileDigest, (ExtractFileDigest,)),
         ],
         target_types=[JvmArtifactTarget],
@@ -496,6 +503,55 @@ def test_fetch_one_coord_with_classifier(rule_runner: RuleRunner) -> None:
     assert classpath_entry.filenames == ("org.apache.avro_trevni-avro_jar_tests_1.11.0.jar",)
 
 
+@maybe_skip_jdk_test
+def test_bulk_fetch(rule_runner: RuleRunner) -> None:
+    resolved_lockfile = rule_runner.request(
+        CoursierResolvedLockfile,
+        [
+            ArtifactRequirements.from_coordinates(
+                [Coordinate(group="junit", artifact="junit", version="4.13.2")]
+            )
+        ],
+    )
+    assert len(resolved_lockfile.entries) == 2
+
+    classpath_entries = rule_runner.request(
+        ResolvedClasspathEntries, [CoursierBulkFetchRequest(resolved_lockfile.entries)]
+    )
+    assert sorted(cpe.filenames for cpe in classpath_entries) == [
+        ("junit_junit_4.13.2.jar",),
+        ("org.hamcrest_hamcrest-core_1.3.jar",),
+    ]
+    for cpe, entry in zip(classpath_entries, resolved_lockfile.entries):
+        file_digest = rule_runner.request(
+            FileDigest, [ExtractFileDigest(cpe.digest, cpe.filenames[0])]
+        )
+        assert file_digest == entry.file_digest
+
+    # Fetching the lockfile in bulk should produce the same entries as fetching them one by one.
+    rule_runner.set_options(["--coursier-bulk-fetch"], env_inherit=PYTHON_BOOTSTRAP_ENV)
+    bulk_fetched = rule_runner.request(ResolvedClasspathEntries, [resolved_lockfile])
+    rule_runner.set_options([], env_inherit=PYTHON_BOOTSTRAP_ENV)
+    individually_fetched = rule_runner.request(ResolvedClasspathEntries, [resolved_lockfile])
+    assert bulk_fetched == individually_fetched
+
+
+@maybe_skip_jdk_test
+def test_bulk_fetch_with_bad_fingerprint(rule_runner: RuleRunner) -> None:
+    lockfile_entry = CoursierLockfileEntry(
+        coord=HAMCREST_COORD,
+        file_name="hamcrest-core-1.3.jar",
+        direct_dependencies=Coordinates([]),
+        dependencies=Coordinates([]),
+        file_digest=FileDigest(
+            fingerprint="ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",
+            serialized_bytes_length=45024,
+        ),
+    )
+    with pytest.raises(ExecutionError, match=r".*?CoursierError:.*?did not match"):
+        rule_runner.request(ResolvedClasspathEntries, [CoursierBulkFetchRequest((lockfile_entry,))])
+
+
 @maybe_skip_jdk_test
 def test_fetch_one_coord_with_bad_fingerprint(rule_runner: RuleRunner) -> None:
     expected_exception_msg = (
@@ -22,7 +22,7 @@ from pants.engine.fs import CreateDigest, Digest, FileContent, MergeDigests
 from pants.engine.platform import Platform
 from pants.engine.process import Process
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
-from pants.option.option_types import StrListOption, StrOption
+from pants.option.option_types import BoolOption, StrListOption, StrOption
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.memo import memoized_property
@@ -168,6 +168,26 @@ class CoursierSubsystem(TemplatedExternalTool):
         ),
     )
 
+    bulk_fetch = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, fetch all of the artifacts in a lockfile with a single invocation of
+            Coursier the first time any of them are needed, rather than with one invocation per
+            artifact.
+
+            This is much faster on machines with cold caches, since the artifacts are downloaded
+            into the Coursier cache in parallel, and the cost of launching Coursier is only paid
+            once. But each change to a lockfile will cause the whole lockfile to be (re)fetched
+            from the Coursier cache, and artifacts which are not needed by the current goal may be
+            downloaded.
+
+            Every fetched artifact is still checked against the digest recorded in the lockfile.
+            """
+        ),
+    )
+
     def generate_exe(self, plat: Platform) -> str:
         tool_version = self.known_version(plat)
         url = (tool_version and tool_version.url_override) or self.generate_url(plat)
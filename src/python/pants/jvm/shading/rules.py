@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from pathlib import PurePath
 from typing import Iterable
 
+from pants.engine.collection import Collection
 from pants.engine.engine_aware import EngineAwareParameter
 from pants.engine.fs import (
     AddPrefix,
@@ -26,7 +27,7 @@ from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool
 from pants.jvm.shading import jarjar
 from pants.jvm.shading.jarjar import JarJar, JarJarGeneratorLockfileSentinel, MisplacedClassStrategy
-from pants.jvm.target_types import JvmShadingRule, _shading_validate_rules
+from pants.jvm.target_types import JvmShadingKeepRule, JvmShadingRule, _shading_validate_rules
 from pants.util.logging import LogLevel
 
 logger = logging.getLogger(__name__)
@@ -53,7 +54,9 @@ class ShadeJarRequest(EngineAwareParameter):
     ) -> None:
         object.__setattr__(self, "path", path if isinstance(path, PurePath) else PurePath(path))
         object.__setattr__(self, "digest", digest)
-        object.__setattr__(self, "rules", tuple(rules or ()))
+        # Only the first of a series of identical rules can ever match, so duplicates are dropped
+        # to give equivalent requests the same cache key.
+        object.__setattr__(self, "rules", tuple(dict.fromkeys(rules or ())))
         object.__setattr__(self, "skip_manifest", skip_manifest)
         object.__setattr__(self, "misplaced_class_strategy", misplaced_class_strategy)
 
@@ -74,6 +77,34 @@ class ShadedJar:
     digest: Digest
 
 
+class ShadedJars(Collection[ShadedJar]):
+    pass
+
+
+@dataclass(frozen=True)
+class ShadeJarsRequest:
+    """Applies the same shading rules to each of the given JAR files independently.
+
+    Each JAR is shaded (and cached) by its own `ShadeJarRequest`, so a JAR which is shaded with the
+    same rules as part of multiple requests is only processed once. Only valid for rules which can
+    be applied to JARs independently: see `can_shade_jars_independently`.
+    """
+
+    jars: tuple[tuple[str, Digest], ...]
+    rules: tuple[JvmShadingRule, ...]
+    skip_manifest: bool | None = None
+
+
+def can_shade_jars_independently(rules: Iterable[JvmShadingRule]) -> bool:
+    """Whether applying the given rules to each JAR of a classpath has the same effect as applying
+    them to a single JAR containing the whole classpath.
+
+    `shading_keep` rules remove everything which is not reachable from the kept classes, and so
+    must see the whole classpath at once.
+    """
+    return not any(isinstance(rule, JvmShadingKeepRule) for rule in rules)
+
+
 _JARJAR_MAIN_CLASS = "com.eed3si9n.jarjar.Main"
 _JARJAR_RULE_CONFIG_FILENAME = "rules"
 
@@ -164,5 +195,19 @@ async def shade_jar(request: ShadeJarRequest, jdk: InternalJdk, jarjar: JarJar)
     return ShadedJar(path=str(request.path), digest=shaded_jar_digest)
 
 
+@rule(desc="Applies shading rules to JAR files")
+async def shade_jars(request: ShadeJarsRequest) -> ShadedJars:
+    shaded_jars = await MultiGet(
+        Get(
+            ShadedJar,
+            ShadeJarRequest(
+                path=path, digest=digest, rules=request.rules, skip_manifest=request.skip_manifest
+            ),
+        )
+        for path, digest in request.jars
+    )
+    return ShadedJars(shaded_jars)
+
+
 def rules():
     return [*collect_rules(), *jarjar.rules()]
@@ -6,7 +6,7 @@ from __future__ import annotations
 import pytest
 
 from pants.engine.fs import EMPTY_DIGEST
-from pants.jvm.shading.rules import ShadeJarRequest
+from pants.jvm.shading.rules import ShadeJarRequest, can_shade_jars_independently
 from pants.jvm.target_types import (
     JvmShadingKeepRule,
     JvmShadingRelocateRule,
@@ -60,3 +60,23 @@ def _expected_invalid_char_msg(name: str, invalid_char: str) -> str:
 def test_invalid_rules(rule: JvmShadingRule, match: str) -> None:
     with pytest.raises(ValueError, match=match):
         ShadeJarRequest(path="path/to/file", digest=EMPTY_DIGEST, rules=[rule])
+
+
+def test_duplicate_rules_are_normalized() -> None:
+    rename = JvmShadingRenameRule(pattern="my.package.**", replacement="other.package.@1")
+    zap = JvmShadingZapRule(pattern="my.package.Internal")
+    request = ShadeJarRequest(path="file.jar", digest=EMPTY_DIGEST, rules=[rename, zap, rename])
+    assert request == ShadeJarRequest(path="file.jar", digest=EMPTY_DIGEST, rules=[rename, zap])
+
+
+@pytest.mark.parametrize(
+    "rules, expected",
+    [
+        ([], True),
+        ([JvmShadingRelocateRule(package="my.package")], True),
+        ([JvmShadingZapRule(pattern="my.package.**")], True),
+        ([JvmShadingZapRule(pattern="my.package.**"), JvmShadingKeepRule(pattern="my.**")], False),
+    ],
+)
+def test_can_shade_jars_independently(rules: list[JvmShadingRule], expected: bool) -> None:
+    assert can_shade_jars_independently(rules) == expected
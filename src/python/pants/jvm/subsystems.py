@@ -100,6 +100,23 @@ class JvmSubsystem(Subsystem):
         ),
         advanced=True,
     )
+    layered_deploy_jars = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            When enabled, `deploy_jar` targets are assembled in two layers: the third-party JARs
+            from the lockfile are merged once into a base layer (which is cached for as long as
+            the set of third-party JARs and the duplicate policy of the target do not change),
+            and the first-party JARs are then added to a copy of that base layer.
+
+            This makes repackaging after a first-party change proportional to the size of the
+            first-party code, rather than to the size of the whole deploy jar. Duplicate
+            entries are resolved within each layer first, and then between the layers, with
+            first-party entries taking precedence over third-party entries.
+            """
+        ),
+        advanced=True,
+    )
     # See https://github.com/pantsbuild/pants/issues/14937 for discussion of one way to improve
     # our behavior around cancellation with nailgun.
     nailgun_remote_cache_speculation_delay = IntOption(
@@ -12,7 +12,11 @@ from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.core.goals.generate_lockfiles import UnrecognizedResolveNamesError
 from pants.core.goals.package import OutputPathField
 from pants.core.goals.run import RestartableField, RunFieldSet, RunInSandboxBehavior, RunRequest
-from pants.core.goals.test import TestExtraEnvVarsField, TestTimeoutField
+from pants.core.goals.test import (
+    TestExtraEnvVarsField,
+    TestsBatchCompatibilityTagField,
+    TestTimeoutField,
+)
 from pants.engine.addresses import Address
 from pants.engine.internals.selectors import Get
 from pants.engine.rules import Rule, collect_rules, rule
@@ -443,6 +447,10 @@ class JunitTestExtraEnvVarsField(TestExtraEnvVarsField):
     pass
 
 
+class JunitTestBatchCompatibilityTagField(TestsBatchCompatibilityTagField):
+    help = help_text(TestsBatchCompatibilityTagField.format_help("junit_test", "JUnit"))
+
+
 # -----------------------------------------------------------------------------------------------
 # JAR support fields
 # -----------------------------------------------------------------------------------------------
@@ -4,8 +4,9 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any
+from typing import Tuple
 
 from pants.backend.java.subsystems.junit import JUnit
 from pants.core.goals.generate_lockfiles import GenerateToolLockfileSentinel
@@ -16,13 +17,15 @@ from pants.core.goals.test import (
     TestFieldSet,
     TestRequest,
     TestResult,
+    TestsBatchCompatibilityTagField,
     TestSubsystem,
 )
 from pants.core.target_types import FileSourceField
+from pants.core.util_rules.partitions import Partition, PartitionerType, Partitions
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.engine.addresses import Addresses
 from pants.engine.env_vars import EnvironmentVars, EnvironmentVarsRequest
-from pants.engine.fs import Digest, DigestSubset, MergeDigests, PathGlobs, RemovePrefix, Snapshot
+from pants.engine.fs import Digest, DigestSubset, PathGlobs, RemovePrefix, Snapshot
 from pants.engine.process import (
     FallibleProcessResult,
     InteractiveProcess,
@@ -32,7 +35,7 @@ from pants.engine.process import (
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import SourcesField, TransitiveTargets, TransitiveTargetsRequest
 from pants.engine.unions import UnionRule
-from pants.jvm.classpath import Classpath
+from pants.jvm.classpath import Classpath, ClasspathJarFarm
 from pants.jvm.goals import lockfile
 from pants.jvm.jdk_rules import JdkEnvironment, JdkRequest, JvmProcess
 from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
@@ -43,6 +46,7 @@ from pants.jvm.target_types import (
     JunitTestTimeoutField,
     JvmDependenciesField,
     JvmJdkField,
+    JvmResolveField,
 )
 from pants.util.logging import LogLevel
 
@@ -60,12 +64,15 @@ class JunitTestFieldSet(TestFieldSet):
     timeout: JunitTestTimeoutField
     jdk_version: JvmJdkField
     dependencies: JvmDependenciesField
+    resolve: JvmResolveField
     extra_env_vars: TestExtraEnvVarsField
+    batch_compatibility_tag: TestsBatchCompatibilityTagField
 
 
 class JunitTestRequest(TestRequest):
     tool_subsystem = JUnit
     field_set_type = JunitTestFieldSet
+    partitioner_type = PartitionerType.CUSTOM
     supports_debug = True
 
 
@@ -73,9 +80,55 @@ class JunitToolLockfileSentinel(GenerateJvmToolLockfileSentinel):
     resolve_name = JUnit.options_scope
 
 
+@dataclass(frozen=True)
+class JunitTestMetadata:
+    """Parameters that must be constant for all test targets in a JUnit batch."""
+
+    resolve: str
+    jdk: str | None
+    extra_env_vars: tuple[str, ...]
+    compatibility_tag: str | None = None
+
+    # Prevent this class from being detected by pytest as a test class.
+    __test__ = False
+
+    @property
+    def description(self) -> str | None:
+        return self.compatibility_tag
+
+
+@rule(desc="Partition JUnit tests", level=LogLevel.DEBUG)
+async def partition_junit_tests(
+    request: JunitTestRequest.PartitionRequest[JunitTestFieldSet],
+    jvm: JvmSubsystem,
+) -> Partitions[JunitTestFieldSet, JunitTestMetadata]:
+    partitions = []
+    compatible_tests = defaultdict(list)
+
+    for field_set in request.field_sets:
+        metadata = JunitTestMetadata(
+            resolve=field_set.resolve.normalized_value(jvm),
+            jdk=field_set.jdk_version.value,
+            extra_env_vars=field_set.extra_env_vars.sorted(),
+            compatibility_tag=field_set.batch_compatibility_tag.value,
+        )
+
+        if not metadata.compatibility_tag:
+            # Tests without a compatibility tag are assumed to be incompatible with all others.
+            partitions.append(Partition((field_set,), metadata))
+        else:
+            # Group tests by their common metadata.
+            compatible_tests[metadata].append(field_set)
+
+    for metadata, field_sets in compatible_tests.items():
+        partitions.append(Partition(tuple(field_sets), metadata))
+
+    return Partitions(partitions)
+
+
 @dataclass(frozen=True)
 class TestSetupRequest:
-    field_set: JunitTestFieldSet
+    field_sets: Tuple[JunitTestFieldSet, ...]
     is_debug: bool
 
 
@@ -93,14 +146,18 @@ async def setup_junit_for_target(
     test_subsystem: TestSubsystem,
     test_extra_env: TestExtraEnv,
 ) -> TestSetup:
+    # All field sets in a batch share a JDK, resolve and extra env vars: see `JunitTestMetadata`.
+    field_set = request.field_sets[0]
+    addresses = Addresses(fs.address for fs in request.field_sets)
+
     jdk, transitive_tgts = await MultiGet(
-        Get(JdkEnvironment, JdkRequest, JdkRequest.from_field(request.field_set.jdk_version)),
-        Get(TransitiveTargets, TransitiveTargetsRequest([request.field_set.address])),
+        Get(JdkEnvironment, JdkRequest, JdkRequest.from_field(field_set.jdk_version)),
+        Get(TransitiveTargets, TransitiveTargetsRequest(addresses)),
     )
 
     lockfile_request = await Get(GenerateJvmLockfileFromTool, JunitToolLockfileSentinel())
     classpath, junit_classpath, files = await MultiGet(
-        Get(Classpath, Addresses([request.field_set.address])),
+        Get(Classpath, Addresses, addresses),
         Get(ToolClasspath, ToolClasspathRequest(lockfile=lockfile_request)),
         Get(
             SourceFiles,
@@ -112,18 +169,21 @@ async def setup_junit_for_target(
         ),
     )
 
-    input_digest = await Get(Digest, MergeDigests((*classpath.digests(), files.snapshot.digest)))
+    # Link the classpath from a farm of shared JARs, rather than materializing it per-sandbox.
+    jar_farm = await Get(ClasspathJarFarm, Classpath, classpath)
+    input_digest = files.snapshot.digest
 
     toolcp_relpath = "__toolcp"
     extra_immutable_input_digests = {
         toolcp_relpath: junit_classpath.digest,
+        **jar_farm.immutable_input_digests,
     }
 
     reports_dir_prefix = "__reports_dir"
-    reports_dir = f"{reports_dir_prefix}/{request.field_set.address.path_safe_spec}"
+    reports_dir = f"{reports_dir_prefix}/{field_set.address.path_safe_spec}"
 
     # Classfiles produced by the root `junit_test` targets are the only ones which should run.
-    user_classpath_arg = ":".join(classpath.root_args())
+    user_classpath_arg = ":".join(jar_farm.root_args)
 
     # Cache test runs only if they are successful, or not at all if `--test-force`.
     cache_scope = (
@@ -135,13 +195,25 @@ async def setup_junit_for_target(
         extra_jvm_args.extend(jvm.debug_args)
 
     field_set_extra_env = await Get(
-        EnvironmentVars, EnvironmentVarsRequest(request.field_set.extra_env_vars.value or ())
+        EnvironmentVars, EnvironmentVarsRequest(field_set.extra_env_vars.value or ())
     )
 
+    timeout_seconds: int | None = None
+    for fs in request.field_sets:
+        timeout = fs.timeout.calculate_from_global_options(test_subsystem)
+        if timeout:
+            timeout_seconds = (timeout_seconds or 0) + timeout
+
+    run_description = field_set.address.spec
+    if len(request.field_sets) > 1:
+        run_description = (
+            f"batch of {run_description} and {len(request.field_sets) - 1} other targets"
+        )
+
     process = JvmProcess(
         jdk=jdk,
         classpath_entries=[
-            *classpath.args(),
+            *jar_farm.args,
             *junit_classpath.classpath_entries(toolcp_relpath),
         ],
         argv=[
@@ -158,8 +230,8 @@ async def setup_junit_for_target(
         extra_jvm_options=junit.jvm_options,
         extra_immutable_input_digests=extra_immutable_input_digests,
         output_directories=(reports_dir,),
-        description=f"Run JUnit 5 ConsoleLauncher against {request.field_set.address}",
-        timeout_seconds=request.field_set.timeout.calculate_from_global_options(test_subsystem),
+        description=f"Run JUnit 5 ConsoleLauncher against {run_description}",
+        timeout_seconds=timeout_seconds,
         level=LogLevel.DEBUG,
         cache_scope=cache_scope,
         use_nailgun=False,
@@ -170,11 +242,9 @@ async def setup_junit_for_target(
 @rule(desc="Run JUnit", level=LogLevel.DEBUG)
 async def run_junit_test(
     test_subsystem: TestSubsystem,
-    batch: JunitTestRequest.Batch[JunitTestFieldSet, Any],
+    batch: JunitTestRequest.Batch[JunitTestFieldSet, JunitTestMetadata],
 ) -> TestResult:
-    field_set = batch.single_element
-
-    test_setup = await Get(TestSetup, TestSetupRequest(field_set, is_debug=False))
+    test_setup = await Get(TestSetup, TestSetupRequest(batch.elements, is_debug=False))
     process_result = await Get(FallibleProcessResult, JvmProcess, test_setup.process)
     reports_dir_prefix = test_setup.reports_dir_prefix
 
@@ -183,9 +253,9 @@ async def run_junit_test(
     )
     xml_results = await Get(Snapshot, RemovePrefix(xml_result_subset, reports_dir_prefix))
 
-    return TestResult.from_fallible_process_result(
-        process_results=(process_result,),
-        address=field_set.address,
+    return TestResult.from_batched_fallible_process_result(
+        (process_result,),
+        batch=batch,
         output_setting=test_subsystem.output,
         xml_results=xml_results,
     )
@@ -193,9 +263,9 @@ async def run_junit_test(
 
 @rule(level=LogLevel.DEBUG)
 async def setup_junit_debug_request(
-    batch: JunitTestRequest.Batch[JunitTestFieldSet, Any]
+    batch: JunitTestRequest.Batch[JunitTestFieldSet, JunitTestMetadata]
 ) -> TestDebugRequest:
-    setup = await Get(TestSetup, TestSetupRequest(batch.single_element, is_debug=True))
+    setup = await Get(TestSetup, TestSetupRequest(batch.elements, is_debug=True))
     process = await Get(Process, JvmProcess, setup.process)
     return TestDebugRequest(
         InteractiveProcess.from_process(process, forward_signals_to_process=False, restartable=True)
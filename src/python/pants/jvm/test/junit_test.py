@@ -34,7 +34,7 @@ from pants.jvm.strip_jar import strip_jar
 from pants.jvm.target_types import JvmArtifactTarget
 from pants.jvm.test.junit import JunitTestRequest
 from pants.jvm.test.junit import rules as junit_rules
-from pants.jvm.test.testutil import run_junit_test
+from pants.jvm.test.testutil import run_junit_test, run_junit_tests
 from pants.jvm.testutil import maybe_skip_jdk_test
 from pants.jvm.util_rules import rules as util_rules
 from pants.testutil.rule_runner import QueryRule, RuleRunner
@@ -633,3 +633,68 @@ def test_vintage_extra_env_vars(
         },
     )
     assert result.exit_code == 0
+
+
+@maybe_skip_jdk_test
+def test_jupiter_batched(rule_runner: RuleRunner, junit5_lockfile: JVMLockfileFixture) -> None:
+    rule_runner.write_files(
+        {
+            "3rdparty/jvm/default.lock": junit5_lockfile.serialized_lockfile,
+            "3rdparty/jvm/BUILD": junit5_lockfile.requirements_as_jvm_artifact_targets(),
+            "BUILD": dedent(
+                """\
+                junit_tests(
+                    name='example-test',
+                    batch_compatibility_tag='default',
+                    dependencies= [
+                        '3rdparty/jvm:org.junit.jupiter_junit-jupiter-api',
+                    ],
+                )
+                """
+            ),
+            "FirstTest.java": dedent(
+                """
+                package org.pantsbuild.example;
+
+                import static org.junit.jupiter.api.Assertions.assertEquals;
+                import org.junit.jupiter.api.Test;
+
+                class FirstTest {
+                    @Test
+                    void testFirst(){
+                      assertEquals("Hello!", "Hello!");
+                   }
+                }
+                """
+            ),
+            "SecondTest.java": dedent(
+                """
+                package org.pantsbuild.example;
+
+                import static org.junit.jupiter.api.Assertions.assertEquals;
+                import org.junit.jupiter.api.Test;
+
+                class SecondTest {
+                    @Test
+                    void testSecond(){
+                      assertEquals("Goodbye!", "Hello!");
+                   }
+                }
+                """
+            ),
+        }
+    )
+
+    test_result = run_junit_tests(
+        rule_runner, "example-test", ["FirstTest.java", "SecondTest.java"]
+    )
+
+    assert test_result.exit_code == 1
+    assert len(test_result.addresses) == 2
+    assert test_result.partition_description == "default"
+    assert test_result.xml_results and test_result.xml_results.files
+    stdout_text = test_result.stdout_bytes.decode()
+    assert re.search(r"Finished:\s+testFirst", stdout_text) is not None
+    assert re.search(r"1 tests successful", stdout_text) is not None
+    assert re.search(r"1 tests failed", stdout_text) is not None
+    assert re.search(r"2 tests found", stdout_text) is not None
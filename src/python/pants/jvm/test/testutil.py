@@ -6,7 +6,7 @@ from typing import Iterable, Mapping
 
 from pants.core.goals.test import TestResult
 from pants.engine.internals.native_engine import Address
-from pants.jvm.test.junit import JunitTestFieldSet, JunitTestRequest
+from pants.jvm.test.junit import JunitTestFieldSet, JunitTestMetadata, JunitTestRequest
 from pants.testutil.rule_runner import PYTHON_BOOTSTRAP_ENV, RuleRunner
 
 
@@ -18,14 +18,39 @@ def run_junit_test(
     extra_args: Iterable[str] | None = None,
     env: Mapping[str, str] | None = None,
 ) -> TestResult:
+    return run_junit_tests(
+        rule_runner, target_name, [relative_file_path], extra_args=extra_args, env=env
+    )
+
+
+def run_junit_tests(
+    rule_runner: RuleRunner,
+    target_name: str,
+    relative_file_paths: Iterable[str],
+    *,
+    extra_args: Iterable[str] | None = None,
+    env: Mapping[str, str] | None = None,
+) -> TestResult:
+    """Runs the given tests in a single batch."""
     args = [
         "--junit-args=['--disable-ansi-colors','--details=flat','--details-theme=ascii']",
         *(extra_args or ()),
     ]
     rule_runner.set_options(args, env=env, env_inherit=PYTHON_BOOTSTRAP_ENV)
-    tgt = rule_runner.get_target(
-        Address(spec_path="", target_name=target_name, relative_file_path=relative_file_path)
+    field_sets = tuple(
+        JunitTestFieldSet.create(
+            rule_runner.get_target(
+                Address(
+                    spec_path="", target_name=target_name, relative_file_path=relative_file_path
+                )
+            )
+        )
+        for relative_file_path in relative_file_paths
     )
-    return rule_runner.request(
-        TestResult, [JunitTestRequest.Batch("", (JunitTestFieldSet.create(tgt),), None)]
+    metadata = JunitTestMetadata(
+        resolve=field_sets[0].resolve.value or "",
+        jdk=field_sets[0].jdk_version.value,
+        extra_env_vars=field_sets[0].extra_env_vars.sorted(),
+        compatibility_tag=field_sets[0].batch_compatibility_tag.value,
     )
+    return rule_runner.request(TestResult, [JunitTestRequest.Batch("", field_sets, metadata)])